@@ -1,14 +1,14 @@
 """Setup configuration for eks-upgrade-planner."""
 
 import os
-import sys
+import re
 from setuptools import setup, find_packages
 
-# Add src to path to import version
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Read the version without importing the package and its dependencies
 try:
-    from src import __version__
-except ImportError:
+    with open(os.path.join(os.path.dirname(__file__), "src", "__init__.py"), "r", encoding="utf-8") as fh:
+        __version__ = re.search(r'^__version__ = "([^"]+)"', fh.read(), re.M).group(1)
+except (OSError, AttributeError):
     __version__ = "1.0.0"  # Fallback
 
 try:
@@ -55,6 +55,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    extras_require={"fast": ["orjson>=3.9.0"]},
     entry_points={
         "console_scripts": [
             "eks-upgrade-planner=src.cli:main",
@@ -1,17 +1,27 @@
 """EKS Upgrade Planner - Production-ready CLI tool for EKS upgrade planning."""
 
+from src.utils.lazy import lazy_getattr
+
 __version__ = "1.0.0"
 __author__ = "EKS Upgrade Planner Contributors"
 
-from src.utils import setup_logger, get_logger
-from src.scanner import EKSScanner, K8sScanner
-from src.analyzer import (
-    CompatibilityAnalyzer,
-    DeprecationAnalyzer,
-    ReleaseNotesAnalyzer,
-)
-from src.planner import UpgradePathPlanner, RiskAssessment, MigrationPlanner
-from src.reporter import MarkdownReporter, JSONExporter, HTMLReporter
+# Public names and the modules defining them. They are imported on first
+# attribute access (PEP 562) so that importing the package stays cheap.
+_LAZY_IMPORTS = {
+    "setup_logger": "src.utils.logger",
+    "get_logger": "src.utils.logger",
+    "EKSScanner": "src.scanner.eks_scanner",
+    "K8sScanner": "src.scanner.k8s_scanner",
+    "CompatibilityAnalyzer": "src.analyzer.compatibility",
+    "DeprecationAnalyzer": "src.analyzer.deprecation",
+    "ReleaseNotesAnalyzer": "src.analyzer.release_notes",
+    "UpgradePathPlanner": "src.planner.upgrade_path",
+    "RiskAssessment": "src.planner.risk_assessment",
+    "MigrationPlanner": "src.planner.migration_plan",
+    "MarkdownReporter": "src.reporter.markdown",
+    "JSONExporter": "src.reporter.json_export",
+    "HTMLReporter": "src.reporter.html",
+}
 
 __all__ = [
     "setup_logger",
@@ -28,3 +38,6 @@ __all__ = [
     "JSONExporter",
     "HTMLReporter",
 ]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
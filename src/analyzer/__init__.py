@@ -1,11 +1,19 @@
 """Analyzer package for EKS Upgrade Planner."""
 
-from src.analyzer.compatibility import CompatibilityAnalyzer
-from src.analyzer.deprecation import DeprecationAnalyzer
-from src.analyzer.release_notes import ReleaseNotesAnalyzer
+from src.utils.lazy import lazy_getattr
+
+# Analyzer classes are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "CompatibilityAnalyzer": "src.analyzer.compatibility",
+    "DeprecationAnalyzer": "src.analyzer.deprecation",
+    "ReleaseNotesAnalyzer": "src.analyzer.release_notes",
+}
 
 __all__ = [
     "CompatibilityAnalyzer",
     "DeprecationAnalyzer",
     "ReleaseNotesAnalyzer",
 ]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -1,16 +1,282 @@
 """Compatibility analysis for EKS versions, addons, and APIs."""
 
-import yaml
+import copy
+import functools
+import hashlib
+import logging
+import os
+import pickle
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, FrozenSet, List, Mapping, Optional, Tuple
 from src.utils.logger import get_logger
+from src.utils.version import parse_minor_version
 
 logger = get_logger(__name__)
 
+# Fixed addon recommendation actions, shared by every recommendation record
+ACTION_NOT_REQUIRED = "No action required"
+ACTION_MANUAL_REVIEW = "Review addon compatibility manually"
+
+# Actions that do not name a version, indexed by is_compatible
+_STATIC_ACTIONS = (ACTION_MANUAL_REVIEW, ACTION_NOT_REQUIRED)
+
+# Sentinel distinguishing "not memoized yet" from a memoized None
+_MISSING = object()
+
+# Directory holding the bundled compatibility data files
+_DATA_DIR = Path(__file__).parent.parent.parent / "data"
+
+# Directory holding pickled copies of parsed data files, unless overridden
+# by the environment variable below
+_PARSED_CACHE_DIR = Path.home() / ".eks-upgrade-planner" / "cache"
+_PARSED_CACHE_DIR_ENV = "EKS_UPGRADE_PLANNER_CACHE_DIR"
+
+# Validation results memoized per analyzer, least recently used dropped first
+_VALIDATION_CACHE_SIZE = 64
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_loader() -> Any:
+    """
+    Import PyYAML and pick its loader on first use.
+
+    Analyzers built from in-memory data never touch YAML, so the import is
+    deferred until a data file is actually read.
+
+    Returns:
+        The libyaml-backed safe loader when available, else the pure-Python one
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parsed_cache_path(path: str) -> Path:
+    """Get the pickle cache path for a YAML data file."""
+    cache_dir = os.environ.get(_PARSED_CACHE_DIR_ENV)
+    cache_dir = Path(cache_dir) if cache_dir else _PARSED_CACHE_DIR
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()[:12]
+    return cache_dir / f"{Path(path).stem}-{digest}.pkl"
+
+
+def _read_parsed_cache(cache_path: Path, stamp: Tuple[int, int]) -> Any:
+    """
+    Read parsed data from the pickle cache if it matches the source file.
+
+    Args:
+        cache_path: Pickle cache path
+        stamp: (mtime_ns, size) of the source YAML file
+
+    Returns:
+        Cached data, or _MISSING if the cache is absent, stale or unreadable
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+    except Exception:
+        return _MISSING
+
+    return data if tuple(cached_stamp) == stamp else _MISSING
+
+
+def _write_parsed_cache(cache_path: Path, stamp: Tuple[int, int], data: Any) -> None:
+    """
+    Write parsed data to the pickle cache, ignoring any failure.
+
+    Args:
+        cache_path: Pickle cache path
+        stamp: (mtime_ns, size) of the source YAML file
+        data: Parsed YAML data
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        logger.debug(f"Failed to write parsed data cache {cache_path}: {e}")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_file(path: str) -> Dict[str, Any]:
+    """
+    Load and parse a YAML data file once per process.
+
+    Parsed data is also pickled to the user cache directory (or the one
+    named by EKS_UPGRADE_PLANNER_CACHE_DIR), keyed by the file's mtime and
+    size, so later runs skip YAML parsing. The parsed data
+    is shared between all callers and must be treated as read-only.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML data
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cache_path = _parsed_cache_path(path)
+
+    data = _read_parsed_cache(cache_path, stamp)
+    if data is not _MISSING:
+        return data
+
+    import yaml
+
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_yaml_loader())
+
+    _write_parsed_cache(cache_path, stamp, data)
+    return data
+
+
+@functools.lru_cache(maxsize=128)
+def _validate_version_format(version: str) -> bool:
+    """
+    Validate EKS version format.
+
+    Args:
+        version: Version string to validate
+
+    Returns:
+        True if valid, False otherwise
+    """
+    if not version:
+        return False
+
+    # Check if version matches pattern like "1.27", "1.28", etc.
+    parsed = parse_minor_version(version)
+    return parsed is not None and parsed[0] > 0
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_version(version: str) -> Tuple[int, int]:
+    """
+    Parse version string into major and minor components.
+
+    Args:
+        version: Version string (e.g., "1.27")
+
+    Returns:
+        Tuple of (major, minor)
+
+    Raises:
+        ValueError: If version format is invalid
+    """
+    parsed = parse_minor_version(version)
+    if parsed is None or parsed[0] == 0:
+        raise ValueError(f"Invalid version format: {version}")
+
+    return parsed
+
+
+@functools.lru_cache(maxsize=256)
+def _can_upgrade_directly(
+    from_version: str, to_version: str, supported_versions: FrozenSet[str]
+) -> Tuple[bool, str]:
+    """
+    Check if direct upgrade is possible between versions.
+
+    Results are memoized; ``supported_versions`` is part of the cache key so
+    analyzers built from different compatibility matrices never share entries.
+
+    Args:
+        from_version: Current EKS version
+        to_version: Target EKS version
+        supported_versions: Frozen set of supported EKS versions
+
+    Returns:
+        Tuple of (can_upgrade, reason)
+    """
+    # Validate version formats
+    if not _validate_version_format(from_version):
+        return False, f"Invalid source version format: {from_version}"
+
+    if not _validate_version_format(to_version):
+        return False, f"Invalid target version format: {to_version}"
+
+    if from_version not in supported_versions:
+        return False, f"Unsupported source version: {from_version}"
+
+    if to_version not in supported_versions:
+        return False, f"Unsupported target version: {to_version}"
+
+    try:
+        from_major, from_minor = _parse_version(from_version)
+        to_major, to_minor = _parse_version(to_version)
+
+        # Compare versions
+        if to_major < from_major or (to_major == from_major and to_minor < from_minor):
+            return False, "Cannot downgrade EKS versions"
+
+        if to_major == from_major and to_minor == from_minor:
+            return True, "Same version (no upgrade needed)"
+
+        # EKS requires sequential minor version upgrades (can't skip versions)
+        # Check if versions are consecutive
+        if to_major == from_major:
+            # Same major version, check minor version difference
+            if to_minor - from_minor == 1:
+                return True, "Direct upgrade supported"
+            elif to_minor - from_minor > 1:
+                return False, "Cannot skip minor versions in EKS upgrade"
+            else:
+                return True, "Direct upgrade supported"
+        else:
+            # Different major versions - not typical for EKS but handle it
+            return False, "Cannot upgrade across major versions"
+
+    except ValueError as e:
+        return False, f"Invalid version format: {e}"
+
+
+# (EKS -> K8s mapping, supported versions, numerically sorted versions)
+_VersionTables = Tuple[Mapping[str, str], FrozenSet[str], Tuple[str, ...]]
+
+
+def _build_version_tables(compatibility_matrix: Dict[str, Any]) -> _VersionTables:
+    """
+    Build the read-only version lookup tables for a compatibility matrix.
+
+    Args:
+        compatibility_matrix: Loaded compatibility matrix
+
+    Returns:
+        Tuple of (EKS to K8s mapping, supported versions, sorted versions)
+    """
+    eks_k8s_versions = {
+        version: info.get("kubernetes_version", version)
+        for version, info in compatibility_matrix.get("eks_versions", {}).items()
+    }
+    sorted_versions = tuple(
+        sorted(
+            eks_k8s_versions,
+            key=lambda v: tuple(int(part) for part in v.split(".")),
+        )
+    )
+    return (
+        MappingProxyType(eks_k8s_versions),
+        frozenset(eks_k8s_versions),
+        sorted_versions,
+    )
+
+
+# (EKS version, addon name) -> (compatible versions, recommended version)
+_AddonIndex = Mapping[Tuple[str, str], Tuple[FrozenSet[str], str]]
+
 
 class CompatibilityAnalyzer:
     """Analyzer for version compatibility checks."""
 
+    # Version tables for the bundled matrix, shared by every analyzer using it
+    _shared_version_tables: Optional[Tuple[Dict[str, Any], _VersionTables]] = None
+
+    # Addon lookup index for the bundled addon data, shared the same way
+    _shared_addon_index: Optional[Tuple[Dict[str, Any], _AddonIndex]] = None
+
     def __init__(
         self,
         compatibility_matrix: Optional[Dict] = None,
@@ -29,26 +295,73 @@ class CompatibilityAnalyzer:
         self.addon_data = addon_data or self._load_addon_data()
 
         # Extract EKS to K8s version mapping from loaded data
-        self.EKS_K8S_VERSIONS = {}
-        if "eks_versions" in self.compatibility_matrix:
-            for version, info in self.compatibility_matrix["eks_versions"].items():
-                self.EKS_K8S_VERSIONS[version] = info.get("kubernetes_version", version)
+        if compatibility_matrix:
+            version_tables = _build_version_tables(self.compatibility_matrix)
+        else:
+            version_tables = self._get_shared_version_tables(self.compatibility_matrix)
+        (
+            self.EKS_K8S_VERSIONS,
+            self._supported_versions,
+            self._sorted_versions,
+        ) = version_tables
 
         # Extract addon compatibility from loaded data
         self.ADDON_COMPATIBILITY = self._build_addon_compatibility()
+        if addon_data:
+            self._addon_index = self._build_addon_index()
+        else:
+            self._addon_index = self._get_shared_addon_index()
+        self._recommendation_templates: Dict[
+            Tuple[str, str], Optional[Tuple[FrozenSet[str], str]]
+        ] = {}
+        self._validation_cache: "OrderedDict[Tuple[Any, ...], Dict[str, Any]]" = (
+            OrderedDict()
+        )
+
+    @staticmethod
+    def _get_shared_version_tables(
+        compatibility_matrix: Dict[str, Any],
+    ) -> _VersionTables:
+        """
+        Get version tables for the bundled matrix, building them once.
+
+        The bundled matrix is loaded once per process, so its identity tells
+        whether the shared tables are still current.
+
+        Args:
+            compatibility_matrix: Compatibility matrix loaded from the data file
+
+        Returns:
+            Shared version lookup tables
+        """
+        shared = CompatibilityAnalyzer._shared_version_tables
+        if shared is None or shared[0] is not compatibility_matrix:
+            shared = (compatibility_matrix, _build_version_tables(compatibility_matrix))
+            CompatibilityAnalyzer._shared_version_tables = shared
+        return shared[1]
+
+    def _get_shared_addon_index(self) -> _AddonIndex:
+        """
+        Get the addon lookup index for the bundled addon data, building it once.
+
+        Returns:
+            Shared read-only addon lookup index
+        """
+        shared = CompatibilityAnalyzer._shared_addon_index
+        if shared is None or shared[0] is not self.addon_data:
+            shared = (self.addon_data, MappingProxyType(self._build_addon_index()))
+            CompatibilityAnalyzer._shared_addon_index = shared
+        return shared[1]
 
     def _load_compatibility_matrix(self) -> Dict[str, Any]:
         """Load compatibility matrix from YAML file."""
         try:
-            # Find the data directory relative to this file
-            current_dir = Path(__file__).parent.parent.parent
-            data_file = current_dir / "data" / "compatibility_matrix.yaml"
+            data_file = _DATA_DIR / "compatibility_matrix.yaml"
 
             if data_file.exists():
-                with open(data_file, "r") as f:
-                    data = yaml.safe_load(f)
-                    logger.debug(f"Loaded compatibility matrix from {data_file}")
-                    return data
+                data = _load_yaml_file(str(data_file))
+                logger.debug(f"Loaded compatibility matrix from {data_file}")
+                return data
             else:
                 logger.warning(f"Compatibility matrix file not found: {data_file}")
                 return {}
@@ -59,15 +372,12 @@ class CompatibilityAnalyzer:
     def _load_addon_data(self) -> Dict[str, Any]:
         """Load addon version data from YAML file."""
         try:
-            # Find the data directory relative to this file
-            current_dir = Path(__file__).parent.parent.parent
-            data_file = current_dir / "data" / "addon_versions.yaml"
+            data_file = _DATA_DIR / "addon_versions.yaml"
 
             if data_file.exists():
-                with open(data_file, "r") as f:
-                    data = yaml.safe_load(f)
-                    logger.debug(f"Loaded addon data from {data_file}")
-                    return data
+                data = _load_yaml_file(str(data_file))
+                logger.debug(f"Loaded addon data from {data_file}")
+                return data
             else:
                 logger.warning(f"Addon data file not found: {data_file}")
                 return {}
@@ -99,49 +409,19 @@ class CompatibilityAnalyzer:
         logger.debug(f"Built addon compatibility for {len(compatibility)} EKS versions")
         return compatibility
 
-    def _validate_version_format(self, version: str) -> bool:
-        """
-        Validate EKS version format.
-
-        Args:
-            version: Version string to validate
-
-        Returns:
-            True if valid, False otherwise
-        """
-        if not version:
-            return False
-
-        # Check if version matches pattern like "1.27", "1.28", etc.
-        parts = version.split(".")
-        if len(parts) != 2:
-            return False
-
-        try:
-            major = int(parts[0])
-            minor = int(parts[1])
-            return major > 0 and minor >= 0
-        except ValueError:
-            return False
-
-    def _parse_version(self, version: str) -> Tuple[int, int]:
+    def _build_addon_index(self) -> Dict[Tuple[str, str], Tuple[FrozenSet[str], str]]:
         """
-        Parse version string into major and minor components.
-
-        Args:
-            version: Version string (e.g., "1.27")
+        Flatten addon compatibility into a single lookup table.
 
         Returns:
-            Tuple of (major, minor)
-
-        Raises:
-            ValueError: If version format is invalid
+            Mapping of (eks_version, addon_name) to a tuple of
+            (compatible versions, recommended version)
         """
-        if not self._validate_version_format(version):
-            raise ValueError(f"Invalid version format: {version}")
-
-        parts = version.split(".")
-        return int(parts[0]), int(parts[1])
+        return {
+            (eks_version, addon_name): (frozenset(versions), versions[-1])
+            for eks_version, addons in self.ADDON_COMPATIBILITY.items()
+            for addon_name, versions in addons.items()
+        }
 
     def get_k8s_version(self, eks_version: str) -> Optional[str]:
         """
@@ -165,7 +445,7 @@ class CompatibilityAnalyzer:
         Returns:
             True if supported, False otherwise
         """
-        return eks_version in self.EKS_K8S_VERSIONS
+        return eks_version in self._supported_versions
 
     def can_upgrade_directly(
         self, from_version: str, to_version: str
@@ -180,48 +460,39 @@ class CompatibilityAnalyzer:
         Returns:
             Tuple of (can_upgrade, reason)
         """
-        # Validate version formats
-        if not self._validate_version_format(from_version):
-            return False, f"Invalid source version format: {from_version}"
+        return _can_upgrade_directly(from_version, to_version, self._supported_versions)
 
-        if not self._validate_version_format(to_version):
-            return False, f"Invalid target version format: {to_version}"
+    def _addon_recommendation_template(
+        self, addon_name: str, eks_version: str
+    ) -> Optional[Tuple[FrozenSet[str], str]]:
+        """
+        Look up the compatibility entry for an addon, memoized per instance.
 
-        if not self.is_version_supported(from_version):
-            return False, f"Unsupported source version: {from_version}"
+        Batch runs target the same EKS version for many clusters, so the
+        lookup (and the warning for unknown addons) happens once per
+        (addon, EKS version) pair rather than once per cluster.
 
-        if not self.is_version_supported(to_version):
-            return False, f"Unsupported target version: {to_version}"
+        Args:
+            addon_name: Name of the addon
+            eks_version: Target EKS version
 
-        try:
-            from_major, from_minor = self._parse_version(from_version)
-            to_major, to_minor = self._parse_version(to_version)
-
-            # Compare versions
-            if to_major < from_major or (
-                to_major == from_major and to_minor < from_minor
-            ):
-                return False, "Cannot downgrade EKS versions"
-
-            if to_major == from_major and to_minor == from_minor:
-                return True, "Same version (no upgrade needed)"
-
-            # EKS requires sequential minor version upgrades (can't skip versions)
-            # Check if versions are consecutive
-            if to_major == from_major:
-                # Same major version, check minor version difference
-                if to_minor - from_minor == 1:
-                    return True, "Direct upgrade supported"
-                elif to_minor - from_minor > 1:
-                    return False, "Cannot skip minor versions in EKS upgrade"
-                else:
-                    return True, "Direct upgrade supported"
+        Returns:
+            Tuple of (compatible versions, recommended version) or None
+        """
+        key = (eks_version, addon_name)
+        entry = self._recommendation_templates.get(key, _MISSING)
+        if entry is not _MISSING:
+            return entry
+
+        entry = self._addon_index.get(key)
+        if entry is None and logger.isEnabledFor(logging.WARNING):
+            if eks_version not in self.ADDON_COMPATIBILITY:
+                logger.warning(f"No compatibility data for EKS {eks_version}")
             else:
-                # Different major versions - not typical for EKS but handle it
-                return False, "Cannot upgrade across major versions"
+                logger.warning(f"No compatibility data for addon {addon_name}")
 
-        except ValueError as e:
-            return False, f"Invalid version format: {e}"
+        self._recommendation_templates[key] = entry
+        return entry
 
     def check_addon_compatibility(
         self, addon_name: str, addon_version: str, eks_version: str
@@ -237,23 +508,14 @@ class CompatibilityAnalyzer:
         Returns:
             Tuple of (is_compatible, recommended_version)
         """
-        if eks_version not in self.ADDON_COMPATIBILITY:
-            logger.warning(f"No compatibility data for EKS {eks_version}")
+        entry = self._addon_recommendation_template(addon_name, eks_version)
+        if entry is None:
             return False, None
 
-        if addon_name not in self.ADDON_COMPATIBILITY[eks_version]:
-            logger.warning(f"No compatibility data for addon {addon_name}")
-            return False, None
-
-        compatible_versions = self.ADDON_COMPATIBILITY[eks_version][addon_name]
-
-        # Check if current version is in compatible list
-        is_compatible = any(addon_version in v for v in compatible_versions)
+        compatible_versions, recommended = entry
 
-        # Recommend latest version
-        recommended = compatible_versions[-1] if compatible_versions else None
-
-        return is_compatible, recommended
+        # Addon versions are fully qualified, so only exact matches count
+        return addon_version in compatible_versions, recommended
 
     def get_addon_recommendations(
         self, current_addons: List[Dict[str, Any]], target_eks_version: str
@@ -268,35 +530,87 @@ class CompatibilityAnalyzer:
         Returns:
             List of addon recommendations
         """
-        recommendations = []
+        return [
+            self._build_addon_recommendation(addon, target_eks_version)
+            for addon in current_addons
+        ]
 
-        for addon in current_addons:
-            addon_name = addon.get("name")
-            addon_version = addon.get("version", "")
+    def _build_addon_recommendation(
+        self, addon: Dict[str, Any], target_eks_version: str
+    ) -> Dict[str, Any]:
+        """
+        Build the recommendation record for a single addon.
 
-            is_compatible, recommended = self.check_addon_compatibility(
-                addon_name, addon_version, target_eks_version
-            )
+        Args:
+            addon: Current addon information
+            target_eks_version: Target EKS version
 
-            recommendation = {
-                "addon_name": addon_name,
-                "current_version": addon_version,
-                "target_eks_version": target_eks_version,
-                "is_compatible": is_compatible,
-                "recommended_version": recommended,
-                "action_required": not is_compatible,
-            }
-
-            if not is_compatible and recommended:
-                recommendation["action"] = f"Upgrade to {recommended}"
-            elif is_compatible:
-                recommendation["action"] = "No action required"
-            else:
-                recommendation["action"] = "Review addon compatibility manually"
+        Returns:
+            Addon recommendation
+        """
+        addon_name = addon.get("name")
+        addon_version = addon.get("version", "")
+
+        is_compatible, recommended = self.check_addon_compatibility(
+            addon_name, addon_version, target_eks_version
+        )
 
-            recommendations.append(recommendation)
+        if recommended and not is_compatible:
+            action = f"Upgrade to {recommended}"
+        else:
+            action = _STATIC_ACTIONS[is_compatible]
+
+        return {
+            "addon_name": addon_name,
+            "current_version": addon_version,
+            "target_eks_version": target_eks_version,
+            "is_compatible": is_compatible,
+            "recommended_version": recommended,
+            "action_required": not is_compatible,
+            "action": action,
+        }
 
-        return recommendations
+    def get_addon_recommendations_batch(
+        self, clusters_addons: List[List[Dict[str, Any]]], target_eks_version: str
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Get addon recommendations for a fleet of clusters at once.
+
+        Clusters typically run the same handful of addon versions, so each
+        distinct (addon name, version) pair is evaluated once and the result
+        is copied into every cluster that uses it.
+
+        Args:
+            clusters_addons: List of addon lists, one per cluster
+            target_eks_version: Target EKS version shared by all clusters
+
+        Returns:
+            List of addon recommendation lists, in the same order as the input
+        """
+        unique_addons = {}
+        for addons in clusters_addons:
+            for addon in addons:
+                key = (addon.get("name"), addon.get("version", ""))
+                if key not in unique_addons:
+                    unique_addons[key] = {"name": key[0], "version": key[1]}
+
+        keys = list(unique_addons)
+        recommendations = dict(
+            zip(
+                keys,
+                self.get_addon_recommendations(
+                    list(unique_addons.values()), target_eks_version
+                ),
+            )
+        )
+
+        return [
+            [
+                dict(recommendations[(addon.get("name"), addon.get("version", ""))])
+                for addon in addons
+            ]
+            for addons in clusters_addons
+        ]
 
     def validate_upgrade_path(
         self,
@@ -307,6 +621,50 @@ class CompatibilityAnalyzer:
         """
         Validate complete upgrade path including addons.
 
+        The most recent results are memoized per analyzer. The memoized copy
+        is never handed out, so callers may modify the result. When the
+        target version is invalid or unsupported, addon recommendations are
+        omitted and only the version issue is reported.
+
+        Args:
+            current_version: Current EKS version
+            target_version: Target EKS version
+            current_addons: List of current addons
+
+        Returns:
+            Validation results dictionary; blocking_issues is a read-only tuple
+        """
+        # Recommendations depend only on addon names and versions (in order)
+        addons_key = tuple(
+            (addon.get("name"), addon.get("version", "")) for addon in current_addons
+        )
+        cache_key = (current_version, target_version, addons_key)
+
+        cached = self._validation_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(
+                f"Using cached validation: {current_version} -> {target_version}"
+            )
+            self._validation_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+
+        result = self._validate_upgrade_path(
+            current_version, target_version, current_addons
+        )
+        self._validation_cache[cache_key] = copy.deepcopy(result)
+        if len(self._validation_cache) > _VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
+        return result
+
+    def _validate_upgrade_path(
+        self,
+        current_version: str,
+        target_version: str,
+        current_addons: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Run the upgrade path validation without consulting the cache.
+
         Args:
             current_version: Current EKS version
             target_version: Target EKS version
@@ -319,28 +677,24 @@ class CompatibilityAnalyzer:
 
         can_upgrade, reason = self.can_upgrade_directly(current_version, target_version)
 
-        # Get addon recommendations for target version
-        addon_recommendations = self.get_addon_recommendations(
-            current_addons, target_version
-        )
+        # Addon data is keyed by target version, so an unsupported or invalid
+        # target has nothing actionable to recommend
+        if self.is_version_supported(target_version):
+            addon_recommendations = self.get_addon_recommendations(
+                current_addons, target_version
+            )
+        else:
+            addon_recommendations = []
 
         # Check if any addons require action
         addons_need_upgrade = any(
             rec["action_required"] for rec in addon_recommendations
         )
 
-        result = {
-            "current_version": current_version,
-            "target_version": target_version,
-            "can_upgrade": can_upgrade,
-            "reason": reason,
-            "addons_compatible": not addons_need_upgrade,
-            "addon_recommendations": addon_recommendations,
-            "blocking_issues": [],
-        }
+        blocking_issues = []
 
         if not can_upgrade:
-            result["blocking_issues"].append(
+            blocking_issues.append(
                 {
                     "type": "version_incompatibility",
                     "message": reason,
@@ -348,7 +702,7 @@ class CompatibilityAnalyzer:
             )
 
         if addons_need_upgrade:
-            result["blocking_issues"].append(
+            blocking_issues.append(
                 {
                     "type": "addon_compatibility",
                     "message": "Some addons require updates before upgrade",
@@ -358,10 +712,16 @@ class CompatibilityAnalyzer:
                 }
             )
 
-        logger.info(
-            f"Validation complete: {len(result['blocking_issues'])} issues found"
-        )
-        return result
+        logger.info(f"Validation complete: {len(blocking_issues)} issues found")
+        return {
+            "current_version": current_version,
+            "target_version": target_version,
+            "can_upgrade": can_upgrade,
+            "reason": reason,
+            "addons_compatible": not addons_need_upgrade,
+            "addon_recommendations": addon_recommendations,
+            "blocking_issues": tuple(blocking_issues),
+        }
 
     def get_supported_versions(self) -> List[str]:
         """
@@ -370,4 +730,4 @@ class CompatibilityAnalyzer:
         Returns:
             List of supported version strings
         """
-        return sorted(self.EKS_K8S_VERSIONS.keys(), key=lambda x: float(x))
+        return list(self._sorted_versions)
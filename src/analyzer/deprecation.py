@@ -1,10 +1,156 @@
 """API deprecation detection and analysis."""
 
-from typing import Dict, Any, List, Optional
+import functools
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from src.utils.logger import get_logger
+from src.utils.version import parse_version
 
 logger = get_logger(__name__)
 
+# (severity, action_required, message template) for a deprecated API,
+# keyed by (is_removed, target version given)
+_SEVERITY_TEMPLATES = {
+    (True, True): (
+        "CRITICAL",
+        True,
+        "API {api_version} is removed in Kubernetes {target_k8s_version}. "
+        "Must migrate to {replacement}",
+    ),
+    (False, True): (
+        "WARNING",
+        True,
+        "API {api_version} is deprecated and will be removed in "
+        "Kubernetes {removed_in}. "
+        "Plan migration to {replacement}",
+    ),
+    (False, False): ("WARNING", False, "API {api_version} is deprecated"),
+}
+
+
+def _freeze_deprecations(
+    deprecations: Dict[str, Dict[str, Any]],
+) -> Dict[str, Mapping[str, Any]]:
+    """
+    Make API deprecation entries read-only so they can be shared safely.
+
+    Args:
+        deprecations: API deprecation mapping
+
+    Returns:
+        Mapping of API version to a read-only view of its entry, with the
+        affected resources stored as a tuple
+    """
+    return {
+        api_version: MappingProxyType(
+            {**info, "resources": tuple(info.get("resources", ()))}
+        )
+        for api_version, info in deprecations.items()
+    }
+
+
+def _index_by_removed_version(
+    deprecations: Mapping[str, Mapping[str, Any]],
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Group API deprecation entries by their removed_in version.
+
+    Args:
+        deprecations: API deprecation mapping
+
+    Returns:
+        Mapping of removed_in version to entries including their api_version
+    """
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for api_version, info in deprecations.items():
+        index.setdefault(info.get("removed_in"), []).append(
+            {"api_version": api_version, **info}
+        )
+    return index
+
+
+def _plain_info(info: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Copy read-only deprecation information into a plain dict.
+
+    Args:
+        info: Deprecation information mapping
+
+    Returns:
+        Dict copy with the affected resources as a list
+    """
+    return {**info, "resources": list(info["resources"])}
+
+
+def _with_outcome(
+    resource_fields: Dict[str, Any], outcome: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Combine resource identification fields with a shared analysis outcome.
+
+    Outcomes are memoized and shared, so the deprecation information they
+    carry is copied into a plain, JSON serializable dict for each result.
+
+    Args:
+        resource_fields: Resource identification fields
+        outcome: Analysis outcome for the resource's API version
+
+    Returns:
+        Analysis result dictionary
+    """
+    result = {**resource_fields, **outcome}
+
+    deprecation_info = outcome.get("deprecation_info")
+    if deprecation_info is not None:
+        result["deprecation_info"] = _plain_info(deprecation_info)
+
+    return result
+
+
+@functools.lru_cache(maxsize=64)
+def _build_migration_guide(
+    api_version: str,
+    deprecated_in: str,
+    removed_in: str,
+    replacement: str,
+    resources: Tuple[str, ...],
+    migration_notes: str,
+) -> str:
+    """
+    Render the migration guide text for a deprecated API.
+
+    Args:
+        api_version: Deprecated API version
+        deprecated_in: Kubernetes version the API was deprecated in
+        removed_in: Kubernetes version the API is removed in
+        replacement: Replacement API version
+        resources: Affected resource kinds
+        migration_notes: Migration notes
+
+    Returns:
+        Migration guide text
+    """
+    guide = f"""
+Migration Guide for {api_version}
+{'=' * 50}
+
+Deprecated in: Kubernetes {deprecated_in}
+Removed in: Kubernetes {removed_in}
+Replacement: {replacement}
+
+Affected Resources:
+{', '.join(resources)}
+
+Migration Notes:
+{migration_notes}
+
+Action Required:
+1. Update apiVersion field to {replacement}
+2. Review and test the updated manifests
+3. Apply changes before upgrading to {removed_in}
+"""
+    return guide.strip()
+
 
 class DeprecationAnalyzer:
     """Analyzer for Kubernetes API deprecations."""
@@ -113,10 +259,23 @@ class DeprecationAnalyzer:
             "migration_notes": "Update apiVersion to storage.k8s.io/v1.",
         },
     }
+    API_DEPRECATIONS = _freeze_deprecations(API_DEPRECATIONS)
+
+    # (read-only deprecation info, parsed removal version) per API, so the
+    # hot paths get everything they need from a single lookup
+    _API_RECORDS = {
+        api_version: (info, parse_version(info.get("removed_in", "999.0")))
+        for api_version, info in API_DEPRECATIONS.items()
+    }
+
+    # Deprecation entries grouped by the version that removes them
+    _BY_REMOVED_VERSION = _index_by_removed_version(API_DEPRECATIONS)
 
     def __init__(self):
         """Initialize deprecation analyzer."""
-        pass
+        # Per-API analysis outcomes (and their messages), grouped by target
+        # version so hot loops look up outcomes by the api_version string alone
+        self._outcomes: Dict[Optional[str], Dict[str, Dict[str, Any]]] = {}
 
     def is_api_deprecated(self, api_version: str) -> bool:
         """
@@ -141,19 +300,17 @@ class DeprecationAnalyzer:
         Returns:
             True if removed, False otherwise
         """
-        if api_version not in self.API_DEPRECATIONS:
+        record = self._API_RECORDS.get(api_version)
+        if record is None:
             return False
 
-        deprecation_info = self.API_DEPRECATIONS[api_version]
-        removed_in = deprecation_info.get("removed_in", "999.0")
-
         try:
-            return float(k8s_version) >= float(removed_in)
+            return parse_version(k8s_version) >= record[1]
         except ValueError:
             logger.warning(f"Invalid version format: {k8s_version}")
             return False
 
-    def get_deprecation_info(self, api_version: str) -> Optional[Dict[str, Any]]:
+    def get_deprecation_info(self, api_version: str) -> Optional[Mapping[str, Any]]:
         """
         Get deprecation information for an API version.
 
@@ -161,7 +318,7 @@ class DeprecationAnalyzer:
             api_version: API version to look up
 
         Returns:
-            Deprecation information dictionary or None
+            Read-only deprecation information mapping or None
         """
         return self.API_DEPRECATIONS.get(api_version)
 
@@ -186,48 +343,111 @@ class DeprecationAnalyzer:
         Returns:
             Analysis result dictionary
         """
-        result = {
-            "resource_name": resource_name,
-            "resource_kind": resource_kind,
-            "api_version": api_version,
-            "namespace": namespace,
-            "is_deprecated": False,
-            "is_removed": False,
-            "severity": "INFO",
-            "action_required": False,
-        }
+        return _with_outcome(
+            {
+                "resource_name": resource_name,
+                "resource_kind": resource_kind,
+                "api_version": api_version,
+                "namespace": namespace,
+            },
+            self._get_outcome(api_version, target_k8s_version),
+        )
 
-        if self.is_api_deprecated(api_version):
-            deprecation_info = self.get_deprecation_info(api_version)
-            result["is_deprecated"] = True
-            result["deprecation_info"] = deprecation_info
-
-            if target_k8s_version:
-                is_removed = self.is_api_removed(api_version, target_k8s_version)
-                result["is_removed"] = is_removed
-
-                if is_removed:
-                    result["severity"] = "CRITICAL"
-                    result["action_required"] = True
-                    result["message"] = (
-                        f"API {api_version} is removed in Kubernetes {target_k8s_version}. "
-                        f"Must migrate to {deprecation_info['replacement']}"
-                    )
-                else:
-                    result["severity"] = "WARNING"
-                    result["action_required"] = True
-                    result["message"] = (
-                        f"API {api_version} is deprecated and will be removed in "
-                        f"Kubernetes {deprecation_info['removed_in']}. "
-                        f"Plan migration to {deprecation_info['replacement']}"
-                    )
-            else:
-                result["severity"] = "WARNING"
-                result["message"] = f"API {api_version} is deprecated"
-        else:
-            result["message"] = f"API {api_version} is current"
+    def _get_outcome(
+        self, api_version: str, target_k8s_version: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Get the memoized analysis outcome for an API version and target.
+
+        Args:
+            api_version: Resource API version
+            target_k8s_version: Target Kubernetes version
+
+        Returns:
+            Analysis fields following the resource identification fields
+        """
+        outcomes = self._outcomes.setdefault(target_k8s_version, {})
+        outcome = outcomes.get(api_version)
+        if outcome is None:
+            outcome = self._analyze_api(
+                api_version,
+                target_k8s_version,
+                self._parse_target_version(target_k8s_version),
+            )
+            outcomes[api_version] = outcome
+        return outcome
+
+    def _parse_target_version(
+        self, target_k8s_version: Optional[str]
+    ) -> Optional[Tuple[int, ...]]:
+        """
+        Parse the target Kubernetes version for removal checks.
 
-        return result
+        Args:
+            target_k8s_version: Target Kubernetes version
+
+        Returns:
+            Parsed version tuple, or None if missing or invalid
+        """
+        if not target_k8s_version:
+            return None
+
+        try:
+            return parse_version(target_k8s_version)
+        except ValueError:
+            logger.warning(f"Invalid version format: {target_k8s_version}")
+            return None
+
+    def _analyze_api(
+        self,
+        api_version: str,
+        target_k8s_version: Optional[str],
+        target_version: Optional[Tuple[int, ...]],
+    ) -> Dict[str, Any]:
+        """
+        Analyze an API version against a pre-parsed target version.
+
+        The outcome does not depend on the resource itself, so it can be
+        shared by every resource using the same API version.
+
+        Args:
+            api_version: Resource API version
+            target_k8s_version: Target Kubernetes version
+            target_version: Parsed target version, or None
+
+        Returns:
+            Analysis fields following the resource identification fields
+        """
+        record = self._API_RECORDS.get(api_version)
+
+        if record is None:
+            return {
+                "is_deprecated": False,
+                "is_removed": False,
+                "severity": "INFO",
+                "action_required": False,
+                "message": f"API {api_version} is current",
+            }
+
+        deprecation_info, removed_in = record
+        is_removed = target_version is not None and target_version >= removed_in
+        severity, action_required, message = _SEVERITY_TEMPLATES[
+            (is_removed, bool(target_k8s_version))
+        ]
+
+        return {
+            "is_deprecated": True,
+            "is_removed": is_removed,
+            "severity": severity,
+            "action_required": action_required,
+            "deprecation_info": deprecation_info,
+            "message": message.format(
+                api_version=api_version,
+                target_k8s_version=target_k8s_version,
+                removed_in=deprecation_info["removed_in"],
+                replacement=deprecation_info["replacement"],
+            ),
+        }
 
     def analyze_resources(
         self, resources: List[Dict[str, Any]], target_k8s_version: Optional[str] = None
@@ -249,13 +469,26 @@ class DeprecationAnalyzer:
         removed_count = 0
         critical_resources = []
 
+        get_outcome = self._get_outcome
+        outcomes = self._outcomes.setdefault(target_k8s_version, {})
+
         for resource in resources:
-            analysis = self.analyze_resource(
-                resource_name=resource.get("name", "unknown"),
-                resource_kind=resource.get("kind", "unknown"),
-                api_version=resource.get("api_version", ""),
-                namespace=resource.get("namespace", "default"),
-                target_k8s_version=target_k8s_version,
+            get = resource.get
+            api_version = get("api_version", "")
+
+            # Resources share a handful of API versions; each is analyzed once
+            outcome = outcomes.get(api_version)
+            if outcome is None:
+                outcome = get_outcome(api_version, target_k8s_version)
+
+            analysis = _with_outcome(
+                {
+                    "resource_name": get("name", "unknown"),
+                    "resource_kind": get("kind", "unknown"),
+                    "api_version": api_version,
+                    "namespace": get("namespace", "default"),
+                },
+                outcome,
             )
 
             results.append(analysis)
@@ -313,26 +546,14 @@ class DeprecationAnalyzer:
         if not deprecation_info:
             return None
 
-        guide = f"""
-Migration Guide for {api_version}
-{'=' * 50}
-
-Deprecated in: Kubernetes {deprecation_info['deprecated_in']}
-Removed in: Kubernetes {deprecation_info['removed_in']}
-Replacement: {deprecation_info['replacement']}
-
-Affected Resources:
-{', '.join(deprecation_info['resources'])}
-
-Migration Notes:
-{deprecation_info['migration_notes']}
-
-Action Required:
-1. Update apiVersion field to {deprecation_info['replacement']}
-2. Review and test the updated manifests
-3. Apply changes before upgrading to {deprecation_info['removed_in']}
-"""
-        return guide.strip()
+        return _build_migration_guide(
+            api_version,
+            deprecation_info["deprecated_in"],
+            deprecation_info["removed_in"],
+            deprecation_info["replacement"],
+            tuple(deprecation_info["resources"]),
+            deprecation_info["migration_notes"],
+        )
 
     def get_all_deprecations_for_version(
         self, k8s_version: str
@@ -346,10 +567,7 @@ Action Required:
         Returns:
             List of deprecation information
         """
-        deprecations = []
-
-        for api_version, info in self.API_DEPRECATIONS.items():
-            if info.get("removed_in") == k8s_version:
-                deprecations.append({"api_version": api_version, **info})
-
-        return deprecations
+        return [
+            _plain_info(entry)
+            for entry in self._BY_REMOVED_VERSION.get(k8s_version, ())
+        ]
@@ -1,13 +1,55 @@
 """Release notes fetcher for EKS and addon versions."""
 
+import bisect
+import copy
 import requests
-from bs4 import BeautifulSoup
-from typing import Dict, Any, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
 from src.utils.logger import get_logger
 from src.utils.cache import Cache
+from src.utils.version import parse_version
 
 logger = get_logger(__name__)
 
+# Upper bound on concurrent release note fetches
+_MAX_FETCH_WORKERS = 8
+
+# Bound formatters for the per-item lines of summarize_changes
+_format_change_lines = (
+    "  - [{impact}] {title} (v{affects_version})\n    Action: {action}".format
+)
+_format_addon_line = "  - {} ({})".format
+
+
+def _sort_breaking_changes(
+    known_changes: Dict[str, List[Dict[str, Any]]],
+) -> Tuple[Tuple[Mapping[str, Any], ...], Tuple[Tuple[int, ...], ...]]:
+    """
+    Flatten known breaking changes into a frozen, version-sorted table.
+
+    Args:
+        known_changes: Breaking changes keyed by EKS version
+
+    Returns:
+        Tuple of (read-only changes tagged with affects_version, their
+        parsed versions)
+    """
+    rows = sorted(
+        (
+            (
+                parse_version(version),
+                MappingProxyType({**change, "affects_version": version}),
+            )
+            for version, changes in known_changes.items()
+            for change in changes
+        ),
+        key=lambda row: row[0],
+    )
+    return tuple(change for _, change in rows), tuple(version for version, _ in rows)
+
 
 class ReleaseNotesAnalyzer:
     """Analyzer for EKS and addon release notes."""
@@ -24,6 +66,77 @@ class ReleaseNotesAnalyzer:
         "kube-proxy": "https://github.com/kubernetes/kubernetes/releases",
     }
 
+    # Known breaking changes by version
+    KNOWN_BREAKING_CHANGES = {
+        "1.22": [
+            {
+                "type": "api_removal",
+                "title": "Beta API removals",
+                "description": "Several beta APIs removed including Ingress v1beta1",
+                "impact": "HIGH",
+                "action": "Update manifests to use stable API versions",
+            },
+        ],
+        "1.23": [
+            {
+                "type": "deprecation",
+                "title": "FlexVolume deprecated",
+                "description": "FlexVolume is deprecated, use CSI drivers",
+                "impact": "MEDIUM",
+                "action": "Migrate to CSI drivers",
+            },
+        ],
+        "1.24": [
+            {
+                "type": "feature_removal",
+                "title": "Dockershim removed",
+                "description": "Docker runtime support removed, use containerd",
+                "impact": "HIGH",
+                "action": "Ensure using containerd runtime",
+            },
+        ],
+        "1.25": [
+            {
+                "type": "api_removal",
+                "title": "PodSecurityPolicy removed",
+                "description": "PSP API removed, migrate to Pod Security Standards",
+                "impact": "HIGH",
+                "action": "Implement Pod Security Standards",
+            },
+            {
+                "type": "api_removal",
+                "title": "Beta API removals",
+                "description": "CronJob v1beta1, PodDisruptionBudget v1beta1 removed",
+                "impact": "HIGH",
+                "action": "Update to stable v1 APIs",
+            },
+        ],
+        "1.26": [
+            {
+                "type": "api_removal",
+                "title": "HPA v2beta2 removed",
+                "description": "HorizontalPodAutoscaler v2beta2 API removed",
+                "impact": "MEDIUM",
+                "action": "Update to autoscaling/v2",
+            },
+        ],
+        "1.27": [
+            {
+                "type": "deprecation",
+                "title": "CSI migration",
+                "description": "In-tree storage plugins being migrated to CSI",
+                "impact": "MEDIUM",
+                "action": "Review storage configuration",
+            },
+        ],
+    }
+
+    # Read-only breaking changes sorted by version, each tagged with
+    # affects_version, plus their parsed versions for bisecting a range
+    _BREAKING_CHANGES, _BREAKING_CHANGE_VERSIONS = _sort_breaking_changes(
+        KNOWN_BREAKING_CHANGES
+    )
+
     def __init__(self, cache: Optional[Cache] = None):
         """
         Initialize release notes analyzer.
@@ -32,20 +145,59 @@ class ReleaseNotesAnalyzer:
             cache: Optional cache instance
         """
         self.cache = cache or Cache()
+        self._session = self._create_session()
+        self._upgrade_notes_cache: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        Create an HTTP session that reuses connections and retries briefly.
+
+        Returns:
+            Configured requests session
+        """
+        retry = Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=retry)
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def _fetch_url(self, url: str) -> Optional[str]:
         """
         Fetch URL content with error handling.
 
+        Responses carrying an ETag are cached so later fetches can be
+        revalidated with If-None-Match instead of downloading the body again.
+
         Args:
             url: URL to fetch
 
         Returns:
             Response text or None
         """
+        # Previously seen (ETag, body) lets the server answer 304 Not Modified
+        cache_key = f"http_{url}"
+        cached = self.cache.get(cache_key)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
         try:
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=10, headers=headers)
+            if cached and response.status_code == 304:
+                logger.debug(f"Not modified: {url}")
+                return cached[1]
+
             response.raise_for_status()
+
+            etag = response.headers.get("ETag")
+            if etag:
+                self.cache.set(cache_key, (etag, response.text))
+
             return response.text
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
@@ -110,6 +262,18 @@ class ReleaseNotesAnalyzer:
         Returns:
             Release notes dictionary
         """
+        release_url = self.ADDON_RELEASE_URLS.get(addon_name)
+
+        # Unknown addons have no release source, so there is nothing to fetch
+        if release_url is None:
+            return {
+                "addon_name": addon_name,
+                "version": version,
+                "release_url": None,
+                "notes": [],
+                "breaking_changes": [],
+            }
+
         cache_key = f"addon_release_{addon_name}_{version or 'latest'}"
 
         # Check cache first
@@ -120,21 +284,16 @@ class ReleaseNotesAnalyzer:
 
         logger.info(f"Fetching release notes for addon {addon_name}")
 
+        # In production, fetch from actual release URLs
+        # This is simplified for now
         release_notes = {
             "addon_name": addon_name,
             "version": version,
-            "release_url": self.ADDON_RELEASE_URLS.get(addon_name),
-            "notes": [],
+            "release_url": release_url,
+            "notes": [f"See {release_url} for release notes"],
             "breaking_changes": [],
         }
 
-        # In production, fetch from actual release URLs
-        # This is simplified for now
-        if addon_name in self.ADDON_RELEASE_URLS:
-            release_notes["notes"].append(
-                f"See {self.ADDON_RELEASE_URLS[addon_name]} for release notes"
-            )
-
         # Cache the result
         self.cache.set_json(cache_key, release_notes)
 
@@ -151,90 +310,24 @@ class ReleaseNotesAnalyzer:
             to_version: Target EKS version
 
         Returns:
-            List of breaking changes
+            List of breaking changes (fresh copies, safe to modify)
         """
         logger.info(f"Fetching breaking changes: {from_version} -> {to_version}")
 
-        breaking_changes = []
-
-        # Known breaking changes by version
-        known_changes = {
-            "1.22": [
-                {
-                    "type": "api_removal",
-                    "title": "Beta API removals",
-                    "description": "Several beta APIs removed including Ingress v1beta1",
-                    "impact": "HIGH",
-                    "action": "Update manifests to use stable API versions",
-                },
-            ],
-            "1.23": [
-                {
-                    "type": "deprecation",
-                    "title": "FlexVolume deprecated",
-                    "description": "FlexVolume is deprecated, use CSI drivers",
-                    "impact": "MEDIUM",
-                    "action": "Migrate to CSI drivers",
-                },
-            ],
-            "1.24": [
-                {
-                    "type": "feature_removal",
-                    "title": "Dockershim removed",
-                    "description": "Docker runtime support removed, use containerd",
-                    "impact": "HIGH",
-                    "action": "Ensure using containerd runtime",
-                },
-            ],
-            "1.25": [
-                {
-                    "type": "api_removal",
-                    "title": "PodSecurityPolicy removed",
-                    "description": "PSP API removed, migrate to Pod Security Standards",
-                    "impact": "HIGH",
-                    "action": "Implement Pod Security Standards",
-                },
-                {
-                    "type": "api_removal",
-                    "title": "Beta API removals",
-                    "description": "CronJob v1beta1, PodDisruptionBudget v1beta1 removed",
-                    "impact": "HIGH",
-                    "action": "Update to stable v1 APIs",
-                },
-            ],
-            "1.26": [
-                {
-                    "type": "api_removal",
-                    "title": "HPA v2beta2 removed",
-                    "description": "HorizontalPodAutoscaler v2beta2 API removed",
-                    "impact": "MEDIUM",
-                    "action": "Update to autoscaling/v2",
-                },
-            ],
-            "1.27": [
-                {
-                    "type": "deprecation",
-                    "title": "CSI migration",
-                    "description": "In-tree storage plugins being migrated to CSI",
-                    "impact": "MEDIUM",
-                    "action": "Review storage configuration",
-                },
-            ],
-        }
-
         # Collect breaking changes for all versions in upgrade path
         try:
-            from_minor = float(from_version)
-            to_minor = float(to_version)
-
-            for version, changes in known_changes.items():
-                version_minor = float(version)
-                if from_minor < version_minor <= to_minor:
-                    for change in changes:
-                        change["affects_version"] = version
-                        breaking_changes.append(change)
+            from_tuple = parse_version(from_version)
+            to_tuple = parse_version(to_version)
         except ValueError:
             logger.warning("Invalid version format for breaking changes lookup")
+            from_tuple = to_tuple = ()
+
+        versions = self._BREAKING_CHANGE_VERSIONS
+        start = bisect.bisect_right(versions, from_tuple)
+        end = bisect.bisect_right(versions, to_tuple)
+        breaking_changes = [
+            dict(change) for change in self._BREAKING_CHANGES[start:end]
+        ]
 
         logger.info(f"Found {len(breaking_changes)} breaking changes")
         return breaking_changes
@@ -245,30 +338,70 @@ class ReleaseNotesAnalyzer:
         """
         Get comprehensive upgrade notes including version and addon changes.
 
+        Results are memoized per analyzer; repeated calls return a copy.
+
         Args:
             from_version: Current EKS version
             to_version: Target EKS version
             addons: List of current addons
 
+        Returns:
+            Comprehensive upgrade notes
+        """
+        named_addons = tuple(
+            (addon.get("name"), addon.get("version"))
+            for addon in addons
+            if addon.get("name")
+        )
+
+        # Notes depend only on the versions and the named addons (in order)
+        cache_key = (from_version, to_version, named_addons)
+        cached = self._upgrade_notes_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached upgrade notes: {from_version} -> {to_version}")
+            return copy.deepcopy(cached)
+
+        upgrade_notes = self._build_upgrade_notes(
+            from_version, to_version, named_addons
+        )
+        self._upgrade_notes_cache[cache_key] = upgrade_notes
+        return copy.deepcopy(upgrade_notes)
+
+    def _build_upgrade_notes(
+        self,
+        from_version: str,
+        to_version: str,
+        named_addons: Tuple[Tuple[str, Optional[str]], ...],
+    ) -> Dict[str, Any]:
+        """
+        Build upgrade notes without consulting the in-process memo.
+
+        Args:
+            from_version: Current EKS version
+            to_version: Target EKS version
+            named_addons: (name, version) pairs of addons that have a name
+
         Returns:
             Comprehensive upgrade notes
         """
         logger.info(f"Generating upgrade notes: {from_version} -> {to_version}")
 
-        # Get version information
-        target_version_info = self.fetch_eks_version_info(to_version)
+        # Version info and addon notes are network-bound; fetch them
+        # concurrently and compute breaking changes while they are in flight
+        max_workers = min(_MAX_FETCH_WORKERS, len(named_addons) + 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            version_future = executor.submit(self.fetch_eks_version_info, to_version)
+            addon_futures = [
+                executor.submit(self.fetch_addon_release_notes, name, version)
+                for name, version in named_addons
+            ]
 
-        # Get breaking changes
-        breaking_changes = self.get_breaking_changes(from_version, to_version)
+            # Get breaking changes
+            breaking_changes = self.get_breaking_changes(from_version, to_version)
 
-        # Get addon release notes
-        addon_notes = []
-        for addon in addons:
-            addon_name = addon.get("name")
-            addon_version = addon.get("version")
-            if addon_name:
-                notes = self.fetch_addon_release_notes(addon_name, addon_version)
-                addon_notes.append(notes)
+            # Get version information and addon release notes
+            target_version_info = version_future.result()
+            addon_notes = [future.result() for future in addon_futures]
 
         upgrade_notes = {
             "from_version": from_version,
@@ -311,11 +444,9 @@ class ReleaseNotesAnalyzer:
 
         if breaking_changes:
             summary_lines.append(f"⚠️  {len(breaking_changes)} Breaking Changes:")
-            for change in breaking_changes:
-                summary_lines.append(
-                    f"  - [{change['impact']}] {change['title']} (v{change['affects_version']})"
-                )
-                summary_lines.append(f"    Action: {change['action']}")
+            summary_lines.extend(
+                _format_change_lines(**change) for change in breaking_changes
+            )
             summary_lines.append("")
         else:
             summary_lines.append("✅ No known breaking changes")
@@ -324,10 +455,10 @@ class ReleaseNotesAnalyzer:
         addon_notes = upgrade_notes.get("addon_release_notes", [])
         if addon_notes:
             summary_lines.append(f"📦 {len(addon_notes)} Addons to Review:")
-            for addon in addon_notes:
-                summary_lines.append(
-                    f"  - {addon['addon_name']} ({addon.get('version', 'N/A')})"
-                )
+            summary_lines.extend(
+                _format_addon_line(addon["addon_name"], addon.get("version", "N/A"))
+                for addon in addon_notes
+            )
             summary_lines.append("")
 
         return "\n".join(summary_lines)
@@ -1,20 +1,22 @@
 """Main CLI interface for EKS Upgrade Planner."""
 
 import click
+import importlib
 import sys
 import os
+import threading
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Optional
-
-from src.utils import setup_logger, get_logger, AWSHelper, K8sHelper, Cache
-from src.scanner import EKSScanner, K8sScanner
-from src.analyzer import (
-    CompatibilityAnalyzer,
-    DeprecationAnalyzer,
-    ReleaseNotesAnalyzer,
-)
-from src.planner import UpgradePathPlanner, RiskAssessment, MigrationPlanner
-from src.reporter import MarkdownReporter, JSONExporter, HTMLReporter
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+from src.utils.logger import setup_logger
+
+# Scanners, analyzers, planners and reporters pull in boto3, botocore and the
+# kubernetes client, so commands import them locally. This keeps startup
+# fast for --help, version and check_addon.
+if TYPE_CHECKING:
+    from src.utils.aws_helper import AWSHelper
+    from src.utils.cache import Cache
 
 logger = None
 
@@ -33,6 +35,226 @@ SYMBOLS = {
     "note": "📝" if USE_EMOJI else "[PLAN]",
 }
 
+# Message prefixes: each symbol followed by a space
+OK, ERR, WARN, SCAN, CHART, PLUG, BOLT, DOC, NOTE = (
+    f"{SYMBOLS[key]} "
+    for key in (
+        "success",
+        "error",
+        "warning",
+        "search",
+        "chart",
+        "plug",
+        "bolt",
+        "doc",
+        "note",
+    )
+)
+
+# How long an EKS scan is reused across invocations
+SCAN_CACHE_TTL_SECONDS = 60
+
+# Write buffer for report files, so streamed sections reach the disk in a
+# few large writes
+REPORT_WRITE_BUFFER = 1 << 20
+
+# Reporter class for each report format, imported only when used
+REPORTERS = {
+    "markdown": "MarkdownReporter",
+    "json": "JSONExporter",
+    "html": "HTMLReporter",
+}
+
+
+class StatusBuffer:
+    """Collect status lines and write them to stdout in one call."""
+
+    def __init__(self):
+        """Initialize an empty status buffer."""
+        self.lines = []
+
+    def line(self, message: str = "") -> None:
+        """
+        Add a status line.
+
+        Args:
+            message: Line to write when the buffer is flushed
+        """
+        self.lines.append(message)
+
+    def __enter__(self) -> "StatusBuffer":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Lines collected before a failure are still written
+        if self.lines:
+            click.echo("\n".join(self.lines))
+
+
+def _run_in_background(func: Callable[[], Any]) -> Future:
+    """
+    Run a function in a daemon thread.
+
+    Unlike executor workers, the thread is not joined at interpreter exit,
+    so an interrupted command exits without waiting for it to finish.
+
+    Args:
+        func: Function to run
+
+    Returns:
+        Future holding the function's result or exception
+    """
+    future: Future = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _exit_interrupted() -> None:
+    """Report a Ctrl-C and exit with the conventional status 130."""
+    click.echo(f"\n{WARN}Interrupted", err=True)
+    sys.exit(130)
+
+
+def _scan_kubernetes() -> Dict[str, Any]:
+    """
+    Scan Kubernetes resources using the current kubeconfig.
+
+    Runs in a worker thread alongside the EKS scan, so the helper is built
+    here and a missing kubeconfig surfaces when the result is collected.
+
+    Returns:
+        Kubernetes scan results
+    """
+    from src.utils.k8s_helper import K8sHelper
+    from src.scanner.k8s_scanner import K8sScanner
+
+    k8s_helper = K8sHelper()
+    k8s_scanner = K8sScanner(k8s_helper)
+    return k8s_scanner.scan_cluster()
+
+
+def _get_aws_helper(
+    ctx: click.Context, region: Optional[str], profile: Optional[str]
+) -> Optional["AWSHelper"]:
+    """
+    Get an AWS helper with validated credentials, shared via the context.
+
+    Helpers are kept in ``ctx.obj`` per (region, profile), so commands run
+    against the same context reuse one boto3 session, its clients and
+    connection pools, and validate credentials only once.
+
+    Args:
+        ctx: Click context
+        region: AWS region
+        profile: AWS profile name
+
+    Returns:
+        AWS helper, or None if the credentials could not be validated
+    """
+    from src.utils.aws_helper import AWSHelper
+
+    helpers = ctx.obj.setdefault("aws_helpers", {})
+    aws_helper = helpers.get((region, profile))
+
+    if aws_helper is None:
+        aws_helper = AWSHelper(region=region, profile=profile)
+        if not aws_helper.validate_credentials():
+            return None
+        helpers[(region, profile)] = aws_helper
+
+    return aws_helper
+
+
+def _get_cache(ctx: click.Context) -> "Cache":
+    """
+    Get the on-disk cache shared by the commands of this context.
+
+    Args:
+        ctx: Click context
+
+    Returns:
+        Cache instance
+    """
+    from src.utils.cache import Cache
+
+    cache = ctx.obj.get("cache")
+    if cache is None:
+        cache = ctx.obj["cache"] = Cache()
+    return cache
+
+
+def _get_scan_cache(ctx: click.Context) -> "Cache":
+    """
+    Get the short-lived on-disk cache for cluster scans of this context.
+
+    Args:
+        ctx: Click context
+
+    Returns:
+        Cache instance whose entries expire after SCAN_CACHE_TTL_SECONDS
+    """
+    from src.utils.cache import Cache
+
+    cache = ctx.obj.get("scan_cache")
+    if cache is None:
+        cache = ctx.obj["scan_cache"] = Cache(ttl_hours=SCAN_CACHE_TTL_SECONDS / 3600)
+    return cache
+
+
+def _scan_eks_cluster(
+    ctx: click.Context, aws_helper: "AWSHelper", cluster: str
+) -> Dict[str, Any]:
+    """
+    Scan an EKS cluster, reusing recent results.
+
+    Results are kept in ``ctx.obj`` for the rest of the invocation and in
+    the on-disk cache for SCAN_CACHE_TTL_SECONDS, so back-to-back commands
+    do not repeat the DescribeCluster/Nodegroup/Addon calls. Entries are
+    keyed by the account and region the credentials resolve to, so a scan
+    is never reused for a same-named cluster elsewhere.
+
+    Args:
+        ctx: Click context
+        aws_helper: AWS helper with validated credentials
+        cluster: EKS cluster name
+
+    Returns:
+        Complete cluster information
+    """
+    from src.scanner.eks_scanner import EKSScanner
+
+    account_id = aws_helper.get_account_id()
+    region_name = aws_helper.session.region_name
+
+    scans = ctx.obj.setdefault("cluster_scans", {})
+    cache_key = f"eks_scan_{account_id}_{region_name}_{cluster}"
+
+    cluster_info = scans.get(cache_key)
+    if cluster_info is not None:
+        return cluster_info
+
+    # Without a known account the scan cannot be told apart on disk
+    scan_cache = _get_scan_cache(ctx) if account_id else None
+    cluster_info = scan_cache.get(cache_key) if scan_cache is not None else None
+    if cluster_info is None:
+        cluster_info = EKSScanner(aws_helper).scan_cluster(cluster)
+        if scan_cache is not None:
+            scan_cache.set(cache_key, cluster_info)
+    else:
+        logger.info(f"Using cached scan of cluster: {cluster}")
+
+    scans[cache_key] = cluster_info
+    return cluster_info
+
 
 @click.group()
 @click.option("--debug", is_flag=True, help="Enable debug logging")
@@ -59,55 +281,52 @@ def scan(ctx, cluster, region, profile):
     try:
         logger.info(f"Starting scan of cluster: {cluster}")
 
-        # Initialize AWS helper
-        aws_helper = AWSHelper(region=region, profile=profile)
-
-        # Validate credentials
-        if not aws_helper.validate_credentials():
-            click.echo(
-                f"{SYMBOLS['error']} Failed to validate AWS credentials", err=True
-            )
+        # Initialize AWS helper and validate credentials
+        aws_helper = _get_aws_helper(ctx, region, profile)
+        if aws_helper is None:
+            click.echo(f"{ERR}Failed to validate AWS credentials", err=True)
             sys.exit(1)
 
-        # Initialize EKS scanner
-        eks_scanner = EKSScanner(aws_helper)
+        # Scan Kubernetes resources (if kubeconfig is available) while the
+        # EKS APIs are being queried
+        k8s_future = _run_in_background(_scan_kubernetes)
 
         # Scan cluster
-        click.echo(f"{SYMBOLS['search']} Scanning EKS cluster: {cluster}")
-        cluster_info = eks_scanner.scan_cluster(cluster)
+        click.echo(f"{SCAN}Scanning EKS cluster: {cluster}")
+        cluster_info = _scan_eks_cluster(ctx, aws_helper, cluster)
 
         # Display summary
         summary = cluster_info["summary"]
-        click.echo(f"\n{SYMBOLS['success']} Scan complete!")
-        click.echo(f"  Cluster: {summary['cluster_name']}")
-        click.echo(f"  Version: {summary['cluster_version']}")
-        click.echo(f"  Node Groups: {summary['node_group_count']}")
-        click.echo(f"  Addons: {summary['addon_count']}")
-        click.echo(f"  Status: {summary['status']}")
-
-        # Try to scan Kubernetes resources if kubeconfig is available
+        with StatusBuffer() as buf:
+            buf.line(f"\n{OK}Scan complete!")
+            buf.line(f"  Cluster: {summary['cluster_name']}")
+            buf.line(f"  Version: {summary['cluster_version']}")
+            buf.line(f"  Node Groups: {summary['node_group_count']}")
+            buf.line(f"  Addons: {summary['addon_count']}")
+            buf.line(f"  Status: {summary['status']}")
+
         try:
-            click.echo(f"\n{SYMBOLS['search']} Scanning Kubernetes resources...")
-            k8s_helper = K8sHelper()
-            k8s_scanner = K8sScanner(k8s_helper)
-            k8s_results = k8s_scanner.scan_cluster()
+            click.echo(f"\n{SCAN}Scanning Kubernetes resources...")
+            k8s_results = k8s_future.result()
 
-            click.echo(f"  Deployments: {k8s_results['summary']['total_deployments']}")
-            click.echo(
-                f"  StatefulSets: {k8s_results['summary']['total_statefulsets']}"
-            )
-            click.echo(f"  DaemonSets: {k8s_results['summary']['total_daemonsets']}")
-            click.echo(f"  CRDs: {k8s_results['summary']['total_crds']}")
+            k8s_summary = k8s_results["summary"]
+            with StatusBuffer() as buf:
+                buf.line(f"  Deployments: {k8s_summary['total_deployments']}")
+                buf.line(f"  StatefulSets: {k8s_summary['total_statefulsets']}")
+                buf.line(f"  DaemonSets: {k8s_summary['total_daemonsets']}")
+                buf.line(f"  CRDs: {k8s_summary['total_crds']}")
 
         except Exception as e:
             logger.warning(f"Could not scan Kubernetes resources: {e}")
             click.echo(
-                f"\n{SYMBOLS['warning']}  Could not scan Kubernetes resources (kubeconfig may not be configured)"
+                f"\n{WARN} Could not scan Kubernetes resources (kubeconfig may not be configured)"
             )
 
+    except KeyboardInterrupt:
+        _exit_interrupted()
     except Exception as e:
         logger.error(f"Scan failed: {e}", exc_info=ctx.obj.get("debug"))
-        click.echo(f"{SYMBOLS['error']} Error: {e}", err=True)
+        click.echo(f"{ERR}Error: {e}", err=True)
         sys.exit(1)
 
 
@@ -119,76 +338,77 @@ def scan(ctx, cluster, region, profile):
 @click.pass_context
 def analyze(ctx, cluster, region, profile, target_version):
     """Analyze cluster compatibility and detect issues."""
+    from src.analyzer.compatibility import CompatibilityAnalyzer
+    from src.analyzer.deprecation import DeprecationAnalyzer
+    from src.analyzer.release_notes import ReleaseNotesAnalyzer
+
     try:
         logger.info(f"Analyzing cluster: {cluster} for upgrade to {target_version}")
 
         # Initialize helpers
-        aws_helper = AWSHelper(region=region, profile=profile)
-        if not aws_helper.validate_credentials():
-            click.echo(
-                f"{SYMBOLS['error']} Failed to validate AWS credentials", err=True
-            )
+        aws_helper = _get_aws_helper(ctx, region, profile)
+        if aws_helper is None:
+            click.echo(f"{ERR}Failed to validate AWS credentials", err=True)
             sys.exit(1)
 
         # Scan cluster
-        click.echo(f"{SYMBOLS['search']} Scanning cluster...")
-        eks_scanner = EKSScanner(aws_helper)
-        cluster_info = eks_scanner.scan_cluster(cluster)
+        click.echo(f"{SCAN}Scanning cluster...")
+        cluster_info = _scan_eks_cluster(ctx, aws_helper, cluster)
 
         current_version = cluster_info["cluster"]["version"]
-        click.echo(f"  Current version: {current_version}")
-        click.echo(f"  Target version: {target_version}")
+        with StatusBuffer() as buf:
+            buf.line(f"  Current version: {current_version}")
+            buf.line(f"  Target version: {target_version}")
 
         # Initialize analyzers
         compat_analyzer = CompatibilityAnalyzer()
         deprecation_analyzer = DeprecationAnalyzer()
-        release_notes_analyzer = ReleaseNotesAnalyzer()
+        release_notes_analyzer = ReleaseNotesAnalyzer(_get_cache(ctx))
 
-        # Check version compatibility
-        click.echo(f"\n{SYMBOLS['chart']} Analyzing compatibility...")
-        can_upgrade, reason = compat_analyzer.can_upgrade_directly(
-            current_version, target_version
+        # Check version and addon compatibility in one pass
+        click.echo(f"\n{CHART}Analyzing compatibility...")
+        validation = compat_analyzer.validate_upgrade_path(
+            current_version, target_version, cluster_info["addons"]
         )
 
-        if can_upgrade:
-            click.echo(f"  {SYMBOLS['success']} {reason}")
+        if validation["can_upgrade"]:
+            click.echo(f"  {OK}{validation['reason']}")
         else:
-            click.echo(f"  {SYMBOLS['error']} {reason}")
+            click.echo(f"  {ERR}{validation['reason']}")
 
-        # Check addon compatibility
-        click.echo(f"\n{SYMBOLS['plug']} Analyzing addons...")
-        addon_recs = compat_analyzer.get_addon_recommendations(
-            cluster_info["addons"], target_version
-        )
+        click.echo(f"\n{PLUG}Analyzing addons...")
+        addon_recs = validation["addon_recommendations"]
 
         incompatible = [a for a in addon_recs if a["action_required"]]
-        if incompatible:
-            click.echo(
-                f"  {SYMBOLS['warning']}  {len(incompatible)} addons need updates:"
-            )
-            for addon in incompatible:
-                click.echo(f"     - {addon['addon_name']}: {addon['action']}")
-        else:
-            click.echo(f"  {SYMBOLS['success']} All addons compatible")
+        with StatusBuffer() as buf:
+            if not compat_analyzer.is_version_supported(target_version):
+                buf.line(f"  {WARN} No addon compatibility data for {target_version}")
+            elif incompatible:
+                buf.line(f"  {WARN} {len(incompatible)} addons need updates:")
+                for addon in incompatible:
+                    buf.line(f"     - {addon['addon_name']}: {addon['action']}")
+            else:
+                buf.line(f"  {OK}All addons compatible")
 
         # Get breaking changes
-        click.echo(f"\n{SYMBOLS['bolt']} Checking for breaking changes...")
+        click.echo(f"\n{BOLT}Checking for breaking changes...")
         breaking_changes = release_notes_analyzer.get_breaking_changes(
             current_version, target_version
         )
 
-        if breaking_changes:
-            click.echo(
-                f"  {SYMBOLS['warning']}  {len(breaking_changes)} breaking changes found:"
-            )
-            for change in breaking_changes[:5]:
-                click.echo(f"     - [{change['impact']}] {change['title']}")
-        else:
-            click.echo(f"  {SYMBOLS['success']} No breaking changes identified")
+        with StatusBuffer() as buf:
+            if breaking_changes:
+                buf.line(f"  {WARN} {len(breaking_changes)} breaking changes found:")
+                for change in breaking_changes[:5]:
+                    buf.line(f"     - [{change['impact']}] {change['title']}")
+            else:
+                buf.line(f"  {OK}No breaking changes identified")
 
+    except KeyboardInterrupt:
+        _exit_interrupted()
     except Exception as e:
         logger.error(f"Analysis failed: {e}", exc_info=ctx.obj.get("debug"))
-        click.echo(f"{SYMBOLS['error']} Error: {e}", err=True)
+        click.echo(f"{ERR}Error: {e}", err=True)
         sys.exit(1)
 
 
@@ -203,74 +423,75 @@ def analyze(ctx, cluster, region, profile, target_version):
     default="markdown",
     help="Output format",
 )
-@click.option("--output", type=click.Path(), help="Output file path")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Output file path",
+)
 @click.pass_context
 def plan(ctx, cluster, region, profile, target_version, format, output):
     """Generate comprehensive upgrade plan."""
+    from src.analyzer.compatibility import CompatibilityAnalyzer
+    from src.analyzer.deprecation import DeprecationAnalyzer
+    from src.analyzer.release_notes import ReleaseNotesAnalyzer
+    from src.planner import UpgradePathPlanner, RiskAssessment, MigrationPlanner
+
     try:
         logger.info(f"Generating upgrade plan for {cluster} to {target_version}")
 
         # Initialize helpers
-        aws_helper = AWSHelper(region=region, profile=profile)
-        if not aws_helper.validate_credentials():
-            click.echo(
-                f"{SYMBOLS['error']} Failed to validate AWS credentials", err=True
-            )
+        aws_helper = _get_aws_helper(ctx, region, profile)
+        if aws_helper is None:
+            click.echo(f"{ERR}Failed to validate AWS credentials", err=True)
             sys.exit(1)
 
-        cache = Cache()
-
-        # Scan cluster
-        click.echo(f"{SYMBOLS['search']} Scanning cluster...")
-        eks_scanner = EKSScanner(aws_helper)
-        cluster_info = eks_scanner.scan_cluster(cluster)
-
-        # Scan Kubernetes resources
-        k8s_results = {}
-        try:
-            k8s_helper = K8sHelper()
-            k8s_scanner = K8sScanner(k8s_helper)
-            k8s_results = k8s_scanner.scan_cluster()
-        except Exception as e:
-            logger.warning(f"Could not scan Kubernetes resources: {e}")
+        # Scan cluster and Kubernetes resources concurrently. The Kubernetes
+        # scan keeps running in the background through upgrade path planning,
+        # which does not depend on it.
+        click.echo(f"{SCAN}Scanning cluster...")
+        k8s_future = _run_in_background(_scan_kubernetes)
+        cluster_info = _scan_eks_cluster(ctx, aws_helper, cluster)
 
         current_version = cluster_info["cluster"]["version"]
 
-        # Initialize analyzers
-        click.echo(f"{SYMBOLS['chart']} Analyzing compatibility and risks...")
-        compat_analyzer = CompatibilityAnalyzer()
-        deprecation_analyzer = DeprecationAnalyzer()
-        release_notes_analyzer = ReleaseNotesAnalyzer(cache)
-
         # Validate upgrade path
+        compat_analyzer = CompatibilityAnalyzer()
+        upgrade_path_planner = UpgradePathPlanner(compat_analyzer)
         validation = compat_analyzer.validate_upgrade_path(
             current_version, target_version, cluster_info["addons"]
         )
 
-        # Get addon recommendations
-        addon_recs = compat_analyzer.get_addon_recommendations(
-            cluster_info["addons"], target_version
+        # Generate upgrade path
+        upgrade_path = upgrade_path_planner.generate_upgrade_path(
+            current_version, target_version
         )
 
+        # Stop before any analysis if the target is not a supported version
+        # or cannot be reached from the current one (e.g. a downgrade)
+        if not compat_analyzer.is_version_supported(target_version) or (
+            len(upgrade_path) == 1 and current_version != target_version
+        ):
+            click.echo(f"{ERR}Cannot plan upgrade: {validation['reason']}", err=True)
+            sys.exit(2)
+
+        # Initialize analyzers
+        click.echo(f"{CHART}Analyzing compatibility and risks...")
+        deprecation_analyzer = DeprecationAnalyzer()
+        release_notes_analyzer = ReleaseNotesAnalyzer(_get_cache(ctx))
+
+        # Addon recommendations come with the validation
+        addon_recs = validation["addon_recommendations"]
+
         # Get breaking changes
         breaking_changes = release_notes_analyzer.get_breaking_changes(
             current_version, target_version
         )
 
-        # Analyze deprecated APIs
-        deprecated_apis = k8s_results.get("deprecated_apis", {})
-
         # Initialize planners
-        click.echo(f"{SYMBOLS['note']} Generating upgrade plan...")
-        upgrade_path_planner = UpgradePathPlanner(compat_analyzer)
+        click.echo(f"{NOTE}Generating upgrade plan...")
         risk_assessment = RiskAssessment()
         migration_planner = MigrationPlanner()
 
-        # Generate upgrade path
-        upgrade_path = upgrade_path_planner.generate_upgrade_path(
-            current_version, target_version
-        )
-
         # Determine addon upgrade order
         addon_upgrade_order = upgrade_path_planner.determine_addon_upgrade_order(
             cluster_info["addons"]
@@ -288,7 +509,11 @@ def plan(ctx, cluster, region, profile, target_version, format, output):
 
         # Create runbook
         runbook = upgrade_path_planner.create_upgrade_runbook(
-            cluster, upgrade_path, cluster_info["addons"], cluster_info["node_groups"]
+            cluster,
+            upgrade_path,
+            cluster_info["addons"],
+            cluster_info["node_groups"],
+            ordered_addons=addon_upgrade_order,
         )
 
         # Estimate time
@@ -296,6 +521,16 @@ def plan(ctx, cluster, region, profile, target_version, format, output):
             upgrade_path, cluster_info["node_groups"], cluster_info["addons"]
         )
 
+        # Collect Kubernetes scan results, needed from here on
+        k8s_results = {}
+        try:
+            k8s_results = k8s_future.result()
+        except Exception as e:
+            logger.warning(f"Could not scan Kubernetes resources: {e}")
+
+        # Analyze deprecated APIs
+        deprecated_apis = k8s_results.get("deprecated_apis", {})
+
         # Perform risk assessment
         comprehensive_risk = risk_assessment.perform_comprehensive_assessment(
             cluster_info,
@@ -328,60 +563,59 @@ def plan(ctx, cluster, region, profile, target_version, format, output):
         }
 
         # Generate report
-        click.echo(f"{SYMBOLS['doc']} Generating {format} report...")
-
-        if format == "markdown":
-            reporter = MarkdownReporter()
-            report = reporter.generate_report(
-                cluster_info,
-                k8s_results,
-                analysis_results,
-                upgrade_plan_result,
-                comprehensive_risk,
-                migration_plan_result,
-            )
-        elif format == "json":
-            reporter = JSONExporter()
-            report = reporter.export_report(
-                cluster_info,
-                k8s_results,
-                analysis_results,
-                upgrade_plan_result,
-                comprehensive_risk,
-                migration_plan_result,
-            )
-        else:  # html
-            reporter = HTMLReporter()
-            report = reporter.generate_report(
-                cluster_info,
-                k8s_results,
-                analysis_results,
-                upgrade_plan_result,
-                comprehensive_risk,
-                migration_plan_result,
-            )
+        click.echo(f"{DOC}Generating {format} report...")
 
+        report_args = (
+            cluster_info,
+            k8s_results,
+            analysis_results,
+            upgrade_plan_result,
+            comprehensive_risk,
+            migration_plan_result,
+        )
         # Output report
+        reporter = getattr(importlib.import_module("src.reporter"), REPORTERS[format])()
         if output:
-            output_path = Path(output)
-            output_path.write_text(report)
-            click.echo(f"{SYMBOLS['success']} Report saved to: {output}")
+            # Reports are written as UTF-8 encoded chunks, section by section
+            # as they are generated, rather than building the whole report in
+            # memory and encoding it at the end
+            if format == "json":
+                report_chunks = [reporter.export_report_bytes(*report_args)]
+            else:
+                report_chunks = (
+                    chunk.encode("utf-8")
+                    for chunk in reporter.stream_report(*report_args)
+                )
+
+            with output.open("wb", buffering=REPORT_WRITE_BUFFER) as f:
+                for chunk in report_chunks:
+                    f.write(chunk)
+            click.echo(f"{OK}Report saved to: {output}")
         else:
-            click.echo("\n" + "=" * 80)
-            click.echo(report)
-            click.echo("=" * 80)
+            if format == "json":
+                report = reporter.export_report(*report_args)
+            else:
+                report = reporter.generate_report(*report_args)
 
-        # Display summary
-        click.echo(f"\n{SYMBOLS['chart']} Upgrade Plan Summary:")
-        click.echo(f"  Risk Level: {comprehensive_risk['overall_risk']}")
-        click.echo(f"  Version Jumps: {len(upgrade_path) - 1}")
-        click.echo(f"  Estimated Time: {time_estimation['total_hours']} hours")
-        click.echo(f"  Deprecated APIs: {len(deprecated_apis)}")
-        click.echo(f"  Breaking Changes: {len(breaking_changes)}")
+            with StatusBuffer() as buf:
+                buf.line("\n" + "=" * 80)
+                buf.line(report)
+                buf.line("=" * 80)
 
+        # Display summary
+        with StatusBuffer() as buf:
+            buf.line(f"\n{CHART}Upgrade Plan Summary:")
+            buf.line(f"  Risk Level: {comprehensive_risk['overall_risk']}")
+            buf.line(f"  Version Jumps: {len(upgrade_path) - 1}")
+            buf.line(f"  Estimated Time: {time_estimation['total_hours']} hours")
+            buf.line(f"  Deprecated APIs: {len(deprecated_apis)}")
+            buf.line(f"  Breaking Changes: {len(breaking_changes)}")
+
+    except KeyboardInterrupt:
+        _exit_interrupted()
     except Exception as e:
         logger.error(f"Plan generation failed: {e}", exc_info=ctx.obj.get("debug"))
-        click.echo(f"{SYMBOLS['error']} Error: {e}", err=True)
+        click.echo(f"{ERR}Error: {e}", err=True)
         sys.exit(1)
 
 
@@ -392,6 +626,8 @@ def plan(ctx, cluster, region, profile, target_version, format, output):
 @click.pass_context
 def check_addon(ctx, addon, current, eks_version):
     """Check addon version compatibility."""
+    from src.analyzer.compatibility import CompatibilityAnalyzer
+
     try:
         logger.info(f"Checking addon {addon} version {current} for EKS {eks_version}")
 
@@ -400,20 +636,21 @@ def check_addon(ctx, addon, current, eks_version):
             addon, current, eks_version
         )
 
-        click.echo(f"Addon: {addon}")
-        click.echo(f"Current Version: {current}")
-        click.echo(f"EKS Version: {eks_version}")
+        with StatusBuffer() as buf:
+            buf.line(f"Addon: {addon}")
+            buf.line(f"Current Version: {current}")
+            buf.line(f"EKS Version: {eks_version}")
 
-        if is_compatible:
-            click.echo(f"{SYMBOLS['success']} Compatible")
-        else:
-            click.echo(f"{SYMBOLS['error']} Not compatible")
-            if recommended:
-                click.echo(f"Recommended Version: {recommended}")
+            if is_compatible:
+                buf.line(f"{OK}Compatible")
+            else:
+                buf.line(f"{ERR}Not compatible")
+                if recommended:
+                    buf.line(f"Recommended Version: {recommended}")
 
     except Exception as e:
         logger.error(f"Addon check failed: {e}", exc_info=ctx.obj.get("debug"))
-        click.echo(f"{SYMBOLS['error']} Error: {e}", err=True)
+        click.echo(f"{ERR}Error: {e}", err=True)
         sys.exit(1)
 
 
@@ -1,11 +1,19 @@
 """Planner package for EKS Upgrade Planner."""
 
-from src.planner.upgrade_path import UpgradePathPlanner
-from src.planner.risk_assessment import RiskAssessment
-from src.planner.migration_plan import MigrationPlanner
+from src.utils.lazy import lazy_getattr
+
+# Planner classes are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "UpgradePathPlanner": "src.planner.upgrade_path",
+    "RiskAssessment": "src.planner.risk_assessment",
+    "MigrationPlanner": "src.planner.migration_plan",
+}
 
 __all__ = [
     "UpgradePathPlanner",
     "RiskAssessment",
     "MigrationPlanner",
 ]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
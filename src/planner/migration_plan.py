@@ -1,10 +1,200 @@
 """Migration plan generator for deprecated APIs and breaking changes."""
 
-from typing import Dict, Any, List, Optional
+import bisect
+import sys
+from collections import ChainMap
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+from src.utils.duration import minutes_to_hours
 from src.utils.logger import get_logger
+from src.utils.serialization import dumps
+from src.utils.version import parse_version
 
 logger = get_logger(__name__)
 
+# Number of migrations given before/after manifest examples in a plan
+MAX_MANIFEST_EXAMPLES = 5
+
+# Deprecated resources flattened into parallel columns: API versions, parsed
+# removal versions (None if unparseable) and the resource entries, plus a
+# removal index of (removal version, row) pairs sorted by removal version.
+# Rows with an unparseable removal version are left out of the index, so
+# they never match a target version.
+_ResourceColumns = Tuple[
+    Tuple[str, ...],
+    Tuple[Optional[Tuple[int, ...]], ...],
+    Tuple[Dict[str, Any], ...],
+    Tuple[Tuple[Tuple[int, ...], int], ...],
+]
+
+
+# Before/after manifest examples, rendered with str.format_map from a
+# migration entry; _MANIFEST_DEFAULTS fills in fields the entry lacks
+_MANIFEST_BEFORE_TEMPLATE = """# BEFORE - Deprecated API
+apiVersion: {current_api}
+kind: {resource_kind}
+metadata:
+  name: {resource_name}
+  namespace: {namespace}
+spec:
+  # ... existing spec ..."""
+
+_MANIFEST_AFTER_TEMPLATE = """# AFTER - Updated API
+apiVersion: {replacement_api}
+kind: {resource_kind}
+metadata:
+  name: {resource_name}
+  namespace: {namespace}
+spec:
+  # ... existing spec ...
+  # Note: Review for any spec changes required"""
+
+_MANIFEST_DEFAULTS = {
+    "resource_kind": "Deployment",
+    "resource_name": "example",
+    "namespace": "default",
+    "current_api": "apps/v1beta1",
+    "replacement_api": "apps/v1",
+}
+
+# Resources that typically need recreation for API changes, and the steps
+# to recreate one (shared by every recreation entry)
+_RECREATION_KINDS = frozenset({"StatefulSet", "DaemonSet"})
+
+_RECREATION_PROCEDURE = (
+    "Export current resource definition",
+    "Update API version in manifest",
+    "Delete existing resource",
+    "Recreate with updated manifest",
+    "Verify pods are running",
+)
+
+
+# Testing recommendations given for every plan; each plan gets its own
+# copies of the entries
+_BASE_TESTING_RECOMMENDATIONS = (
+    {
+        "category": "Pre-Migration Testing",
+        "tests": (
+            "Backup all workload manifests",
+            "Export current resource definitions",
+            "Document current application behavior",
+        ),
+        "importance": "CRITICAL",
+    },
+    {
+        "category": "Manifest Validation",
+        "tests": (
+            "Validate updated manifests with kubectl apply --dry-run=server",
+            "Check for deprecation warnings with kubectl",
+            "Use pluto or kubent tools to scan for deprecated APIs",
+        ),
+        "importance": "HIGH",
+    },
+    {
+        "category": "Staging Environment Testing",
+        "tests": (
+            "Deploy updated manifests to staging cluster",
+            "Verify all pods start successfully",
+            "Test application functionality",
+            "Monitor for unexpected errors or warnings",
+            "Validate networking and service discovery",
+        ),
+        "importance": "CRITICAL",
+    },
+    {
+        "category": "Rollback Testing",
+        "tests": (
+            "Test rollback procedure",
+            "Verify ability to restore from backups",
+            "Document rollback steps",
+        ),
+        "importance": "HIGH",
+    },
+)
+
+
+def _parse_version(version: str) -> Optional[Tuple[int, ...]]:
+    """
+    Parse a version string into a tuple of integers for comparison.
+
+    Args:
+        version: Version string such as "1.25"
+
+    Returns:
+        Parsed version, or None if the string is not a dotted version
+    """
+    try:
+        return parse_version(str(version))
+    except ValueError:
+        return None
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a string so repeated values share one object.
+
+    Args:
+        value: Value to intern; anything other than a string is returned as is
+
+    Returns:
+        Interned string, or the value unchanged
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _build_columns(
+    deprecated_apis: Dict[str, List[Dict[str, Any]]],
+) -> _ResourceColumns:
+    """
+    Flatten deprecated APIs into parallel per-resource columns.
+
+    Args:
+        deprecated_apis: Deprecated APIs and affected resources
+
+    Returns:
+        Tuple of (api_versions, removed_in, resources, removal_index) columns
+    """
+    api_versions = []
+    removed_in = []
+    resources = []
+
+    for api_version, api_resources in deprecated_apis.items():
+        for resource in api_resources:
+            api_versions.append(_intern(api_version))
+            removed_in.append(
+                _parse_version(
+                    resource.get("deprecation_info", {}).get("removed_in", "999.0")
+                )
+            )
+            resources.append(resource)
+
+    removal_index = tuple(
+        sorted(
+            (removed, row)
+            for row, removed in enumerate(removed_in)
+            if removed is not None
+        )
+    )
+
+    return tuple(api_versions), tuple(removed_in), tuple(resources), removal_index
+
+
+def _rows_removed_by(
+    removal_index: Tuple[Tuple[Tuple[int, ...], int], ...], target: Tuple[int, ...]
+) -> int:
+    """
+    Count the rows removed in or before a version.
+
+    Args:
+        removal_index: (removal version, row) pairs sorted by removal version
+        target: Parsed target version
+
+    Returns:
+        Number of leading removal index entries removed by the target
+    """
+    # Every (target, row) pair sorts before (target, len(removal_index))
+    return bisect.bisect_right(removal_index, (target, len(removal_index)))
+
 
 class MigrationPlanner:
     """Planner for resource migrations and updates."""
@@ -26,34 +216,42 @@ class MigrationPlanner:
         Returns:
             Migration requirements dictionary
         """
-        logger.info(f"Detecting migration requirements for K8s {target_version}")
+        return self._scan_migrations(deprecated_apis, target_version)[0]
 
+    def _scan_migrations(
+        self,
+        deprecated_apis: Dict[str, List[Dict[str, Any]]],
+        target_version: str,
+        flag_recreation: bool = False,
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Detect required migrations, optionally flagging recreations as well.
+
+        Resources needing recreation are flagged as each migration is
+        built, so the migrations are only walked once.
+
+        Args:
+            deprecated_apis: Deprecated APIs and affected resources
+            target_version: Target Kubernetes version
+            flag_recreation: Also collect resources needing recreation
+
+        Returns:
+            Tuple of (migration requirements, resources needing recreation)
+        """
+        logger.info("Detecting migration requirements for K8s %s", target_version)
+
+        columns = _build_columns(deprecated_apis)
+        total_resources = len(columns[2])
         migrations_required = []
-        total_resources = 0
-
-        for api_version, resources in deprecated_apis.items():
-            for resource in resources:
-                total_resources += 1
-                deprecation_info = resource.get("deprecation_info", {})
-                removed_in = deprecation_info.get("removed_in", "999.0")
-
-                try:
-                    if float(target_version) >= float(removed_in):
-                        migrations_required.append(
-                            {
-                                "resource_name": resource.get("name"),
-                                "resource_kind": resource.get("kind"),
-                                "namespace": resource.get("namespace"),
-                                "current_api": api_version,
-                                "replacement_api": deprecation_info.get("replacement"),
-                                "migration_notes": deprecation_info.get(
-                                    "migration_notes"
-                                ),
-                                "priority": "CRITICAL",
-                            }
-                        )
-                except ValueError:
-                    pass
+        resources_to_recreate = []
+
+        for migration in self._iter_migrations(columns, target_version):
+            migrations_required.append(migration)
+
+            if flag_recreation:
+                recreation = self._recreation_entry(migration)
+                if recreation is not None:
+                    resources_to_recreate.append(recreation)
 
         result = {
             "migrations_required": len(migrations_required) > 0,
@@ -63,11 +261,107 @@ class MigrationPlanner:
         }
 
         logger.info(
-            f"Migration detection complete: {len(migrations_required)} "
-            f"critical migrations required"
+            "Migration detection complete: %d critical migrations required",
+            len(migrations_required),
         )
 
-        return result
+        return result, resources_to_recreate
+
+    def _iter_migrations(
+        self, columns: _ResourceColumns, target_version: str
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the migrations required for the target version.
+
+        Args:
+            columns: Flattened deprecated API columns
+            target_version: Target Kubernetes version
+
+        Yields:
+            Migration entry for each resource removed by the target version
+        """
+        removal_index = columns[3]
+
+        # An unparseable removal version never matches; neither does an
+        # unparseable target version
+        target = _parse_version(target_version)
+        if target is None:
+            return
+
+        matched = removal_index[: _rows_removed_by(removal_index, target)]
+        yield from self._migration_entries(columns, sorted(row for _, row in matched))
+
+    def detect_migrations_along_path(
+        self,
+        deprecated_apis: Dict[str, List[Dict[str, Any]]],
+        upgrade_path: List[str],
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Detect the migrations each step of an upgrade path makes necessary.
+
+        Each resource is listed under the first version in the path that
+        removes its API; resources not removed along the path are left out.
+        The removal index is built once, so each step costs a binary search
+        plus its own migrations.
+
+        Args:
+            deprecated_apis: Deprecated APIs and affected resources
+            upgrade_path: Versions in upgrade order, starting with the current one
+
+        Returns:
+            Dictionary mapping each version after the first to the migrations
+            required before upgrading to it
+        """
+        columns = _build_columns(deprecated_apis)
+        removal_index = columns[3]
+
+        migrations_by_version = {}
+        start = 0
+        for version in upgrade_path[1:]:
+            target = _parse_version(version)
+            end = (
+                start
+                if target is None
+                else max(start, _rows_removed_by(removal_index, target))
+            )
+            migrations_by_version[version] = list(
+                self._migration_entries(
+                    columns, sorted(row for _, row in removal_index[start:end])
+                )
+            )
+            start = end
+
+        return migrations_by_version
+
+    def _migration_entries(
+        self, columns: _ResourceColumns, rows: List[int]
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Build migration entries for rows of the deprecated API columns.
+
+        Args:
+            columns: Flattened deprecated API columns
+            rows: Column rows, in the order to yield them
+
+        Yields:
+            Migration entry for each row
+        """
+        api_versions, _, resources, _ = columns
+
+        # Kinds, namespaces and API versions repeat across many resources, so
+        # they are interned to share one string each
+        for index in rows:
+            resource = resources[index]
+            deprecation_info = resource.get("deprecation_info", {})
+            yield {
+                "resource_name": resource.get("name"),
+                "resource_kind": _intern(resource.get("kind")),
+                "namespace": _intern(resource.get("namespace")),
+                "current_api": api_versions[index],
+                "replacement_api": _intern(deprecation_info.get("replacement")),
+                "migration_notes": deprecation_info.get("migration_notes"),
+                "priority": "CRITICAL",
+            }
 
     def generate_manifest_examples(self, migration: Dict[str, Any]) -> Dict[str, str]:
         """
@@ -79,39 +373,34 @@ class MigrationPlanner:
         Returns:
             Dictionary with 'before' and 'after' manifest examples
         """
-        resource_kind = migration.get("resource_kind", "Deployment")
-        resource_name = migration.get("resource_name", "example")
-        namespace = migration.get("namespace", "default")
-        current_api = migration.get("current_api", "apps/v1beta1")
-        replacement_api = migration.get("replacement_api", "apps/v1")
-
-        # Generate example manifests
-        before = f"""# BEFORE - Deprecated API
-apiVersion: {current_api}
-kind: {resource_kind}
-metadata:
-  name: {resource_name}
-  namespace: {namespace}
-spec:
-  # ... existing spec ...
-"""
-
-        after = f"""# AFTER - Updated API
-apiVersion: {replacement_api}
-kind: {resource_kind}
-metadata:
-  name: {resource_name}
-  namespace: {namespace}
-spec:
-  # ... existing spec ...
-  # Note: Review for any spec changes required
-"""
+        fields = ChainMap(migration, _MANIFEST_DEFAULTS)
 
         return {
-            "before": before.strip(),
-            "after": after.strip(),
+            "before": _MANIFEST_BEFORE_TEMPLATE.format_map(fields),
+            "after": _MANIFEST_AFTER_TEMPLATE.format_map(fields),
         }
 
+    def generate_all_manifest_examples(
+        self, migrations: Iterable[Dict[str, Any]]
+    ) -> str:
+        """
+        Generate before/after manifest examples for many migrations at once.
+
+        Args:
+            migrations: Migrations to generate examples for
+
+        Returns:
+            Multi-document YAML with the before and after manifests of each
+            migration, separated by "---" lines
+        """
+        documents = []
+        for migration in migrations:
+            fields = ChainMap(migration, _MANIFEST_DEFAULTS)
+            documents.append(_MANIFEST_BEFORE_TEMPLATE.format_map(fields))
+            documents.append(_MANIFEST_AFTER_TEMPLATE.format_map(fields))
+
+        return "\n---\n".join(documents)
+
     def identify_manual_intervention_points(
         self, migrations: List[Dict[str, Any]], breaking_changes: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
@@ -122,6 +411,21 @@ spec:
             migrations: List of migrations
             breaking_changes: List of breaking changes
 
+        Returns:
+            List of manual intervention points
+        """
+        return self._intervention_points(len(migrations), breaking_changes)
+
+    def _intervention_points(
+        self, migration_count: int, breaking_changes: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Identify manual intervention points from the number of migrations.
+
+        Args:
+            migration_count: Number of migrations
+            breaking_changes: List of breaking changes
+
         Returns:
             List of manual intervention points
         """
@@ -130,14 +434,14 @@ spec:
         intervention_points = []
 
         # API migrations always require manual review
-        if migrations:
+        if migration_count:
             intervention_points.append(
                 {
                     "type": "api_migration",
                     "priority": "HIGH",
-                    "description": f"{len(migrations)} resources need API version updates",
+                    "description": f"{migration_count} resources need API version updates",
                     "action": "Update manifests and re-apply resources",
-                    "estimated_time": f"{len(migrations) * 5} minutes",
+                    "estimated_time": f"{migration_count * 5} minutes",
                 }
             )
 
@@ -166,7 +470,7 @@ spec:
             }
         )
 
-        logger.info(f"Identified {len(intervention_points)} intervention points")
+        logger.info("Identified %d intervention points", len(intervention_points))
         return intervention_points
 
     def create_testing_recommendations(
@@ -179,58 +483,34 @@ spec:
             migrations: List of migrations
             cluster_info: Cluster information
 
+        Returns:
+            List of testing recommendations
+        """
+        return self._testing_recommendations(len(migrations))
+
+    def _testing_recommendations(self, migration_count: int) -> List[Dict[str, Any]]:
+        """
+        Create testing recommendations from the number of migrations.
+
+        Args:
+            migration_count: Number of migrations
+
         Returns:
             List of testing recommendations
         """
         logger.info("Creating testing recommendations")
 
         recommendations = [
-            {
-                "category": "Pre-Migration Testing",
-                "tests": [
-                    "Backup all workload manifests",
-                    "Export current resource definitions",
-                    "Document current application behavior",
-                ],
-                "importance": "CRITICAL",
-            },
-            {
-                "category": "Manifest Validation",
-                "tests": [
-                    "Validate updated manifests with kubectl apply --dry-run=server",
-                    "Check for deprecation warnings with kubectl",
-                    "Use pluto or kubent tools to scan for deprecated APIs",
-                ],
-                "importance": "HIGH",
-            },
-            {
-                "category": "Staging Environment Testing",
-                "tests": [
-                    "Deploy updated manifests to staging cluster",
-                    "Verify all pods start successfully",
-                    "Test application functionality",
-                    "Monitor for unexpected errors or warnings",
-                    "Validate networking and service discovery",
-                ],
-                "importance": "CRITICAL",
-            },
-            {
-                "category": "Rollback Testing",
-                "tests": [
-                    "Test rollback procedure",
-                    "Verify ability to restore from backups",
-                    "Document rollback steps",
-                ],
-                "importance": "HIGH",
-            },
+            dict(recommendation, tests=list(recommendation["tests"]))
+            for recommendation in _BASE_TESTING_RECOMMENDATIONS
         ]
 
-        if migrations:
+        if migration_count:
             recommendations.append(
                 {
                     "category": "API Migration Testing",
                     "tests": [
-                        f"Test updated manifests for {len(migrations)} affected resources",
+                        f"Test updated manifests for {migration_count} affected resources",
                         "Verify resource spec compatibility",
                         "Check for field renames or changes",
                     ],
@@ -238,7 +518,7 @@ spec:
                 }
             )
 
-        logger.info(f"Created {len(recommendations)} testing categories")
+        logger.info("Created %d testing categories", len(recommendations))
         return recommendations
 
     def flag_resources_needing_recreation(
@@ -255,37 +535,42 @@ spec:
         """
         logger.info("Flagging resources that may need recreation")
 
-        # Resources that typically need recreation for API changes
-        recreation_required = ["StatefulSet", "DaemonSet"]
-
         resources_to_recreate = []
 
         for migration in migrations:
-            resource_kind = migration.get("resource_kind")
-
-            if resource_kind in recreation_required:
-                resources_to_recreate.append(
-                    {
-                        "resource_name": migration.get("resource_name"),
-                        "resource_kind": resource_kind,
-                        "namespace": migration.get("namespace"),
-                        "reason": f"{resource_kind} may require recreation for API version change",
-                        "procedure": [
-                            "Export current resource definition",
-                            "Update API version in manifest",
-                            "Delete existing resource",
-                            "Recreate with updated manifest",
-                            "Verify pods are running",
-                        ],
-                        "risk": "HIGH",
-                    }
-                )
+            recreation = self._recreation_entry(migration)
+            if recreation is not None:
+                resources_to_recreate.append(recreation)
 
         logger.info(
-            f"Flagged {len(resources_to_recreate)} resources for potential recreation"
+            "Flagged %d resources for potential recreation", len(resources_to_recreate)
         )
         return resources_to_recreate
 
+    @staticmethod
+    def _recreation_entry(migration: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Build the recreation entry for a migration, if its resource needs one.
+
+        Args:
+            migration: Migration information
+
+        Returns:
+            Recreation entry, or None if the resource can be updated in place
+        """
+        resource_kind = migration.get("resource_kind")
+        if resource_kind not in _RECREATION_KINDS:
+            return None
+
+        return {
+            "resource_name": migration.get("resource_name"),
+            "resource_kind": resource_kind,
+            "namespace": migration.get("namespace"),
+            "reason": f"{resource_kind} may require recreation for API version change",
+            "procedure": _RECREATION_PROCEDURE,
+            "risk": "HIGH",
+        }
+
     def generate_migration_plan(
         self,
         deprecated_apis: Dict[str, List[Dict[str, Any]]],
@@ -307,45 +592,36 @@ spec:
         """
         logger.info("Generating comprehensive migration plan")
 
-        # Detect migration requirements
-        migration_reqs = self.detect_migration_requirements(
-            deprecated_apis, target_version
+        # Detect migration requirements, flagging resources needing
+        # recreation in the same pass
+        migration_reqs, recreation_required = self._scan_migrations(
+            deprecated_apis, target_version, flag_recreation=True
         )
+        logger.info(
+            "Flagged %d resources for potential recreation", len(recreation_required)
+        )
+        migrations = migration_reqs["migrations"]
 
         # Generate manifest examples for critical migrations
         manifest_examples = []
-        for migration in migration_reqs.get("migrations", [])[
-            :5
-        ]:  # Limit to 5 examples
-            examples = self.generate_manifest_examples(migration)
-            manifest_examples.append(
-                {
-                    "resource": f"{migration['resource_kind']}/{migration['resource_name']}",
-                    "namespace": migration["namespace"],
-                    "examples": examples,
-                }
-            )
+        for migration in migrations[:MAX_MANIFEST_EXAMPLES]:
+            manifest_examples.append(self._manifest_example_entry(migration))
 
         # Identify manual interventions
         manual_interventions = self.identify_manual_intervention_points(
-            migration_reqs.get("migrations", []), breaking_changes
+            migrations, breaking_changes
         )
 
         # Create testing recommendations
         testing_recommendations = self.create_testing_recommendations(
-            migration_reqs.get("migrations", []), cluster_info
-        )
-
-        # Flag resources needing recreation
-        recreation_required = self.flag_resources_needing_recreation(
-            migration_reqs.get("migrations", [])
+            migrations, cluster_info
         )
 
         migration_plan = {
             "migration_required": migration_reqs["migrations_required"],
             "total_resources_affected": migration_reqs["total_resources_affected"],
             "critical_migrations": migration_reqs["critical_migrations"],
-            "migrations": migration_reqs["migrations"],
+            "migrations": migrations,
             "manifest_examples": manifest_examples,
             "manual_interventions": manual_interventions,
             "testing_recommendations": testing_recommendations,
@@ -356,6 +632,111 @@ spec:
         logger.info("Migration plan generated successfully")
         return migration_plan
 
+    def generate_migration_plan_stream(
+        self,
+        deprecated_apis: Dict[str, List[Dict[str, Any]]],
+        breaking_changes: List[Dict[str, Any]],
+        target_version: str,
+        cluster_info: Dict[str, Any],
+        fp: BinaryIO,
+    ) -> None:
+        """
+        Write the migration plan as JSON without building it in memory.
+
+        Migrations are serialized one at a time as they are detected; only
+        the manifest examples and resources needing recreation are kept.
+        The document has the same sections as generate_migration_plan, with
+        "migrations" first.
+
+        Args:
+            deprecated_apis: Deprecated APIs and affected resources
+            breaking_changes: Breaking changes
+            target_version: Target Kubernetes version
+            cluster_info: Cluster information
+            fp: Binary file-like object to write UTF-8 JSON to
+        """
+        logger.info("Streaming comprehensive migration plan")
+        logger.info("Detecting migration requirements for K8s %s", target_version)
+
+        migration_count = 0
+        manifest_examples = []
+        recreation_required = []
+
+        columns = _build_columns(deprecated_apis)
+
+        fp.write(b'{"migrations":[')
+        for migration in self._iter_migrations(columns, target_version):
+            if migration_count:
+                fp.write(b",")
+            fp.write(dumps(migration))
+            migration_count += 1
+
+            if len(manifest_examples) < MAX_MANIFEST_EXAMPLES:
+                manifest_examples.append(self._manifest_example_entry(migration))
+
+            recreation = self._recreation_entry(migration)
+            if recreation is not None:
+                recreation_required.append(recreation)
+        fp.write(b"],")
+
+        logger.info(
+            "Migration detection complete: %d critical migrations required",
+            migration_count,
+        )
+
+        migration_reqs = {
+            "critical_migrations": migration_count,
+            "total_resources_affected": len(columns[2]),
+        }
+        sections = {
+            "migration_required": migration_count > 0,
+            **migration_reqs,
+            "manifest_examples": manifest_examples,
+            "manual_interventions": self._intervention_points(
+                migration_count, breaking_changes
+            ),
+            "testing_recommendations": self._testing_recommendations(migration_count),
+            "resources_needing_recreation": recreation_required,
+            "estimated_migration_time": self._estimate_migration_time(migration_reqs),
+        }
+
+        # Append the remaining sections to the open document, dropping
+        # their own opening brace
+        fp.write(dumps(sections)[1:])
+
+        logger.info("Migration plan streamed successfully")
+
+    @staticmethod
+    def to_json(plan: Dict[str, Any]) -> bytes:
+        """
+        Serialize a migration plan to indented JSON.
+
+        Uses orjson when it is installed, through src.utils.serialization.
+
+        Args:
+            plan: Migration plan from generate_migration_plan
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        return dumps(plan, indent=True, default=str)
+
+    def _manifest_example_entry(self, migration: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the manifest example entry for a migration.
+
+        Args:
+            migration: Migration information
+
+        Returns:
+            Resource, namespace and before/after manifest examples
+        """
+        return {
+            "resource": f"{migration['resource_kind']}/{migration['resource_name']}",
+            "namespace": migration["namespace"],
+            "examples": self.generate_manifest_examples(migration),
+        }
+
     def _estimate_migration_time(
         self, migration_reqs: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -384,7 +765,7 @@ spec:
 
         return {
             "total_minutes": total_time,
-            "total_hours": round(total_time / 60, 1),
+            "total_hours": minutes_to_hours(total_time),
             "breakdown": {
                 "critical_migrations": f"{critical_migrations * time_per_critical} minutes",
                 "other_updates": f"{(total_resources - critical_migrations) * time_per_resource} minutes",
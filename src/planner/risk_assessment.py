@@ -1,10 +1,58 @@
 """Risk assessment for EKS upgrades."""
 
-from typing import Dict, Any, List, Optional
+import bisect
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
+from src.utils.duration import minutes_to_hours
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Numeric score per risk level, and the level for each score (score - 1)
+_RISK_SCORES = {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
+_SCORE_LEVELS = ("LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+# Risk bands as (risk level, message template) pairs. A value above the
+# i-th threshold (and at most the next) falls in band i + 1, so bands are
+# found with bisect_left.
+_DEPRECATED_THRESHOLDS = (0, 5, 10)
+_DEPRECATED_BANDS = (
+    ("LOW", "No deprecated APIs found"),
+    ("LOW", "{total} resources using deprecated APIs"),
+    ("MEDIUM", "{total} resources using deprecated APIs"),
+    ("HIGH", "{total} resources using deprecated APIs"),
+)
+
+_NODE_THRESHOLDS = (20, 50, 100)
+_NODE_BANDS = (
+    ("LOW", "Small cluster with {total} nodes"),
+    ("MEDIUM", "Cluster with {total} nodes"),
+    ("MEDIUM", "Medium cluster with {total} nodes"),
+    ("HIGH", "Large cluster with {total} nodes"),
+)
+
+# Risk bands for 0, 1 and 2 version jumps; anything else uses the last one
+_VERSION_JUMP_BANDS = (
+    ("LOW", "No upgrade needed"),
+    ("LOW", "Single version upgrade"),
+    ("MEDIUM", "Two version upgrades required"),
+    ("HIGH", "{total} sequential upgrades required"),
+)
+
+
+def _assess_cluster(cluster: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Assess one cluster in a worker process.
+
+    Args:
+        cluster: Keyword arguments for perform_comprehensive_assessment
+
+    Returns:
+        Comprehensive risk assessment
+    """
+    return RiskAssessment().perform_comprehensive_assessment(**cluster)
+
 
 class RiskAssessment:
     """Risk assessment for EKS cluster upgrades."""
@@ -27,28 +75,25 @@ class RiskAssessment:
         Returns:
             Risk assessment dictionary
         """
-        total_deprecated = sum(len(resources) for resources in deprecated_apis.values())
-        removed_apis = sum(
-            1
-            for api_version, resources in deprecated_apis.items()
-            if any(r.get("deprecation_info", {}).get("removed_in") for r in resources)
-        )
+        # One pass counts deprecated resources and the APIs with at least
+        # one resource that has a removal version
+        total_deprecated = 0
+        removed_apis = 0
+        for resources in deprecated_apis.values():
+            total_deprecated += len(resources)
+            for resource in resources:
+                if resource.get("deprecation_info", {}).get("removed_in"):
+                    removed_apis += 1
+                    break
 
         if removed_apis > 0:
             risk_level = "CRITICAL"
             message = f"{removed_apis} APIs will be removed in target version"
-        elif total_deprecated > 10:
-            risk_level = "HIGH"
-            message = f"{total_deprecated} resources using deprecated APIs"
-        elif total_deprecated > 5:
-            risk_level = "MEDIUM"
-            message = f"{total_deprecated} resources using deprecated APIs"
-        elif total_deprecated > 0:
-            risk_level = "LOW"
-            message = f"{total_deprecated} resources using deprecated APIs"
         else:
-            risk_level = "LOW"
-            message = "No deprecated APIs found"
+            risk_level, template = _DEPRECATED_BANDS[
+                bisect.bisect_left(_DEPRECATED_THRESHOLDS, total_deprecated)
+            ]
+            message = template.format(total=total_deprecated)
 
         return {
             "risk_level": risk_level,
@@ -76,22 +121,27 @@ class RiskAssessment:
                 "message": "No breaking changes identified",
             }
 
-        critical_changes = [c for c in breaking_changes if c.get("impact") == "HIGH"]
+        total_changes = 0
+        critical_changes = 0
+        for change in breaking_changes:
+            total_changes += 1
+            if change.get("impact") == "HIGH":
+                critical_changes += 1
 
-        if len(critical_changes) >= 3:
+        if critical_changes >= 3:
             risk_level = "HIGH"
-        elif len(critical_changes) >= 1:
+        elif critical_changes >= 1:
             risk_level = "MEDIUM"
-        elif len(breaking_changes) > 5:
+        elif total_changes > 5:
             risk_level = "MEDIUM"
         else:
             risk_level = "LOW"
 
         return {
             "risk_level": risk_level,
-            "total_changes": len(breaking_changes),
-            "critical_changes": len(critical_changes),
-            "message": f"{len(breaking_changes)} breaking changes, {len(critical_changes)} critical",
+            "total_changes": total_changes,
+            "critical_changes": critical_changes,
+            "message": f"{total_changes} breaking changes, {critical_changes} critical",
         }
 
     def assess_addon_compatibility_risk(
@@ -151,18 +201,9 @@ class RiskAssessment:
         """
         num_jumps = len(upgrade_path) - 1
 
-        if num_jumps == 0:
-            risk_level = "LOW"
-            message = "No upgrade needed"
-        elif num_jumps == 1:
-            risk_level = "LOW"
-            message = "Single version upgrade"
-        elif num_jumps == 2:
-            risk_level = "MEDIUM"
-            message = "Two version upgrades required"
-        else:
-            risk_level = "HIGH"
-            message = f"{num_jumps} sequential upgrades required"
+        band = num_jumps if 0 <= num_jumps < 3 else -1
+        risk_level, template = _VERSION_JUMP_BANDS[band]
+        message = template.format(total=num_jumps)
 
         return {
             "risk_level": risk_level,
@@ -186,18 +227,10 @@ class RiskAssessment:
             ng.get("scaling_config", {}).get("desiredSize", 0) for ng in node_groups
         )
 
-        if total_nodes > 100:
-            risk_level = "HIGH"
-            message = f"Large cluster with {total_nodes} nodes"
-        elif total_nodes > 50:
-            risk_level = "MEDIUM"
-            message = f"Medium cluster with {total_nodes} nodes"
-        elif total_nodes > 20:
-            risk_level = "MEDIUM"
-            message = f"Cluster with {total_nodes} nodes"
-        else:
-            risk_level = "LOW"
-            message = f"Small cluster with {total_nodes} nodes"
+        risk_level, template = _NODE_BANDS[
+            bisect.bisect_left(_NODE_THRESHOLDS, total_nodes)
+        ]
+        message = template.format(total=total_nodes)
 
         return {
             "risk_level": risk_level,
@@ -208,8 +241,7 @@ class RiskAssessment:
 
     def _get_risk_score(self, risk_level: str) -> int:
         """Convert risk level to numeric score."""
-        scores = {"LOW": 1, "MEDIUM": 2, "HIGH": 3, "CRITICAL": 4}
-        return scores.get(risk_level, 1)
+        return _RISK_SCORES.get(risk_level, 1)
 
     def _calculate_overall_risk(self, risk_assessments: List[Dict[str, Any]]) -> str:
         """
@@ -224,15 +256,18 @@ class RiskAssessment:
         if not risk_assessments:
             return "LOW"
 
-        # Get maximum risk score
-        max_score = max(
-            self._get_risk_score(assessment.get("risk_level", "LOW"))
-            for assessment in risk_assessments
-        )
+        # Get maximum risk score, stopping at the highest possible one
+        top_score = len(_SCORE_LEVELS)
+        max_score = 0
+        for assessment in risk_assessments:
+            score = _RISK_SCORES.get(assessment.get("risk_level", "LOW"), 1)
+            if score > max_score:
+                max_score = score
+                if max_score == top_score:
+                    break
 
         # Map back to level
-        score_to_level = {1: "LOW", 2: "MEDIUM", 3: "HIGH", 4: "CRITICAL"}
-        return score_to_level.get(max_score, "MEDIUM")
+        return _SCORE_LEVELS[max_score - 1]
 
     def perform_comprehensive_assessment(
         self,
@@ -334,9 +369,37 @@ class RiskAssessment:
             "staging_test_required": True,
         }
 
-        logger.info(f"Risk assessment complete: Overall risk = {overall_risk}")
+        logger.info("Risk assessment complete: Overall risk = %s", overall_risk)
         return assessment
 
+    def perform_comprehensive_assessment_batch(
+        self, clusters: List[Dict[str, Any]], max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Perform comprehensive risk assessments for many clusters in parallel.
+
+        Assessments are CPU bound and independent, so they are spread over
+        worker processes.
+
+        Args:
+            clusters: Keyword arguments for perform_comprehensive_assessment,
+                one dictionary per cluster
+            max_workers: Maximum number of worker processes (defaults to the
+                number of CPUs)
+
+        Returns:
+            Comprehensive risk assessments, in the order of clusters
+        """
+        if len(clusters) <= 1:
+            return [_assess_cluster(cluster) for cluster in clusters]
+
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(clusters) // (workers * 4))
+
+        logger.info("Assessing %d clusters with %d processes", len(clusters), workers)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_assess_cluster, clusters, chunksize=chunksize))
+
     def _estimate_downtime(
         self, risk_level: str, version_jumps: int, total_nodes: int
     ) -> Dict[str, Any]:
@@ -367,7 +430,10 @@ class RiskAssessment:
 
         return {
             "minimum_minutes": total_downtime,
-            "recommended_window": f"{round(total_downtime / 60, 1)} - {round(total_downtime / 60 + 0.5, 1)} hours",
+            "recommended_window": (
+                f"{minutes_to_hours(total_downtime)} - "
+                f"{minutes_to_hours(total_downtime + 30)} hours"
+            ),
             "notes": "Control plane upgrade causes brief API unavailability",
         }
 
@@ -381,34 +447,42 @@ class RiskAssessment:
         Returns:
             Risk summary text
         """
-        lines = [
-            f"Risk Assessment Summary",
-            "=" * 60,
-            "",
-            f"Overall Risk Level: {assessment['overall_risk']}",
-            "",
-        ]
+        return "\n".join(self._iter_risk_summary_lines(assessment))
+
+    def _iter_risk_summary_lines(self, assessment: Dict[str, Any]) -> Iterator[str]:
+        """
+        Generate the lines of the human-readable risk summary.
+
+        Args:
+            assessment: Risk assessment dictionary
+
+        Yields:
+            Risk summary lines
+        """
+        yield "Risk Assessment Summary"
+        yield "=" * 60
+        yield ""
+        yield f"Overall Risk Level: {assessment['overall_risk']}"
+        yield ""
 
         if assessment["risk_factors"]:
-            lines.append("Risk Factors:")
+            yield "Risk Factors:"
             for factor in assessment["risk_factors"]:
-                lines.append(f"  {factor}")
-            lines.append("")
+                yield f"  {factor}"
+            yield ""
 
         if assessment["positive_factors"]:
-            lines.append("Positive Factors:")
+            yield "Positive Factors:"
             for factor in assessment["positive_factors"]:
-                lines.append(f"  {factor}")
-            lines.append("")
+                yield f"  {factor}"
+            yield ""
 
         if assessment["mitigation_strategies"]:
-            lines.append("Recommended Mitigations:")
+            yield "Recommended Mitigations:"
             for i, strategy in enumerate(assessment["mitigation_strategies"], 1):
-                lines.append(f"  {i}. {strategy}")
-            lines.append("")
+                yield f"  {i}. {strategy}"
+            yield ""
 
-        lines.append(
+        yield (
             f"Estimated Downtime: {assessment['estimated_downtime']['recommended_window']}"
         )
-
-        return "\n".join(lines)
@@ -1,11 +1,181 @@
 """Upgrade path planning for EKS clusters."""
 
+import functools
+import itertools
+import logging
 from typing import Dict, Any, List, Optional, Tuple
+from src.utils.duration import minutes_to_hours, minutes_to_whole_hours
 from src.utils.logger import get_logger
+from src.utils.version import parse_minor_version
 from src.analyzer.compatibility import CompatibilityAnalyzer
 
 logger = get_logger(__name__)
 
+# Optional (logging level, message) to report alongside a computed path
+_Notice = Optional[Tuple[int, str]]
+
+
+@functools.lru_cache(maxsize=256)
+def _compute_upgrade_path(
+    current_version: str, target_version: str
+) -> Tuple[Tuple[str, ...], _Notice]:
+    """
+    Compute the sequential upgrade path between two versions.
+
+    Results are cached, so anything to log is returned rather than logged
+    here, letting every caller report it.
+
+    Args:
+        current_version: Current EKS version
+        target_version: Target EKS version
+
+    Returns:
+        Tuple of (versions in upgrade sequence, notice to log)
+    """
+    # Parse versions as major.minor
+    current = parse_minor_version(current_version)
+    target = parse_minor_version(target_version)
+
+    if current is None or target is None:
+        return (current_version,), (logging.ERROR, "Invalid version format")
+
+    current_major, current_minor = current
+    target_major, target_minor = target
+
+    # Check if already at or beyond target
+    if current_major > target_major or (
+        current_major == target_major and current_minor >= target_minor
+    ):
+        return (current_version,), (
+            logging.WARNING,
+            "Current version is already at or beyond target",
+        )
+
+    # Generate sequential path (can't skip minor versions in EKS)
+    # Only handle same major version upgrades (typical for EKS)
+    if current_major == target_major:
+        prefix = f"{current_major}."
+        path = (current_version,) + tuple(
+            f"{prefix}{minor}" for minor in range(current_minor + 1, target_minor + 1)
+        )
+        return path, None
+
+    # Handle cross-major version (rare for EKS)
+    # First upgrade to latest minor in current major
+    # Then to target (this is simplified and may need refinement)
+    return (current_version, target_version), (
+        logging.WARNING,
+        "Cross-major version upgrade detected",
+    )
+
+
+# Pre-upgrade checklist items; create_pre_upgrade_checklist copies them and
+# fills in the target version of the breaking changes review
+_PRE_UPGRADE_CHECKLIST = (
+    {
+        "category": "Backup",
+        "task": "Backup etcd and cluster configuration",
+        "required": True,
+        "estimated_time": "30 minutes",
+        "description": "Create full cluster backup including etcd snapshots",
+    },
+    {
+        "category": "Backup",
+        "task": "Document current cluster state",
+        "required": True,
+        "estimated_time": "15 minutes",
+        "description": "Record current versions, node counts, and configurations",
+    },
+    {
+        "category": "Testing",
+        "task": "Test upgrade in non-production environment",
+        "required": True,
+        "estimated_time": "2-4 hours",
+        "description": "Perform complete upgrade test in staging/dev cluster",
+    },
+    {
+        "category": "Validation",
+        "task": "Review breaking changes and deprecations",
+        "required": True,
+        "estimated_time": "1 hour",
+        # Filled in per target version
+        "description": None,
+    },
+    {
+        "category": "Addon",
+        "task": "Verify addon compatibility",
+        "required": True,
+        "estimated_time": "30 minutes",
+        "description": "Ensure all addons are compatible with target version",
+    },
+    {
+        "category": "Workload",
+        "task": "Update deprecated API usage in manifests",
+        "required": True,
+        "estimated_time": "1-3 hours",
+        "description": "Update all workloads using deprecated APIs",
+    },
+    {
+        "category": "Planning",
+        "task": "Schedule maintenance window",
+        "required": True,
+        "estimated_time": "15 minutes",
+        "description": "Coordinate downtime window with stakeholders",
+    },
+    {
+        "category": "Rollback",
+        "task": "Prepare rollback plan",
+        "required": True,
+        "estimated_time": "30 minutes",
+        "description": "Document rollback procedure and test restoration",
+    },
+    {
+        "category": "Monitoring",
+        "task": "Set up enhanced monitoring",
+        "required": False,
+        "estimated_time": "20 minutes",
+        "description": "Configure alerts for upgrade process",
+    },
+    {
+        "category": "Access",
+        "task": "Verify IAM permissions",
+        "required": True,
+        "estimated_time": "10 minutes",
+        "description": "Ensure proper permissions for upgrade operations",
+    },
+)
+
+# Index of the breaking changes review in _PRE_UPGRADE_CHECKLIST
+_BREAKING_CHANGES_ITEM = 3
+
+# (upgrade priority, upgrade timing) for common addons; some must be
+# upgraded before EKS
+_ADDON_UPGRADE_ORDER = {
+    "vpc-cni": (1, "before_eks"),  # Network plugin, critical
+    "kube-proxy": (2, "before_eks"),  # Core networking
+    "coredns": (3, "before_eks"),  # DNS
+    "aws-ebs-csi-driver": (4, "after_eks"),  # Storage
+}
+_DEFAULT_ADDON_UPGRADE_ORDER = (99, "after_eks")  # Default low priority
+
+# Node group rotation steps per strategy, shared by every node group plan
+_NODE_GROUP_ROTATION_STEPS = {
+    "rolling": (
+        "Update node group AMI version",
+        "Set max unavailable to 1",
+        "Trigger rolling update",
+        "Monitor node replacement",
+        "Verify workload health",
+    ),
+    "blue-green": (
+        "Create new node group with target version",
+        "Cordon old nodes",
+        "Drain workloads to new nodes",
+        "Verify workload health",
+        "Delete old node group",
+    ),
+}
+
 
 class UpgradePathPlanner:
     """Planner for EKS upgrade paths."""
@@ -34,47 +204,13 @@ class UpgradePathPlanner:
         """
         logger.info(f"Generating upgrade path: {current_version} -> {target_version}")
 
-        try:
-            # Parse versions as major.minor
-            current_parts = current_version.split(".")
-            target_parts = target_version.split(".")
-
-            if len(current_parts) != 2 or len(target_parts) != 2:
-                logger.error("Invalid version format")
-                return [current_version]
-
-            current_major = int(current_parts[0])
-            current_minor = int(current_parts[1])
-            target_major = int(target_parts[0])
-            target_minor = int(target_parts[1])
-
-            # Check if already at or beyond target
-            if current_major > target_major or (
-                current_major == target_major and current_minor >= target_minor
-            ):
-                logger.warning("Current version is already at or beyond target")
-                return [current_version]
-
-            # Generate sequential path (can't skip minor versions in EKS)
-            path = [current_version]
-
-            # Only handle same major version upgrades (typical for EKS)
-            if current_major == target_major:
-                for minor in range(current_minor + 1, target_minor + 1):
-                    path.append(f"{current_major}.{minor}")
-            else:
-                # Handle cross-major version (rare for EKS)
-                logger.warning("Cross-major version upgrade detected")
-                # First upgrade to latest minor in current major
-                # Then to target (this is simplified and may need refinement)
-                path.append(target_version)
+        path, notice = _compute_upgrade_path(current_version, target_version)
+        if notice is not None:
+            logger.log(*notice)
 
+        if len(path) > 1:
             logger.info(f"Generated upgrade path: {' → '.join(path)}")
-            return path
-
-        except (ValueError, IndexError) as e:
-            logger.error(f"Failed to generate upgrade path: {e}")
-            return [current_version]
+        return list(path)
 
     def determine_addon_upgrade_order(
         self, addons: List[Dict[str, Any]]
@@ -90,30 +226,21 @@ class UpgradePathPlanner:
         """
         logger.info("Determining addon upgrade order")
 
-        # Priority order for common addons (some must be upgraded before EKS)
-        priority_order = {
-            "vpc-cni": 1,  # Network plugin, critical
-            "kube-proxy": 2,  # Core networking
-            "coredns": 3,  # DNS
-            "aws-ebs-csi-driver": 4,  # Storage
-        }
-
-        ordered_addons = []
+        # One bucket per known priority plus a last one for the default
+        # priority, so addons come out ordered (and stable) without a sort
+        buckets = [[] for _ in range(len(_ADDON_UPGRADE_ORDER) + 1)]
 
         for addon in addons:
-            addon_name = addon.get("name", "")
-            priority = priority_order.get(addon_name, 99)  # Default low priority
-
-            ordered_addons.append(
-                {
-                    **addon,
-                    "upgrade_priority": priority,
-                    "upgrade_timing": "before_eks" if priority <= 3 else "after_eks",
-                }
+            priority, timing = _ADDON_UPGRADE_ORDER.get(
+                addon.get("name", ""), _DEFAULT_ADDON_UPGRADE_ORDER
             )
 
-        # Sort by priority
-        ordered_addons.sort(key=lambda x: x["upgrade_priority"])
+            ordered_addon = addon.copy()
+            ordered_addon["upgrade_priority"] = priority
+            ordered_addon["upgrade_timing"] = timing
+            buckets[min(priority, len(buckets)) - 1].append(ordered_addon)
+
+        ordered_addons = list(itertools.chain.from_iterable(buckets))
 
         logger.info(f"Ordered {len(ordered_addons)} addons for upgrade")
         return ordered_addons
@@ -133,78 +260,10 @@ class UpgradePathPlanner:
         """
         logger.info("Creating pre-upgrade checklist")
 
-        checklist = [
-            {
-                "category": "Backup",
-                "task": "Backup etcd and cluster configuration",
-                "required": True,
-                "estimated_time": "30 minutes",
-                "description": "Create full cluster backup including etcd snapshots",
-            },
-            {
-                "category": "Backup",
-                "task": "Document current cluster state",
-                "required": True,
-                "estimated_time": "15 minutes",
-                "description": "Record current versions, node counts, and configurations",
-            },
-            {
-                "category": "Testing",
-                "task": "Test upgrade in non-production environment",
-                "required": True,
-                "estimated_time": "2-4 hours",
-                "description": "Perform complete upgrade test in staging/dev cluster",
-            },
-            {
-                "category": "Validation",
-                "task": "Review breaking changes and deprecations",
-                "required": True,
-                "estimated_time": "1 hour",
-                "description": f"Review all breaking changes for target version {target_version}",
-            },
-            {
-                "category": "Addon",
-                "task": "Verify addon compatibility",
-                "required": True,
-                "estimated_time": "30 minutes",
-                "description": "Ensure all addons are compatible with target version",
-            },
-            {
-                "category": "Workload",
-                "task": "Update deprecated API usage in manifests",
-                "required": True,
-                "estimated_time": "1-3 hours",
-                "description": "Update all workloads using deprecated APIs",
-            },
-            {
-                "category": "Planning",
-                "task": "Schedule maintenance window",
-                "required": True,
-                "estimated_time": "15 minutes",
-                "description": "Coordinate downtime window with stakeholders",
-            },
-            {
-                "category": "Rollback",
-                "task": "Prepare rollback plan",
-                "required": True,
-                "estimated_time": "30 minutes",
-                "description": "Document rollback procedure and test restoration",
-            },
-            {
-                "category": "Monitoring",
-                "task": "Set up enhanced monitoring",
-                "required": False,
-                "estimated_time": "20 minutes",
-                "description": "Configure alerts for upgrade process",
-            },
-            {
-                "category": "Access",
-                "task": "Verify IAM permissions",
-                "required": True,
-                "estimated_time": "10 minutes",
-                "description": "Ensure proper permissions for upgrade operations",
-            },
-        ]
+        checklist = [dict(item) for item in _PRE_UPGRADE_CHECKLIST]
+        checklist[_BREAKING_CHANGES_ITEM][
+            "description"
+        ] = f"Review all breaking changes for target version {target_version}"
 
         logger.info(f"Created checklist with {len(checklist)} items")
         return checklist
@@ -238,22 +297,9 @@ class UpgradePathPlanner:
                 "strategy": strategy,
             }
 
-            if strategy == "rolling":
-                ng_plan["steps"] = [
-                    "Update node group AMI version",
-                    "Set max unavailable to 1",
-                    "Trigger rolling update",
-                    "Monitor node replacement",
-                    "Verify workload health",
-                ]
-            elif strategy == "blue-green":
-                ng_plan["steps"] = [
-                    "Create new node group with target version",
-                    "Cordon old nodes",
-                    "Drain workloads to new nodes",
-                    "Verify workload health",
-                    "Delete old node group",
-                ]
+            steps = _NODE_GROUP_ROTATION_STEPS.get(strategy)
+            if steps is not None:
+                ng_plan["steps"] = steps
 
             rotation_plan["node_groups"].append(ng_plan)
 
@@ -266,6 +312,7 @@ class UpgradePathPlanner:
         upgrade_path: List[str],
         addons: List[Dict[str, Any]],
         node_groups: List[Dict[str, Any]],
+        ordered_addons: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
         """
         Create detailed step-by-step upgrade runbook.
@@ -275,20 +322,29 @@ class UpgradePathPlanner:
             upgrade_path: Upgrade path versions
             addons: Addons to upgrade
             node_groups: Node groups to rotate
+            ordered_addons: Result of determine_addon_upgrade_order for
+                ``addons``, if already computed
 
         Returns:
             Complete upgrade runbook
         """
         logger.info(f"Creating upgrade runbook for cluster {cluster_name}")
 
-        runbook = {
-            "cluster_name": cluster_name,
-            "upgrade_path": upgrade_path,
-            "phases": [],
-        }
-
-        # Phase 1: Pre-upgrade
-        runbook["phases"].append(
+        if ordered_addons is None:
+            ordered_addons = self.determine_addon_upgrade_order(addons)
+
+        # Split addons by upgrade timing in one pass
+        pre_eks_addons = []
+        post_eks_addons = []
+        for addon in ordered_addons:
+            timing = addon.get("upgrade_timing")
+            if timing == "before_eks":
+                pre_eks_addons.append(addon)
+            elif timing == "after_eks":
+                post_eks_addons.append(addon)
+
+        phases = [
+            # Phase 1: Pre-upgrade
             {
                 "phase": "Pre-Upgrade Preparation",
                 "duration": "2-4 hours",
@@ -298,31 +354,24 @@ class UpgradePathPlanner:
                     "Verify rollback plan",
                     "Communicate maintenance window",
                 ],
-            }
-        )
-
-        # Phase 2: Addon upgrades (before EKS)
-        ordered_addons = self.determine_addon_upgrade_order(addons)
-        pre_eks_addons = [
-            a for a in ordered_addons if a.get("upgrade_timing") == "before_eks"
-        ]
-
-        if pre_eks_addons:
-            addon_steps = []
-            for addon in pre_eks_addons:
-                addon_steps.append(f"Upgrade {addon.get('name')} to compatible version")
-
-            runbook["phases"].append(
-                {
-                    "phase": "Critical Addon Updates (Pre-EKS)",
-                    "duration": "30-60 minutes",
-                    "steps": addon_steps,
-                }
-            )
-
-        # Phase 3: EKS control plane upgrades
-        for i, version in enumerate(upgrade_path[1:], 1):
-            runbook["phases"].append(
+            },
+            # Phase 2: Addon upgrades (before EKS)
+            *(
+                [
+                    {
+                        "phase": "Critical Addon Updates (Pre-EKS)",
+                        "duration": "30-60 minutes",
+                        "steps": [
+                            f"Upgrade {addon.get('name')} to compatible version"
+                            for addon in pre_eks_addons
+                        ],
+                    }
+                ]
+                if pre_eks_addons
+                else []
+            ),
+            # Phase 3: EKS control plane upgrades
+            *(
                 {
                     "phase": f"EKS Control Plane Upgrade to {version}",
                     "duration": "30-45 minutes",
@@ -333,10 +382,9 @@ class UpgradePathPlanner:
                         "Check API server logs",
                     ],
                 }
-            )
-
-        # Phase 4: Node group updates
-        runbook["phases"].append(
+                for version in itertools.islice(upgrade_path, 1, None)
+            ),
+            # Phase 4: Node group updates
             {
                 "phase": "Node Group Updates",
                 "duration": "1-2 hours",
@@ -346,31 +394,23 @@ class UpgradePathPlanner:
                     "Monitor pod rescheduling",
                     "Verify all nodes are ready",
                 ],
-            }
-        )
-
-        # Phase 5: Post-upgrade addon updates
-        post_eks_addons = [
-            a for a in ordered_addons if a.get("upgrade_timing") == "after_eks"
-        ]
-
-        if post_eks_addons:
-            addon_steps = []
-            for addon in post_eks_addons:
-                addon_steps.append(
-                    f"Upgrade {addon.get('name')} to recommended version"
-                )
-
-            runbook["phases"].append(
-                {
-                    "phase": "Additional Addon Updates (Post-EKS)",
-                    "duration": "20-30 minutes",
-                    "steps": addon_steps,
-                }
-            )
-
-        # Phase 6: Validation
-        runbook["phases"].append(
+            },
+            # Phase 5: Post-upgrade addon updates
+            *(
+                [
+                    {
+                        "phase": "Additional Addon Updates (Post-EKS)",
+                        "duration": "20-30 minutes",
+                        "steps": [
+                            f"Upgrade {addon.get('name')} to recommended version"
+                            for addon in post_eks_addons
+                        ],
+                    }
+                ]
+                if post_eks_addons
+                else []
+            ),
+            # Phase 6: Validation
             {
                 "phase": "Post-Upgrade Validation",
                 "duration": "30-60 minutes",
@@ -383,8 +423,14 @@ class UpgradePathPlanner:
                     "Validate monitoring and alerts",
                     "Run smoke tests",
                 ],
-            }
-        )
+            },
+        ]
+
+        runbook = {
+            "cluster_name": cluster_name,
+            "upgrade_path": upgrade_path,
+            "phases": phases,
+        }
 
         logger.info(f"Created runbook with {len(runbook['phases'])} phases")
         return runbook
@@ -410,13 +456,17 @@ class UpgradePathPlanner:
         pre_upgrade_time = 120  # 2 hours for prep
         control_plane_time_per_version = 40  # 40 min per version upgrade
         node_rotation_time_per_group = 90  # 1.5 hours per node group
-        addon_time = 10 * len(addons)  # 10 min per addon
+        addon_time_per_addon = 10  # 10 min per addon
         validation_time = 45  # 45 min for validation
 
         # Calculate
         num_upgrades = len(upgrade_path) - 1  # Number of version jumps
+        num_node_groups = len(node_groups)
+        num_addons = len(addons)
+
         control_plane_time = control_plane_time_per_version * num_upgrades
-        node_time = node_rotation_time_per_group * len(node_groups)
+        node_time = node_rotation_time_per_group * num_node_groups
+        addon_time = addon_time_per_addon * num_addons
 
         total_minutes = (
             pre_upgrade_time
@@ -430,13 +480,14 @@ class UpgradePathPlanner:
             "breakdown": {
                 "pre_upgrade": f"{pre_upgrade_time} minutes",
                 "control_plane_upgrades": f"{control_plane_time} minutes ({num_upgrades} upgrades)",
-                "node_rotations": f"{node_time} minutes ({len(node_groups)} groups)",
-                "addon_upgrades": f"{addon_time} minutes ({len(addons)} addons)",
+                "node_rotations": f"{node_time} minutes ({num_node_groups} groups)",
+                "addon_upgrades": f"{addon_time} minutes ({num_addons} addons)",
                 "validation": f"{validation_time} minutes",
             },
             "total_minutes": total_minutes,
-            "total_hours": round(total_minutes / 60, 1),
-            "recommended_window": f"{round(total_minutes / 60 + 1)} hours",  # Add buffer
+            "total_hours": minutes_to_hours(total_minutes),
+            # Add an hour of buffer
+            "recommended_window": f"{minutes_to_whole_hours(total_minutes + 60)} hours",
         }
 
         logger.info(f"Estimated total upgrade time: {estimation['total_hours']} hours")
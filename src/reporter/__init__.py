@@ -1,11 +1,20 @@
 """Reporter package for EKS Upgrade Planner."""
 
-from src.reporter.markdown import MarkdownReporter
-from src.reporter.json_export import JSONExporter
-from src.reporter.html import HTMLReporter
+from src.utils.lazy import lazy_getattr
+
+# Each report format is imported on first attribute access (PEP 562), so
+# producing one format does not load the others
+_LAZY_IMPORTS = {
+    "MarkdownReporter": "src.reporter.markdown",
+    "JSONExporter": "src.reporter.json_export",
+    "HTMLReporter": "src.reporter.html",
+}
 
 __all__ = [
     "MarkdownReporter",
     "JSONExporter",
     "HTMLReporter",
 ]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
@@ -1,6 +1,6 @@
 """HTML report generator for EKS upgrade plans."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
 from datetime import datetime
 from src.utils.logger import get_logger
 
@@ -37,6 +37,43 @@ class HTMLReporter:
         Returns:
             HTML formatted report
         """
+        return "".join(
+            self.stream_report(
+                cluster_info,
+                scan_results,
+                analysis_results,
+                upgrade_plan,
+                risk_assessment,
+                migration_plan,
+            )
+        )
+
+    def stream_report(
+        self,
+        cluster_info: Dict[str, Any],
+        scan_results: Dict[str, Any],
+        analysis_results: Dict[str, Any],
+        upgrade_plan: Dict[str, Any],
+        risk_assessment: Dict[str, Any],
+        migration_plan: Dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Generate the HTML upgrade report one section at a time.
+
+        Sections are produced lazily, so they can be written out while the
+        rest of the report is still being formatted.
+
+        Args:
+            cluster_info: Cluster information
+            scan_results: Scan results
+            analysis_results: Analysis results
+            upgrade_plan: Upgrade plan
+            risk_assessment: Risk assessment
+            migration_plan: Migration plan
+
+        Yields:
+            Report chunks which concatenate to the full report
+        """
         logger.info("Generating HTML report")
 
         cluster = cluster_info.get("cluster", {})
@@ -58,7 +95,7 @@ class HTMLReporter:
         }
         risk_color = risk_colors.get(risk_level, "#6c757d")
 
-        html = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -97,18 +134,22 @@ class HTMLReporter:
             </ul>
         </nav>
 
-        {self._generate_summary_section(cluster_info, upgrade_plan, risk_assessment)}
-        {self._generate_current_state_section(cluster_info)}
-        {self._generate_upgrade_path_section(upgrade_plan)}
-        {self._generate_requirements_section(upgrade_plan, analysis_results)}
-        {self._generate_deprecated_apis_section(analysis_results)}
-        {self._generate_breaking_changes_section(analysis_results)}
-        {self._generate_migration_section(migration_plan)}
-        {self._generate_steps_section(upgrade_plan)}
-        {self._generate_risk_section(risk_assessment)}
-        {self._generate_rollback_section()}
-        {self._generate_timeline_section(upgrade_plan)}
-
+"""
+
+        # Sections are yielded one at a time as they are formatted
+        yield f"        {self._generate_summary_section(cluster_info, upgrade_plan, risk_assessment)}\n"
+        yield f"        {self._generate_current_state_section(cluster_info)}\n"
+        yield f"        {self._generate_upgrade_path_section(upgrade_plan)}\n"
+        yield f"        {self._generate_requirements_section(upgrade_plan, analysis_results)}\n"
+        yield f"        {self._generate_deprecated_apis_section(analysis_results)}\n"
+        yield f"        {self._generate_breaking_changes_section(analysis_results)}\n"
+        yield f"        {self._generate_migration_section(migration_plan)}\n"
+        yield f"        {self._generate_steps_section(upgrade_plan)}\n"
+        yield f"        {self._generate_risk_section(risk_assessment)}\n"
+        yield f"        {self._generate_rollback_section()}\n"
+        yield f"        {self._generate_timeline_section(upgrade_plan)}\n"
+
+        yield """
         <footer>
             <p>Generated by EKS Upgrade Planner v1.0.0</p>
         </footer>
@@ -117,7 +158,6 @@ class HTMLReporter:
 </html>"""
 
         logger.info("HTML report generated successfully")
-        return html
 
     def _get_css(self) -> str:
         """Get CSS styling for HTML report."""
@@ -1,13 +1,53 @@
 """JSON export for EKS upgrade plans."""
 
-import json
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Optional
 from datetime import datetime
 from src.utils.logger import get_logger
+from src.utils.serialization import dumps
 
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _run_timestamp() -> str:
+    """
+    Get the timestamp of this run, taken on first use.
+
+    Returns:
+        ISO 8601 timestamp shared by all reports generated in the process
+    """
+    return datetime.now().isoformat()
+
+
+def _prune_empty(value: Any) -> Any:
+    """
+    Recursively drop None values and empty containers from mappings.
+
+    List items are pruned but kept in place, so positions do not shift.
+    False and zero are kept, as they carry information.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        Pruned copy of the value
+    """
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            item = _prune_empty(item)
+            if item is None or (isinstance(item, (dict, list)) and not item):
+                continue
+            pruned[key] = item
+        return pruned
+
+    if isinstance(value, (list, tuple)):
+        return [_prune_empty(item) for item in value]
+
+    return value
+
+
 class JSONExporter:
     """Export upgrade plans in JSON format for programmatic consumption."""
 
@@ -23,6 +63,8 @@ class JSONExporter:
         upgrade_plan: Dict[str, Any],
         risk_assessment: Dict[str, Any],
         migration_plan: Dict[str, Any],
+        generated_at: Optional[str] = None,
+        omit_empty: bool = False,
     ) -> str:
         """
         Export comprehensive upgrade report as JSON.
@@ -34,30 +76,72 @@ class JSONExporter:
             upgrade_plan: Upgrade plan
             risk_assessment: Risk assessment
             migration_plan: Migration plan
+            generated_at: Report timestamp (defaults to the time of the
+                first report generated in this run)
+            omit_empty: Leave out None values and empty sections
 
         Returns:
             JSON formatted string
         """
+        return self.export_report_bytes(
+            cluster_info,
+            scan_results,
+            analysis_results,
+            upgrade_plan,
+            risk_assessment,
+            migration_plan,
+            generated_at,
+            omit_empty,
+        ).decode("utf-8")
+
+    def export_report_bytes(
+        self,
+        cluster_info: Dict[str, Any],
+        scan_results: Dict[str, Any],
+        analysis_results: Dict[str, Any],
+        upgrade_plan: Dict[str, Any],
+        risk_assessment: Dict[str, Any],
+        migration_plan: Dict[str, Any],
+        generated_at: Optional[str] = None,
+        omit_empty: bool = False,
+    ) -> bytes:
+        """
+        Export comprehensive upgrade report as UTF-8 encoded JSON.
+
+        Serializes with orjson when it is installed, so the report can be
+        written out without building an intermediate string.
+
+        Args:
+            cluster_info: Cluster information
+            scan_results: Scan results
+            analysis_results: Analysis results
+            upgrade_plan: Upgrade plan
+            risk_assessment: Risk assessment
+            migration_plan: Migration plan
+            generated_at: Report timestamp (defaults to the time of the
+                first report generated in this run)
+            omit_empty: Leave out None values and empty sections
+
+        Returns:
+            Encoded JSON document
+        """
         logger.info("Generating JSON export")
 
+        cluster = cluster_info.get("cluster") or {}
+        upgrade_path = upgrade_plan.get("upgrade_path") or []
+
         report = {
             "metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": generated_at or _run_timestamp(),
                 "tool": "eks-upgrade-planner",
                 "version": "1.0.0",
             },
             "cluster": {
-                "name": cluster_info.get("cluster", {}).get("name"),
-                "current_version": cluster_info.get("cluster", {}).get("version"),
-                "target_version": (
-                    upgrade_plan.get("upgrade_path", [])[-1]
-                    if upgrade_plan.get("upgrade_path")
-                    else None
-                ),
-                "region": cluster_info.get("cluster", {})
-                .get("vpc_config", {})
-                .get("vpcId"),
-                "status": cluster_info.get("cluster", {}).get("status"),
+                "name": cluster.get("name"),
+                "current_version": cluster.get("version"),
+                "target_version": upgrade_path[-1] if upgrade_path else None,
+                "region": cluster.get("vpc_config", {}).get("vpcId"),
+                "status": cluster.get("status"),
             },
             "scan_results": scan_results,
             "analysis": {
@@ -87,7 +171,10 @@ class JSONExporter:
             "migration_plan": migration_plan,
         }
 
-        json_output = json.dumps(report, indent=2, default=str)
+        if omit_empty:
+            report = _prune_empty(report)
+
+        json_output = dumps(report, indent=True, default=str)
         logger.info("JSON export generated successfully")
         return json_output
 
@@ -110,31 +197,27 @@ class JSONExporter:
         """
         logger.info("Generating JSON summary")
 
+        cluster = cluster_info.get("cluster") or {}
+        upgrade_path = upgrade_plan.get("upgrade_path") or []
+        assessments = risk_assessment.get("individual_assessments") or {}
+
         summary = {
-            "cluster_name": cluster_info.get("cluster", {}).get("name"),
-            "current_version": cluster_info.get("cluster", {}).get("version"),
-            "target_version": (
-                upgrade_plan.get("upgrade_path", [])[-1]
-                if upgrade_plan.get("upgrade_path")
-                else None
-            ),
+            "cluster_name": cluster.get("name"),
+            "current_version": cluster.get("version"),
+            "target_version": upgrade_path[-1] if upgrade_path else None,
             "risk_level": risk_assessment.get("overall_risk"),
-            "version_jumps": len(upgrade_plan.get("upgrade_path", [])) - 1,
+            "version_jumps": len(upgrade_path) - 1,
             "estimated_hours": upgrade_plan.get("time_estimation", {}).get(
                 "total_hours"
             ),
             "node_groups": len(cluster_info.get("node_groups", [])),
             "addons": len(cluster_info.get("addons", [])),
             "deprecated_api_count": len(
-                risk_assessment.get("individual_assessments", {})
-                .get("deprecated_apis", {})
-                .get("deprecated_apis", {})
+                assessments.get("deprecated_apis", {}).get("deprecated_apis", {})
             ),
             "breaking_changes_count": len(
-                risk_assessment.get("individual_assessments", {})
-                .get("breaking_changes", {})
-                .get("breaking_changes", [])
+                assessments.get("breaking_changes", {}).get("breaking_changes", [])
             ),
         }
 
-        return json.dumps(summary, indent=2)
+        return dumps(summary, indent=True).decode("utf-8")
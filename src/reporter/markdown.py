@@ -1,6 +1,6 @@
 """Markdown report generator for EKS upgrade plans."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterator, List
 from datetime import datetime
 from src.utils.logger import get_logger
 
@@ -37,58 +37,89 @@ class MarkdownReporter:
         Returns:
             Markdown formatted report
         """
-        logger.info("Generating Markdown report")
+        return "".join(
+            self.stream_report(
+                cluster_info,
+                scan_results,
+                analysis_results,
+                upgrade_plan,
+                risk_assessment,
+                migration_plan,
+            )
+        )
+
+    def stream_report(
+        self,
+        cluster_info: Dict[str, Any],
+        scan_results: Dict[str, Any],
+        analysis_results: Dict[str, Any],
+        upgrade_plan: Dict[str, Any],
+        risk_assessment: Dict[str, Any],
+        migration_plan: Dict[str, Any],
+    ) -> Iterator[str]:
+        """
+        Generate the Markdown upgrade report one section at a time.
 
-        sections = []
+        Sections are produced lazily, so they can be written out while the
+        rest of the report is still being formatted.
+
+        Args:
+            cluster_info: Cluster information
+            scan_results: Scan results
+            analysis_results: Analysis results
+            upgrade_plan: Upgrade plan
+            risk_assessment: Risk assessment
+            migration_plan: Migration plan
+
+        Yields:
+            Report chunks which concatenate to the full report
+        """
+        logger.info("Generating Markdown report")
 
         # Title and metadata
-        sections.append(self._generate_header(cluster_info, upgrade_plan))
+        yield self._generate_header(cluster_info, upgrade_plan)
 
         # Executive summary
-        sections.append(
-            self._generate_executive_summary(
-                cluster_info, upgrade_plan, risk_assessment
-            )
+        yield "\n\n" + self._generate_executive_summary(
+            cluster_info, upgrade_plan, risk_assessment
         )
 
         # Current state
-        sections.append(self._generate_current_state(cluster_info, scan_results))
+        yield "\n\n" + self._generate_current_state(cluster_info, scan_results)
 
         # Upgrade path
-        sections.append(self._generate_upgrade_path(upgrade_plan))
+        yield "\n\n" + self._generate_upgrade_path(upgrade_plan)
 
         # Pre-upgrade requirements
-        sections.append(
-            self._generate_pre_upgrade_requirements(upgrade_plan, analysis_results)
+        yield "\n\n" + self._generate_pre_upgrade_requirements(
+            upgrade_plan, analysis_results
         )
 
         # Deprecated APIs
         if analysis_results.get("deprecated_apis"):
-            sections.append(self._generate_deprecated_apis(analysis_results))
+            yield "\n\n" + self._generate_deprecated_apis(analysis_results)
 
         # Breaking changes
         if analysis_results.get("breaking_changes"):
-            sections.append(self._generate_breaking_changes(analysis_results))
+            yield "\n\n" + self._generate_breaking_changes(analysis_results)
 
         # Migration requirements
         if migration_plan.get("migration_required"):
-            sections.append(self._generate_migration_requirements(migration_plan))
+            yield "\n\n" + self._generate_migration_requirements(migration_plan)
 
         # Detailed upgrade steps
-        sections.append(self._generate_upgrade_steps(upgrade_plan))
+        yield "\n\n" + self._generate_upgrade_steps(upgrade_plan)
 
         # Risk assessment
-        sections.append(self._generate_risk_assessment(risk_assessment))
+        yield "\n\n" + self._generate_risk_assessment(risk_assessment)
 
         # Rollback plan
-        sections.append(self._generate_rollback_plan())
+        yield "\n\n" + self._generate_rollback_plan()
 
         # Timeline
-        sections.append(self._generate_timeline(upgrade_plan))
+        yield "\n\n" + self._generate_timeline(upgrade_plan)
 
-        report = "\n\n".join(sections)
         logger.info("Markdown report generated successfully")
-        return report
 
     def _generate_header(
         self, cluster_info: Dict[str, Any], upgrade_plan: Dict[str, Any]
@@ -1,9 +1,18 @@
 """Scanner package for EKS Upgrade Planner."""
 
-from src.scanner.eks_scanner import EKSScanner
-from src.scanner.k8s_scanner import K8sScanner
+from src.utils.lazy import lazy_getattr
+
+# Scanners import boto3 and the kubernetes client, so they are imported on
+# first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "EKSScanner": "src.scanner.eks_scanner",
+    "K8sScanner": "src.scanner.k8s_scanner",
+}
 
 __all__ = [
     "EKSScanner",
     "K8sScanner",
 ]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
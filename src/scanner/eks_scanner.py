@@ -1,12 +1,16 @@
 """EKS cluster scanner for EKS Upgrade Planner."""
 
-from typing import Dict, Any, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from botocore.exceptions import ClientError
 from src.utils.logger import get_logger
 from src.utils.aws_helper import AWSHelper
 
 logger = get_logger(__name__)
 
+# Concurrent EKS API calls per cluster scan
+_MAX_SCAN_WORKERS = 8
+
 
 class EKSScanner:
     """Scanner for EKS cluster information."""
@@ -220,6 +224,49 @@ class EKSScanner:
             logger.error(f"Failed to describe addon versions: {e}")
             raise
 
+    @staticmethod
+    def _submit_describes(
+        submit: Callable[..., Future],
+        describe: Callable[[str, str], Dict[str, Any]],
+        cluster_name: str,
+        names: List[str],
+    ) -> List[Tuple[str, Future]]:
+        """
+        Submit a describe call for each named cluster resource.
+
+        Args:
+            submit: Submits a call to the scan's executor
+            describe: Describe method taking (cluster_name, name)
+            cluster_name: Name of the cluster
+            names: Resource names
+
+        Returns:
+            List of (name, future) pairs in input order
+        """
+        return [(name, submit(describe, cluster_name, name)) for name in names]
+
+    @staticmethod
+    def _collect_describes(
+        futures: List[Tuple[str, Future]], kind: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Collect describe results, skipping resources that failed.
+
+        Args:
+            futures: List of (name, future) pairs
+            kind: Resource kind used in warnings
+
+        Returns:
+            Details of the resources described successfully, in input order
+        """
+        results = []
+        for name, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"Failed to get details for {kind} {name}: {e}")
+        return results
+
     def scan_cluster(self, cluster_name: str) -> Dict[str, Any]:
         """
         Perform a complete scan of an EKS cluster.
@@ -232,28 +279,45 @@ class EKSScanner:
         """
         logger.info(f"Starting complete scan of cluster: {cluster_name}")
 
-        # Get cluster details
-        cluster_info = self.describe_cluster(cluster_name)
+        # The EKS calls are independent round trips, so they run concurrently
+        # on the (thread-safe) boto3 client
+        executor = ThreadPoolExecutor(max_workers=_MAX_SCAN_WORKERS)
+        submitted: List[Future] = []
 
-        # Get node groups
-        node_group_names = self.list_node_groups(cluster_name)
-        node_groups = []
-        for ng_name in node_group_names:
-            try:
-                ng_info = self.describe_node_group(cluster_name, ng_name)
-                node_groups.append(ng_info)
-            except Exception as e:
-                logger.warning(f"Failed to get details for node group {ng_name}: {e}")
+        def submit(fn: Callable[..., Any], *args: Any) -> Future:
+            future = executor.submit(fn, *args)
+            submitted.append(future)
+            return future
 
-        # Get addons
-        addon_names = self.list_addons(cluster_name)
-        addons = []
-        for addon_name in addon_names:
-            try:
-                addon_info = self.describe_addon(cluster_name, addon_name)
-                addons.append(addon_info)
-            except Exception as e:
-                logger.warning(f"Failed to get details for addon {addon_name}: {e}")
+        try:
+            cluster_future = submit(self.describe_cluster, cluster_name)
+            node_groups_future = submit(self.list_node_groups, cluster_name)
+            addons_future = submit(self.list_addons, cluster_name)
+
+            node_group_futures = self._submit_describes(
+                submit,
+                self.describe_node_group,
+                cluster_name,
+                node_groups_future.result(),
+            )
+            addon_futures = self._submit_describes(
+                submit, self.describe_addon, cluster_name, addons_future.result()
+            )
+
+            # Get cluster details
+            cluster_info = cluster_future.result()
+
+            # Get node groups
+            node_groups = self._collect_describes(node_group_futures, "node group")
+
+            # Get addons
+            addons = self._collect_describes(addon_futures, "addon")
+        finally:
+            # Drop calls still queued if the scan failed or was interrupted,
+            # so they do not reach AWS after the scan is over
+            for future in submitted:
+                future.cancel()
+            executor.shutdown(wait=False)
 
         result = {
             "cluster": cluster_info,
@@ -3,12 +3,7 @@
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
 from src.utils.logger import get_logger
-from src.utils.k8s_helper import K8sHelper
-
-try:
-    from kubernetes.client.exceptions import ApiException
-except ImportError:
-    ApiException = Exception
+from src.utils.k8s_helper import K8sHelper, get_api_exception
 
 logger = get_logger(__name__)
 
@@ -126,7 +121,7 @@ class K8sScanner:
                 )
 
             logger.info(f"Scanned {len(deployments)} deployments")
-        except ApiException as e:
+        except get_api_exception() as e:
             logger.error(f"Failed to scan deployments: {e}")
 
         return deployments
@@ -165,7 +160,7 @@ class K8sScanner:
                 )
 
             logger.info(f"Scanned {len(statefulsets)} statefulsets")
-        except ApiException as e:
+        except get_api_exception() as e:
             logger.error(f"Failed to scan statefulsets: {e}")
 
         return statefulsets
@@ -203,7 +198,7 @@ class K8sScanner:
                 )
 
             logger.info(f"Scanned {len(daemonsets)} daemonsets")
-        except ApiException as e:
+        except get_api_exception() as e:
             logger.error(f"Failed to scan daemonsets: {e}")
 
         return daemonsets
@@ -245,7 +240,7 @@ class K8sScanner:
                 )
 
             logger.info(f"Scanned {len(crds)} CRDs")
-        except ApiException as e:
+        except get_api_exception() as e:
             logger.error(f"Failed to scan CRDs: {e}")
 
         return crds
@@ -283,7 +278,7 @@ class K8sScanner:
                 )
 
             logger.info(f"Scanned {len(ingresses)} ingresses")
-        except ApiException as e:
+        except get_api_exception() as e:
             logger.error(f"Failed to scan ingresses: {e}")
 
         return ingresses
@@ -1,9 +1,20 @@
 """Utilities package for EKS Upgrade Planner."""
 
-from src.utils.logger import setup_logger, get_logger
-from src.utils.aws_helper import AWSHelper
-from src.utils.k8s_helper import K8sHelper
-from src.utils.cache import Cache
+from src.utils.lazy import lazy_getattr
+
+# AWS and Kubernetes helpers import boto3 and the kubernetes client, so
+# utilities are imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "setup_logger": "src.utils.logger",
+    "get_logger": "src.utils.logger",
+    "AWSHelper": "src.utils.aws_helper",
+    "K8sHelper": "src.utils.k8s_helper",
+    "Cache": "src.utils.cache",
+    "parse_version": "src.utils.version",
+    "parse_minor_version": "src.utils.version",
+    "minutes_to_hours": "src.utils.duration",
+    "minutes_to_whole_hours": "src.utils.duration",
+}
 
 __all__ = [
     "setup_logger",
@@ -11,4 +22,11 @@ __all__ = [
     "AWSHelper",
     "K8sHelper",
     "Cache",
+    "parse_version",
+    "parse_minor_version",
+    "minutes_to_hours",
+    "minutes_to_whole_hours",
 ]
+
+
+__getattr__ = lazy_getattr(__name__, _LAZY_IMPORTS)
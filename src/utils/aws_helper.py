@@ -1,12 +1,44 @@
 """AWS helper utilities for EKS Upgrade Planner."""
 
+import functools
+import hashlib
 import boto3
 from typing import Optional, Dict, Any
+from botocore.config import Config
 from botocore.exceptions import ClientError, BotoCoreError, NoCredentialsError
+from src.utils.cache import Cache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Default client configuration: a connection pool large enough for
+# concurrent scans, adaptive retries for throttled EKS APIs, and TCP
+# keepalive on pooled connections. botocore already disables Nagle's
+# algorithm (TCP_NODELAY) on its sockets. The EKS and STS calls made here
+# are small, so short timeouts fail fast into a retry instead of waiting
+# out botocore's 60 second defaults.
+DEFAULT_CLIENT_CONFIG = Config(
+    connect_timeout=3,
+    read_timeout=10,
+    max_pool_connections=32,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+)
+
+# How long a successful credential check is trusted, across invocations
+CREDENTIALS_CACHE_TTL_MINUTES = 5
+
+
+@functools.lru_cache(maxsize=1)
+def _get_credentials_cache() -> Cache:
+    """
+    Get the cache holding recently validated AWS identities.
+
+    Returns:
+        Cache shared by all AWS helpers in the process
+    """
+    return Cache(ttl_hours=CREDENTIALS_CACHE_TTL_MINUTES / 60)
+
 
 class AWSHelper:
     """Helper class for AWS session and client management."""
@@ -23,6 +55,7 @@ class AWSHelper:
         self.profile = profile
         self._session: Optional[boto3.Session] = None
         self._clients: Dict[str, Any] = {}
+        self._account_id: Optional[str] = None
 
     @property
     def session(self) -> boto3.Session:
@@ -54,6 +87,9 @@ class AWSHelper:
         """
         Get or create AWS service client.
 
+        Clients are created with DEFAULT_CLIENT_CONFIG, merged with any
+        ``config`` passed in kwargs.
+
         Args:
             service_name: AWS service name (e.g., 'eks', 'ec2')
             **kwargs: Additional client configuration
@@ -73,6 +109,14 @@ class AWSHelper:
                 if self.region and "region_name" not in client_kwargs:
                     client_kwargs["region_name"] = self.region
 
+                # Caller-supplied settings take precedence over the defaults
+                config = client_kwargs.get("config")
+                client_kwargs["config"] = (
+                    DEFAULT_CLIENT_CONFIG.merge(config)
+                    if config is not None
+                    else DEFAULT_CLIENT_CONFIG
+                )
+
                 self._clients[cache_key] = self.session.client(
                     service_name, **client_kwargs
                 )
@@ -92,13 +136,33 @@ class AWSHelper:
         """
         Validate AWS credentials.
 
+        The account returned by STS GetCallerIdentity is cached for
+        CREDENTIALS_CACHE_TTL_MINUTES, keyed by profile, region and a hash of
+        the access key, so subsequent commands skip the STS round trip.
+
         Returns:
             True if credentials are valid, False otherwise
         """
         try:
-            sts = self.get_client("sts")
-            identity = sts.get_caller_identity()
-            logger.info(f"AWS credentials validated for account: {identity['Account']}")
+            credentials = self.session.get_credentials()
+            if credentials is None:
+                raise NoCredentialsError()
+
+            key_hash = hashlib.sha256(credentials.access_key.encode()).hexdigest()
+            cache_key = (
+                f"sts_{self.profile or 'default'}_{self.region or 'default'}"
+                f"_{key_hash[:16]}"
+            )
+            cache = _get_credentials_cache()
+
+            account_id = cache.get(cache_key)
+            if account_id is None:
+                sts = self.get_client("sts")
+                account_id = sts.get_caller_identity()["Account"]
+                cache.set(cache_key, account_id)
+
+            self._account_id = account_id
+            logger.info(f"AWS credentials validated for account: {account_id}")
             return True
         except NoCredentialsError:
             logger.error("No AWS credentials found")
@@ -117,10 +181,14 @@ class AWSHelper:
         Returns:
             Account ID or None if failed
         """
+        if self._account_id is not None:
+            return self._account_id
+
         try:
             sts = self.get_client("sts")
             identity = sts.get_caller_identity()
-            return identity["Account"]
+            self._account_id = identity["Account"]
+            return self._account_id
         except Exception as e:
             logger.error(f"Failed to get account ID: {e}")
             return None
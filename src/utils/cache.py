@@ -1,19 +1,43 @@
 """Cache utility for EKS Upgrade Planner."""
 
-import json
+import atexit
+import copy
+import os
 import pickle
+import threading
+import weakref
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from src.utils.logger import get_logger
+from src.utils.serialization import dumps, loads
 
 logger = get_logger(__name__)
 
+_MISSING = object()
+
+# Live caches, flushed together at interpreter exit
+_instances: "weakref.WeakSet[Cache]" = weakref.WeakSet()
+
+
+def _flush_all() -> None:
+    """Flush every live cache."""
+    for cache in list(_instances):
+        cache.flush()
+
+
+atexit.register(_flush_all)
+
 
 class Cache:
-    """Simple file-based cache with TTL support."""
+    """
+    Simple file-based cache with TTL support.
 
-    def __init__(self, cache_dir: Optional[Path] = None, ttl_hours: int = 24):
+    Entries are kept in memory once read or written. Writes are batched and
+    reach the disk on flush(), which also runs at interpreter exit.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl_hours: float = 24):
         """
         Initialize cache.
 
@@ -27,6 +51,14 @@ class Cache:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(hours=ttl_hours)
+
+        # key -> (stored at, value) for entries this instance has seen
+        self._memory: Dict[str, Tuple[datetime, Any]] = {}
+        # key -> (stored at, serialized value) for entries not yet on disk
+        self._pending: Dict[str, Tuple[datetime, bytes]] = {}
+        self._lock = threading.Lock()
+        _instances.add(self)
+
         logger.debug(f"Cache initialized at: {self.cache_dir}")
 
     def _get_cache_path(self, key: str) -> Path:
@@ -44,39 +76,103 @@ class Cache:
         age = datetime.now() - mtime
         return age > self.ttl
 
-    def get(self, key: str, default: Any = None) -> Any:
+    def _recall(self, key: str) -> Any:
         """
-        Get value from cache.
+        Look up an entry in memory, dropping it if it has expired.
 
         Args:
             key: Cache key
-            default: Default value if key not found or expired
 
         Returns:
-            Cached value or default
+            Copy of the cached value, or _MISSING if absent or expired
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return _MISSING
+
+            stored_at, value = entry
+            if datetime.now() - stored_at > self.ttl:
+                del self._memory[key]
+                return _MISSING
+
+        return copy.deepcopy(value)
+
+    def _remember(self, key: str, value: Any, as_json: bool) -> bool:
+        """
+        Store an entry in memory and queue it for writing.
+
+        The value is serialized up front so that values which cannot be
+        written are rejected here rather than at flush time.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            as_json: Whether the entry is written as JSON rather than pickle
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            data = dumps(value, indent=True) if as_json else pickle.dumps(value)
+            value = copy.deepcopy(value)
+        except Exception as e:
+            logger.warning(f"Failed to cache value for key {key}: {e}")
+            return False
+
+        stored_at = datetime.now()
+        with self._lock:
+            self._memory[key] = (stored_at, value)
+            self._pending[key] = (stored_at, data)
+
+        logger.debug(f"Cached value for key: {key}")
+        return True
+
+    def _load(self, key: str, as_json: bool) -> Any:
+        """
+        Read an entry from disk into memory.
+
+        Args:
+            key: Cache key
+            as_json: Whether the entry is stored as JSON rather than pickle
+
+        Returns:
+            Cached value, or _MISSING if absent, expired or unreadable
         """
         cache_path = self._get_cache_path(key)
 
         if self._is_expired(cache_path):
             logger.debug(f"Cache miss or expired for key: {key}")
-            return default
+            return _MISSING
 
         try:
+            stored_at = datetime.fromtimestamp(cache_path.stat().st_mtime)
             with open(cache_path, "rb") as f:
-                value = pickle.load(f)
-            logger.debug(f"Cache hit for key: {key}")
-            return value
+                value = loads(f.read()) if as_json else pickle.load(f)
         except Exception as e:
             logger.warning(f"Failed to read cache for key {key}: {e}")
-            return default
-
-    def set(self, key: str, value: Any) -> bool:
+            return _MISSING
+
+        logger.debug(f"Cache hit for key: {key}")
+        with self._lock:
+            # Another thread may have set a newer value since _recall()
+            entry = self._memory.get(key)
+            if entry is not None and entry[0] > stored_at:
+                return copy.deepcopy(entry[1])
+            self._memory[key] = (stored_at, copy.deepcopy(value))
+        return value
+
+    def _write(self, key: str, stored_at: datetime, data: bytes) -> bool:
         """
-        Set value in cache.
+        Write an entry to disk.
+
+        The file's modification time is set to when the entry was stored, so
+        the TTL keeps counting from set() rather than from the flush.
 
         Args:
             key: Cache key
-            value: Value to cache
+            stored_at: When the entry was set
+            data: Serialized value
 
         Returns:
             True if successful, False otherwise
@@ -85,13 +181,69 @@ class Cache:
 
         try:
             with open(cache_path, "wb") as f:
-                pickle.dump(value, f)
-            logger.debug(f"Cached value for key: {key}")
+                f.write(data)
+            timestamp = stored_at.timestamp()
+            os.utime(cache_path, (timestamp, timestamp))
             return True
         except Exception as e:
             logger.warning(f"Failed to write cache for key {key}: {e}")
             return False
 
+    def flush(self) -> bool:
+        """
+        Write pending entries to disk.
+
+        Returns:
+            True if every pending entry was written, False otherwise
+        """
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        if not pending:
+            return True
+
+        # Nothing to write back into a cache directory that has been removed
+        if not self.cache_dir.is_dir():
+            logger.debug(f"Cache directory removed, dropping {len(pending)} entries")
+            return False
+
+        written = True
+        for key, (stored_at, data) in pending.items():
+            written = self._write(key, stored_at, data) and written
+
+        logger.debug(f"Flushed {len(pending)} cache entries")
+        return written
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get value from cache.
+
+        Args:
+            key: Cache key
+            default: Default value if key not found or expired
+
+        Returns:
+            Cached value or default
+        """
+        value = self._recall(key)
+        if value is _MISSING:
+            value = self._load(key, as_json=False)
+
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        Set value in cache.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._remember(key, value, as_json=False)
+
     def delete(self, key: str) -> bool:
         """
         Delete cache entry.
@@ -104,6 +256,10 @@ class Cache:
         """
         cache_path = self._get_cache_path(key)
 
+        with self._lock:
+            self._memory.pop(key, None)
+            self._pending.pop(key, None)
+
         try:
             if cache_path.exists():
                 cache_path.unlink()
@@ -120,6 +276,10 @@ class Cache:
         Returns:
             True if successful, False otherwise
         """
+        with self._lock:
+            self._memory.clear()
+            self._pending.clear()
+
         try:
             for cache_file in self.cache_dir.glob("*.cache"):
                 cache_file.unlink()
@@ -140,17 +300,11 @@ class Cache:
         Returns:
             Cached JSON value or default
         """
-        cache_path = self._get_cache_path(key)
-
-        if self._is_expired(cache_path):
-            return default
+        value = self._recall(key)
+        if value is _MISSING:
+            value = self._load(key, as_json=True)
 
-        try:
-            with open(cache_path, "r") as f:
-                return json.load(f)
-        except Exception as e:
-            logger.warning(f"Failed to read JSON cache for key {key}: {e}")
-            return default
+        return default if value is _MISSING else value
 
     def set_json(self, key: str, value: Any) -> bool:
         """
@@ -163,12 +317,4 @@ class Cache:
         Returns:
             True if successful, False otherwise
         """
-        cache_path = self._get_cache_path(key)
-
-        try:
-            with open(cache_path, "w") as f:
-                json.dump(value, f, indent=2)
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to write JSON cache for key {key}: {e}")
-            return False
+        return self._remember(key, value, as_json=True)
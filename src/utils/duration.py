@@ -0,0 +1,38 @@
+"""Duration formatting utility for EKS Upgrade Planner."""
+
+
+def minutes_to_hours(minutes: int) -> float:
+    """
+    Convert whole minutes to hours, rounded to one decimal place.
+
+    Uses integer arithmetic, rounding half to even on the exact value. For
+    multiples of five minutes this matches round(minutes / 60, 1).
+
+    Args:
+        minutes: Number of minutes
+
+    Returns:
+        Hours with one decimal place
+    """
+    tenths, remainder = divmod(minutes, 6)
+    if remainder > 3 or (remainder == 3 and tenths % 2):
+        tenths += 1
+    return tenths / 10
+
+
+def minutes_to_whole_hours(minutes: int) -> int:
+    """
+    Convert whole minutes to a whole number of hours.
+
+    Uses integer arithmetic, rounding half to even like round(minutes / 60).
+
+    Args:
+        minutes: Number of minutes
+
+    Returns:
+        Hours rounded to the nearest whole hour
+    """
+    hours, remainder = divmod(minutes, 60)
+    if remainder > 30 or (remainder == 30 and hours % 2):
+        hours += 1
+    return hours
@@ -1,21 +1,56 @@
 """Kubernetes helper utilities for EKS Upgrade Planner."""
 
-from typing import Optional, Any
+from typing import Optional, Any, Type
 from pathlib import Path
+import functools
 import os
 
-try:
-    from kubernetes import client, config
-    from kubernetes.client.exceptions import ApiException
-except ImportError:
-    client = None
-    config = None
-    ApiException = Exception
-
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# The kubernetes client is imported by the first K8sHelper, so modules that
+# import this one without talking to a cluster do not pay its import cost
+client = None
+config = None
+
+
+def _import_kubernetes() -> None:
+    """
+    Import the kubernetes client and config modules.
+
+    Raises:
+        ImportError: If the kubernetes library is not installed
+    """
+    global client, config
+
+    if client is None or config is None:
+        try:
+            from kubernetes import client as k8s_client, config as k8s_config
+        except ImportError:
+            raise ImportError("kubernetes library not installed")
+
+        client, config = k8s_client, k8s_config
+
+
+@functools.lru_cache(maxsize=None)
+def get_api_exception() -> Type[Exception]:
+    """
+    Get the exception type the kubernetes client raises for API errors.
+
+    Only looked up when an exception is being handled, so the client is
+    not imported just to name it in an except clause.
+
+    Returns:
+        kubernetes ApiException, or Exception if the library is not installed
+    """
+    try:
+        from kubernetes.client.exceptions import ApiException
+    except ImportError:
+        return Exception
+
+    return ApiException
+
 
 class K8sHelper:
     """Helper class for Kubernetes client management."""
@@ -28,8 +63,7 @@ class K8sHelper:
             kubeconfig: Path to kubeconfig file (defaults to ~/.kube/config)
             context: Kubernetes context name (defaults to current context)
         """
-        if client is None or config is None:
-            raise ImportError("kubernetes library not installed")
+        _import_kubernetes()
 
         self.kubeconfig = kubeconfig or os.environ.get(
             "KUBECONFIG", str(Path.home() / ".kube" / "config")
@@ -0,0 +1,32 @@
+"""Lazy attribute imports for EKS Upgrade Planner packages."""
+
+import importlib
+import sys
+from typing import Any, Callable, Mapping
+
+
+def lazy_getattr(package: str, imports: Mapping[str, str]) -> Callable[[str], Any]:
+    """
+    Build a module ``__getattr__`` (PEP 562) that imports names on first access.
+
+    Each name is imported from its module once and then stored in the
+    package namespace, so later lookups no longer go through ``__getattr__``.
+
+    Args:
+        package: Name of the package the ``__getattr__`` belongs to
+        imports: Mapping of public name to the module defining it
+
+    Returns:
+        Function to assign to the package's ``__getattr__``
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
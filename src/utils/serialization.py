@@ -0,0 +1,61 @@
+"""JSON serialization helpers for EKS Upgrade Planner."""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(
+    value: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Serialize a value to UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the standard library
+    json module otherwise. Both produce unescaped UTF-8 and accept non-string
+    dict keys.
+
+    Args:
+        value: JSON-serializable value
+        indent: Pretty-print with a two-space indent
+        default: Called for values that are not natively serializable,
+            including datetimes and dataclasses, as with json.dumps
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        # Datetimes and dataclasses go through default, as with json.dumps,
+        # so both backends accept the same values
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=default, option=option)
+
+    return json.dumps(
+        value, indent=2 if indent else None, default=default, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Args:
+        data: Encoded JSON document
+
+    Returns:
+        Decoded value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
@@ -0,0 +1,46 @@
+"""Version parsing utility for EKS Upgrade Planner."""
+
+import functools
+import re
+from typing import Optional, Tuple
+
+# A "<major>.<minor>" version such as "1.29"; ASCII digits only
+_MINOR_VERSION_RE = re.compile(r"(\d+)\.(\d+)", re.ASCII)
+
+
+@functools.lru_cache(maxsize=128)
+def parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Parse a dotted version string into a tuple of integers.
+
+    Tuples compare component by component, so "1.10" sorts after "1.9"
+    (unlike float comparison).
+
+    Args:
+        version: Version string such as "1.29"
+
+    Returns:
+        Tuple of integer version components
+
+    Raises:
+        ValueError: If any component is not an integer
+    """
+    return tuple(int(part) for part in version.split("."))
+
+
+@functools.lru_cache(maxsize=256)
+def parse_minor_version(version: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a "<major>.<minor>" version string, as EKS versions are written.
+
+    Args:
+        version: Version string such as "1.29"
+
+    Returns:
+        Tuple of (major, minor), or None if the string is not of that form
+    """
+    match = _MINOR_VERSION_RE.fullmatch(version) if version else None
+    if match is None:
+        return None
+
+    return int(match.group(1)), int(match.group(2))
@@ -0,0 +1,17 @@
+"""Shared pytest fixtures."""
+
+import os
+import tempfile
+from unittest import mock
+
+import pytest
+
+from src.analyzer import compatibility
+
+
+@pytest.fixture(autouse=True, scope="session")
+def parsed_cache_dir():
+    """Keep pickled data files out of the user's cache directory."""
+    with tempfile.TemporaryDirectory() as tmp:
+        with mock.patch.dict(os.environ, {compatibility._PARSED_CACHE_DIR_ENV: tmp}):
+            yield tmp
@@ -1,8 +1,15 @@
 """Tests for analyzer modules."""
 
+import os
+import tempfile
 import unittest
+from pathlib import Path
+from unittest import mock
+from src.analyzer import compatibility
 from src.analyzer.compatibility import CompatibilityAnalyzer
 from src.analyzer.deprecation import DeprecationAnalyzer
+from src.analyzer.release_notes import ReleaseNotesAnalyzer
+from src.utils.cache import Cache
 
 
 class TestCompatibilityAnalyzer(unittest.TestCase):
@@ -41,6 +48,76 @@ class TestCompatibilityAnalyzer(unittest.TestCase):
 
         self.assertIsNotNone(recommended)
 
+    def test_addon_compatibility_requires_exact_version(self):
+        """Test version prefixes do not count as compatible."""
+        is_compatible, _ = self.analyzer.check_addon_compatibility(
+            "coredns", "v1.10.1-eksbuild.1", "1.29"
+        )
+        self.assertTrue(is_compatible)
+
+        is_compatible, _ = self.analyzer.check_addon_compatibility(
+            "coredns", "v1.10", "1.29"
+        )
+        self.assertFalse(is_compatible)
+
+    def test_addon_index_shared_for_bundled_data(self):
+        """Test analyzers on the bundled data share one addon index."""
+        other = CompatibilityAnalyzer()
+        self.assertIs(other._addon_index, self.analyzer._addon_index)
+
+        custom = CompatibilityAnalyzer(
+            addon_data={"addons": {"coredns": {"versions": {"1.29": {}}}}}
+        )
+        self.assertIsNot(custom._addon_index, self.analyzer._addon_index)
+
+    def test_validate_upgrade_path_unsupported_target(self):
+        """Test an unsupported target reports only the version issue."""
+        result = self.analyzer.validate_upgrade_path(
+            "1.29", "1.99", [{"name": "coredns", "version": "v1.10.1-eksbuild.1"}]
+        )
+
+        self.assertFalse(result["can_upgrade"])
+        self.assertEqual(result["addon_recommendations"], [])
+        self.assertEqual(
+            [issue["type"] for issue in result["blocking_issues"]],
+            ["version_incompatibility"],
+        )
+
+    def test_validate_upgrade_path_cache_is_bounded(self):
+        """Test memoized validations are bounded and isolated from callers."""
+        addons = [{"name": "coredns", "version": "v1.10.1-eksbuild.1"}]
+        result = self.analyzer.validate_upgrade_path("1.28", "1.29", addons)
+        result["addon_recommendations"].clear()
+
+        again = self.analyzer.validate_upgrade_path("1.28", "1.29", addons)
+        self.assertEqual(len(again["addon_recommendations"]), 1)
+
+        for index in range(compatibility._VALIDATION_CACHE_SIZE + 10):
+            self.analyzer.validate_upgrade_path(
+                "1.28", "1.29", [{"name": f"addon-{index}", "version": "v1"}]
+            )
+        self.assertEqual(
+            len(self.analyzer._validation_cache), compatibility._VALIDATION_CACHE_SIZE
+        )
+
+    def test_addon_recommendations_batch(self):
+        """Test fleet-wide addon recommendations match per-cluster results."""
+        fleet = [
+            [{"name": "coredns", "version": "v1.10.1-eksbuild.1"}],
+            [
+                {"name": "coredns", "version": "v1.10.1-eksbuild.1"},
+                {"name": "unknown-addon", "version": "v0.1.0"},
+            ],
+        ]
+
+        batch = self.analyzer.get_addon_recommendations_batch(fleet, "1.29")
+
+        self.assertEqual(
+            batch,
+            [self.analyzer.get_addon_recommendations(a, "1.29") for a in fleet],
+        )
+        self.assertIsNot(batch[0][0], batch[1][0])
+
     def test_get_supported_versions(self):
         """Test getting supported versions."""
         versions = self.analyzer.get_supported_versions()
@@ -49,6 +126,39 @@ class TestCompatibilityAnalyzer(unittest.TestCase):
         self.assertGreater(len(versions), 0)
         self.assertIn("1.29", versions)
 
+    def test_get_supported_versions_orders_numerically(self):
+        """Test that minor versions sort numerically, not as floats."""
+        analyzer = CompatibilityAnalyzer(
+            compatibility_matrix={
+                "eks_versions": {"1.10": {}, "1.9": {}, "1.11": {}},
+            }
+        )
+
+        self.assertEqual(analyzer.get_supported_versions(), ["1.9", "1.10", "1.11"])
+
+    def test_load_yaml_file_uses_parsed_cache(self):
+        """Test parsed YAML is pickled and reused until the file changes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            data_file = Path(tmp) / "matrix.yaml"
+            data_file.write_text("eks_versions:\n  '1.29': {}\n")
+            load = compatibility._load_yaml_file.__wrapped__
+
+            with mock.patch.dict(
+                os.environ,
+                {compatibility._PARSED_CACHE_DIR_ENV: str(Path(tmp) / "cache")},
+            ):
+                first = load(str(data_file))
+                cache_files = list((Path(tmp) / "cache").glob("matrix-*.pkl"))
+                self.assertEqual(len(cache_files), 1)
+
+                with mock.patch.object(
+                    compatibility, "_yaml_loader", side_effect=AssertionError
+                ):
+                    self.assertEqual(load(str(data_file)), first)
+
+                data_file.write_text("eks_versions:\n  '1.30': {}\n  '1.31': {}\n")
+                self.assertIn("1.30", load(str(data_file))["eks_versions"])
+
 
 class TestDeprecationAnalyzer(unittest.TestCase):
     """Test deprecation analyzer."""
@@ -70,6 +180,9 @@ class TestDeprecationAnalyzer(unittest.TestCase):
         self.assertTrue(self.analyzer.is_api_removed("apps/v1beta1", "1.29"))
         self.assertFalse(self.analyzer.is_api_removed("apps/v1beta1", "1.15"))
 
+        # Minor versions compare numerically ("1.100" is not "1.1")
+        self.assertTrue(self.analyzer.is_api_removed("batch/v1beta1", "1.100"))
+
     def test_get_deprecation_info(self):
         """Test getting deprecation information."""
         info = self.analyzer.get_deprecation_info("apps/v1beta1")
@@ -93,6 +206,80 @@ class TestDeprecationAnalyzer(unittest.TestCase):
         self.assertTrue(result["is_removed"])
         self.assertEqual(result["severity"], "CRITICAL")
 
+    def test_get_all_deprecations_for_version(self):
+        """Test entries are plain copies with resources as a list."""
+        entries = self.analyzer.get_all_deprecations_for_version("1.25")
+
+        self.assertIn("policy/v1beta1", [entry["api_version"] for entry in entries])
+        for entry in entries:
+            self.assertIsInstance(entry["resources"], list)
+
+        entries[0]["resources"].append("Custom")
+        self.assertNotIn(
+            "Custom",
+            self.analyzer.get_all_deprecations_for_version("1.25")[0]["resources"],
+        )
+
+    def test_analyze_resources_results_do_not_share_info(self):
+        """Test each result gets its own copy of the deprecation info."""
+        resources = [
+            {"name": name, "kind": "Deployment", "api_version": "apps/v1beta1"}
+            for name in ("web", "api")
+        ]
+        first, second = self.analyzer.analyze_resources(resources, "1.29")[
+            "all_results"
+        ]
+
+        first["deprecation_info"]["resources"].append("Custom")
+        first["deprecation_info"]["replacement"] = "changed"
+
+        self.assertEqual(second["deprecation_info"]["replacement"], "apps/v1")
+        self.assertNotIn("Custom", second["deprecation_info"]["resources"])
+        again = self.analyzer.analyze_resources(resources[:1], "1.29")
+        self.assertEqual(
+            again["all_results"][0]["deprecation_info"]["replacement"], "apps/v1"
+        )
+
+
+class TestReleaseNotesAnalyzer(unittest.TestCase):
+    """Test release notes analyzer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.analyzer = ReleaseNotesAnalyzer(Cache(cache_dir=Path(self.tmp.name)))
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.tmp.cleanup()
+
+    def test_fetch_url_revalidates_with_etag(self):
+        """Test a 304 response reuses the previously fetched body."""
+        ok = mock.Mock(status_code=200, text="body", headers={"ETag": '"v1"'})
+        not_modified = mock.Mock(status_code=304, text="", headers={})
+
+        with mock.patch.object(
+            self.analyzer._session, "get", side_effect=[ok, not_modified]
+        ) as get:
+            self.assertEqual(self.analyzer._fetch_url("https://example.com"), "body")
+            self.assertEqual(self.analyzer._fetch_url("https://example.com"), "body")
+
+        self.assertEqual(get.call_args.kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_breaking_changes_compare_versions_numerically(self):
+        """Test minor versions are not compared as floats (1.9 < 1.22)."""
+        changes = self.analyzer.get_breaking_changes("1.9", "1.22")
+
+        self.assertEqual([c["affects_version"] for c in changes], ["1.22"])
+
+    def test_breaking_changes_are_not_shared(self):
+        """Test modifying returned changes does not leak into later calls."""
+        changes = self.analyzer.get_breaking_changes("1.24", "1.25")
+        changes[0]["affects_version"] = "modified"
+
+        again = self.analyzer.get_breaking_changes("1.24", "1.25")
+        self.assertEqual(again[0]["affects_version"], "1.25")
+
 
 if __name__ == "__main__":
     unittest.main()
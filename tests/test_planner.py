@@ -1,8 +1,11 @@
 """Tests for planner modules."""
 
+import io
+import json
 import unittest
 from src.planner.upgrade_path import UpgradePathPlanner
 from src.planner.risk_assessment import RiskAssessment
+from src.planner.migration_plan import MigrationPlanner
 from src.analyzer.compatibility import CompatibilityAnalyzer
 
 
@@ -106,6 +109,211 @@ class TestRiskAssessment(unittest.TestCase):
         risk = self.risk_assessment.assess_cluster_size_risk(small_cluster)
         self.assertEqual(risk["total_nodes"], 10)
 
+    def test_perform_comprehensive_assessment_batch(self):
+        """Test batch assessments match one-by-one assessments, in order."""
+        clusters = [
+            {
+                "cluster_info": {},
+                "upgrade_path": path,
+                "deprecated_apis": {},
+                "breaking_changes": [],
+                "addon_recommendations": [],
+                "node_groups": [{"scaling_config": {"desiredSize": nodes}}],
+            }
+            for path, nodes in ((["1.28", "1.29"], 3), (["1.26", "1.29"], 80))
+        ]
+
+        results = self.risk_assessment.perform_comprehensive_assessment_batch(
+            clusters, max_workers=2
+        )
+
+        self.assertEqual(
+            results,
+            [
+                self.risk_assessment.perform_comprehensive_assessment(**cluster)
+                for cluster in clusters
+            ],
+        )
+
+
+class TestMigrationPlanner(unittest.TestCase):
+    """Test migration planner."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.planner = MigrationPlanner()
+        self.deprecated_apis = {
+            "policy/v1beta1": [
+                {
+                    "name": "web-pdb",
+                    "kind": "PodDisruptionBudget",
+                    "namespace": "default",
+                    "deprecation_info": {
+                        "removed_in": "1.25",
+                        "replacement": "policy/v1",
+                    },
+                },
+            ],
+            "flowcontrol.apiserver.k8s.io/v1beta2": [
+                {
+                    "name": "workload-high",
+                    "kind": "FlowSchema",
+                    "namespace": None,
+                    "deprecation_info": {"removed_in": "1.29"},
+                },
+                {"name": "unknown", "kind": "FlowSchema", "deprecation_info": {}},
+            ],
+            "apps/v1beta2": [
+                {
+                    "name": "db",
+                    "kind": "StatefulSet",
+                    "namespace": "data",
+                    "deprecation_info": {
+                        "removed_in": "1.16",
+                        "replacement": "apps/v1",
+                    },
+                },
+            ],
+        }
+
+    def test_detect_migration_requirements(self):
+        """Test only resources removed by the target version need migration."""
+        result = self.planner.detect_migration_requirements(
+            self.deprecated_apis, "1.26"
+        )
+
+        self.assertTrue(result["migrations_required"])
+        self.assertEqual(result["total_resources_affected"], 4)
+        self.assertEqual(
+            [m["resource_name"] for m in result["migrations"]], ["web-pdb", "db"]
+        )
+        self.assertEqual(result["migrations"][0]["replacement_api"], "policy/v1")
+
+        result = self.planner.detect_migration_requirements(
+            self.deprecated_apis, "1.29"
+        )
+        self.assertEqual(result["critical_migrations"], 3)
+
+    def test_detect_migration_requirements_sees_updated_apis(self):
+        """Test changes to the same deprecated APIs mapping are picked up."""
+        self.planner.detect_migration_requirements(self.deprecated_apis, "1.26")
+        self.deprecated_apis["policy/v1beta1"].append(
+            {
+                "name": "api-pdb",
+                "kind": "PodDisruptionBudget",
+                "namespace": "default",
+                "deprecation_info": {"removed_in": "1.25"},
+            }
+        )
+
+        result = self.planner.detect_migration_requirements(
+            self.deprecated_apis, "1.26"
+        )
+        self.assertEqual(result["total_resources_affected"], 5)
+        self.assertEqual(
+            [m["resource_name"] for m in result["migrations"]],
+            ["web-pdb", "api-pdb", "db"],
+        )
+
+    def test_detect_migration_requirements_compares_minor_versions(self):
+        """Test versions compare as integers, so 1.100 is after 1.99."""
+        deprecated_apis = {
+            "example.io/v1beta1": [
+                {
+                    "name": "future",
+                    "kind": "Widget",
+                    "deprecation_info": {"removed_in": "1.100"},
+                },
+                {
+                    "name": "unparseable",
+                    "kind": "Widget",
+                    "deprecation_info": {"removed_in": "next"},
+                },
+            ],
+        }
+
+        result = self.planner.detect_migration_requirements(deprecated_apis, "1.99")
+        self.assertFalse(result["migrations_required"])
+
+        result = self.planner.detect_migration_requirements(deprecated_apis, "1.100")
+        self.assertEqual([m["resource_name"] for m in result["migrations"]], ["future"])
+
+        result = self.planner.detect_migration_requirements(deprecated_apis, "next")
+        self.assertFalse(result["migrations_required"])
+
+    def test_detect_migrations_along_path(self):
+        """Test each resource is listed under the version that removes it."""
+        migrations = self.planner.detect_migrations_along_path(
+            self.deprecated_apis, ["1.26", "1.27", "1.28", "1.29"]
+        )
+
+        self.assertEqual(
+            {
+                version: [m["resource_name"] for m in entries]
+                for version, entries in migrations.items()
+            },
+            {"1.27": ["web-pdb", "db"], "1.28": [], "1.29": ["workload-high"]},
+        )
+
+    def test_generate_migration_plan_flags_recreation(self):
+        """Test the plan flags the same resources as the standalone check."""
+        plan = self.planner.generate_migration_plan(
+            self.deprecated_apis, [], "1.29", {}
+        )
+
+        self.assertEqual(
+            plan["resources_needing_recreation"],
+            self.planner.flag_resources_needing_recreation(plan["migrations"]),
+        )
+        self.assertEqual(
+            [r["resource_name"] for r in plan["resources_needing_recreation"]],
+            ["db"],
+        )
+
+    def test_generate_migration_plan_stream(self):
+        """Test the streamed plan has the same content as the built one."""
+        breaking_changes = [{"impact": "HIGH", "title": "Removed flag"}]
+        plan = self.planner.generate_migration_plan(
+            self.deprecated_apis, breaking_changes, "1.29", {}
+        )
+
+        fp = io.BytesIO()
+        self.planner.generate_migration_plan_stream(
+            self.deprecated_apis, breaking_changes, "1.29", {}, fp
+        )
+
+        self.assertEqual(
+            json.loads(fp.getvalue()), json.loads(MigrationPlanner.to_json(plan))
+        )
+
+    def test_testing_recommendations_are_independent(self):
+        """Test each call returns its own recommendation entries."""
+        first = self.planner.create_testing_recommendations([], {})
+        first[0]["tests"].append("Custom test")
+        first[0]["importance"] = "LOW"
+
+        second = self.planner.create_testing_recommendations([], {})
+        self.assertNotIn("Custom test", second[0]["tests"])
+        self.assertEqual(second[0]["importance"], "CRITICAL")
+        for recommendation in second:
+            self.assertIsInstance(recommendation["tests"], list)
+
+    def test_generate_all_manifest_examples(self):
+        """Test every migration gets its before and after manifests."""
+        migrations = self.planner.detect_migration_requirements(
+            self.deprecated_apis, "1.29"
+        )["migrations"]
+
+        documents = self.planner.generate_all_manifest_examples(migrations).split(
+            "\n---\n"
+        )
+
+        self.assertEqual(len(documents), 2 * len(migrations))
+        for index, migration in enumerate(migrations):
+            examples = self.planner.generate_manifest_examples(migration)
+            self.assertEqual(documents[2 * index], examples["before"])
+            self.assertEqual(documents[2 * index + 1], examples["after"])
+
 
 if __name__ == "__main__":
     unittest.main()
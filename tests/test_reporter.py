@@ -0,0 +1,43 @@
+"""Tests for reporter modules."""
+
+import json
+import unittest
+from src.reporter.json_export import JSONExporter
+
+
+class TestJSONExporter(unittest.TestCase):
+    """Test JSON exporter."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.exporter = JSONExporter()
+        self.report_args = (
+            {"cluster": {"name": "demo", "version": "1.29", "status": None}},
+            {},
+            {"breaking_changes": []},
+            {"upgrade_path": ["1.29", "1.30"]},
+            {"overall_risk": "LOW", "rollback_required": False},
+            {"migration_required": False, "migrations": []},
+        )
+
+    def test_export_report_omit_empty(self):
+        """Test omit_empty drops empty values but keeps False."""
+        report = json.loads(
+            self.exporter.export_report(
+                *self.report_args, generated_at="2024-01-01T00:00:00", omit_empty=True
+            )
+        )
+
+        self.assertNotIn("scan_results", report)
+        self.assertNotIn("status", report["cluster"])
+        self.assertEqual(report["cluster"]["target_version"], "1.30")
+        self.assertEqual(report["metadata"]["generated_at"], "2024-01-01T00:00:00")
+        self.assertEqual(report["migration_plan"], {"migration_required": False})
+        self.assertFalse(report["risk_assessment"]["rollback_required"])
+
+        full = json.loads(self.exporter.export_report(*self.report_args))
+        self.assertEqual(full["scan_results"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()
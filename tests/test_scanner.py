@@ -1,8 +1,14 @@
 """Tests for scanner modules."""
 
+import socket
+import tempfile
+import threading
+import time
 import unittest
+from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
 from src.utils.aws_helper import AWSHelper
+from src.utils.cache import Cache
 from src.scanner.eks_scanner import EKSScanner
 
 
@@ -54,6 +60,101 @@ class TestEKSScanner(unittest.TestCase):
         self.assertEqual(cluster_info["version"], "1.29")
         self.assertEqual(cluster_info["status"], "ACTIVE")
 
+    def test_scan_cluster_keeps_order_and_skips_failures(self):
+        """Test concurrent scans keep input order and skip failed describes."""
+        self.eks_client.describe_cluster.return_value = {
+            "cluster": {"name": "test-cluster", "version": "1.29"}
+        }
+        pages = {
+            "list_nodegroups": [{"nodegroups": ["ng1", "ng2"]}],
+            "list_addons": [{"addons": ["coredns", "vpc-cni", "kube-proxy"]}],
+        }
+        self.eks_client.get_paginator.side_effect = lambda operation: Mock(
+            paginate=Mock(return_value=pages[operation])
+        )
+
+        def describe_addon(clusterName, addonName):
+            if addonName == "vpc-cni":
+                raise RuntimeError("throttled")
+            return {"addon": {"addonName": addonName}}
+
+        self.eks_client.describe_nodegroup.side_effect = (
+            lambda clusterName, nodegroupName: {
+                "nodegroup": {"nodegroupName": nodegroupName}
+            }
+        )
+        self.eks_client.describe_addon.side_effect = describe_addon
+
+        result = self.scanner.scan_cluster("test-cluster")
+
+        self.assertEqual([ng["name"] for ng in result["node_groups"]], ["ng1", "ng2"])
+        self.assertEqual(
+            [addon["name"] for addon in result["addons"]], ["coredns", "kube-proxy"]
+        )
+        self.assertEqual(result["summary"]["addon_count"], 2)
+
+    def test_scan_cluster_failure_cancels_queued_describes(self):
+        """Test a failed scan drops describe calls that have not started."""
+        names = [f"ng{index}" for index in range(20)]
+        release = threading.Event()
+        described = []
+
+        def describe_node_group(cluster_name, name):
+            described.append(name)
+            release.wait(5)
+            return {"name": name}
+
+        with patch.object(
+            self.scanner, "describe_cluster", side_effect=RuntimeError("not found")
+        ), patch.object(
+            self.scanner, "list_node_groups", return_value=names
+        ), patch.object(
+            self.scanner, "list_addons", return_value=[]
+        ), patch.object(
+            self.scanner, "describe_node_group", side_effect=describe_node_group
+        ):
+            with self.assertRaises(RuntimeError):
+                self.scanner.scan_cluster("test-cluster")
+            release.set()
+            time.sleep(0.1)
+
+        self.assertLess(len(described), len(names))
+
+
+class TestAWSHelper(unittest.TestCase):
+    """Test AWS helper client configuration."""
+
+    def test_client_uses_default_config(self):
+        """Test clients get the default timeouts and socket options."""
+        client = AWSHelper(region="us-east-1").get_client("eks")
+
+        self.assertEqual(client.meta.config.connect_timeout, 3)
+        self.assertEqual(client.meta.config.read_timeout, 10)
+        self.assertIn(
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            client._endpoint.http_session._socket_options,
+        )
+
+    def test_validate_credentials_caches_identity(self):
+        """Test a validated identity is reused without calling STS again."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = Cache(cache_dir=Path(tmp))
+            sts = MagicMock()
+            sts.get_caller_identity.return_value = {"Account": "123456789012"}
+
+            with patch(
+                "src.utils.aws_helper._get_credentials_cache", return_value=cache
+            ), patch.object(AWSHelper, "get_client", return_value=sts):
+                for _ in range(2):
+                    helper = AWSHelper(region="us-east-1")
+                    helper._session = MagicMock()
+                    helper._session.get_credentials.return_value.access_key = "AKIA"
+
+                    self.assertTrue(helper.validate_credentials())
+                    self.assertEqual(helper.get_account_id(), "123456789012")
+
+            sts.get_caller_identity.assert_called_once()
+
 
 class TestK8sScanner(unittest.TestCase):
     """Test Kubernetes scanner functionality."""
@@ -74,6 +175,18 @@ class TestK8sScanner(unittest.TestCase):
         self.assertIn("removed_in", dep_info)
         self.assertIn("replacement", dep_info)
 
+    def test_scan_deployments_handles_api_errors(self):
+        """Test kubernetes API errors are logged and yield no resources."""
+        from src.scanner.k8s_scanner import K8sScanner
+        from src.utils.k8s_helper import get_api_exception
+
+        helper = MagicMock()
+        helper.apps_v1.list_deployment_for_all_namespaces.side_effect = (
+            get_api_exception()("Forbidden")
+        )
+
+        self.assertEqual(K8sScanner(helper).scan_deployments(), [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,198 @@
+"""Tests for utility modules."""
+
+import gc
+import sys
+import tempfile
+import threading
+import types
+import unittest
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+from src.utils import cache as cache_module
+from src.utils import serialization
+from src.utils.cache import Cache
+from src.utils.duration import minutes_to_hours, minutes_to_whole_hours
+from src.utils.lazy import lazy_getattr
+from src.utils.version import parse_minor_version
+
+
+class TestCache(unittest.TestCase):
+    """Test file-based cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.cache_dir = Path(self.tmp.name)
+        self.cache = Cache(cache_dir=self.cache_dir)
+
+    def test_writes_are_deferred_until_flush(self):
+        """Test set() keeps entries in memory until flush()."""
+        self.cache.set("scan", {"nodes": 3})
+        self.cache.set_json("notes", ["a", "b"])
+
+        self.assertEqual(list(self.cache_dir.glob("*.cache")), [])
+        self.assertEqual(self.cache.get("scan"), {"nodes": 3})
+
+        self.assertTrue(self.cache.flush())
+
+        fresh = Cache(cache_dir=self.cache_dir)
+        self.assertEqual(fresh.get("scan"), {"nodes": 3})
+        self.assertEqual(fresh.get_json("notes"), ["a", "b"])
+
+    def test_cached_values_are_copies(self):
+        """Test mutating a returned value does not change the cache."""
+        value = {"addons": ["coredns"]}
+        self.cache.set("scan", value)
+        value["addons"].append("vpc-cni")
+
+        cached = self.cache.get("scan")
+        cached["addons"].append("kube-proxy")
+
+        self.assertEqual(self.cache.get("scan"), {"addons": ["coredns"]})
+
+    def test_delete_drops_pending_entry(self):
+        """Test delete() removes entries that were not yet flushed."""
+        self.cache.set("scan", {"nodes": 3})
+        self.cache.delete("scan")
+        self.cache.flush()
+
+        self.assertIsNone(Cache(cache_dir=self.cache_dir).get("scan"))
+
+    def test_ttl_counts_from_set_not_flush(self):
+        """Test entries flushed late still expire relative to when they were set."""
+        set_at = datetime.now() - timedelta(hours=2)
+        with patch("src.utils.cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = set_at
+            self.cache.set("scan", {"nodes": 3})
+        self.cache.flush()
+
+        self.assertIsNone(Cache(cache_dir=self.cache_dir, ttl_hours=1).get("scan"))
+        self.assertEqual(
+            Cache(cache_dir=self.cache_dir, ttl_hours=3).get("scan"), {"nodes": 3}
+        )
+
+    def test_expired_entries_are_dropped_from_memory(self):
+        """Test an expired in-memory entry is evicted when looked up."""
+        with patch("src.utils.cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime.now() - timedelta(hours=25)
+            self.cache.set("scan", {"nodes": 3})
+
+        self.assertIsNone(self.cache.get("scan"))
+        self.assertNotIn("scan", self.cache._memory)
+
+    def test_disk_read_keeps_newer_value_in_memory(self):
+        """Test a value set while reading from disk is not overwritten."""
+        self.cache.set("scan", {"nodes": 3})
+        self.cache.flush()
+
+        fresh = Cache(cache_dir=self.cache_dir)
+        fresh.set("scan", {"nodes": 5})
+
+        self.assertEqual(fresh._load("scan", as_json=False), {"nodes": 5})
+        self.assertEqual(fresh.get("scan"), {"nodes": 5})
+
+    def test_unserializable_values_are_rejected(self):
+        """Test set() and set_json() fail for values that cannot be written."""
+        self.assertFalse(self.cache.set("lock", threading.Lock()))
+        self.assertFalse(self.cache.set_json("when", object()))
+
+        self.assertIsNone(self.cache.get("lock"))
+        self.assertIsNone(self.cache.get_json("when"))
+        self.assertTrue(self.cache.flush())
+
+    def test_released_caches_are_not_kept_for_exit_flush(self):
+        """Test caches are tracked weakly for the exit-time flush."""
+        cache = Cache(cache_dir=self.cache_dir)
+        self.assertIn(cache, cache_module._instances)
+
+        ref = weakref.ref(cache)
+        del cache
+        gc.collect()
+
+        self.assertIsNone(ref())
+
+
+class TestDuration(unittest.TestCase):
+    """Test duration formatting."""
+
+    def test_minutes_to_hours_matches_float_rounding(self):
+        """Test results match round(minutes / 60, 1) for 5 minute steps."""
+        for minutes in range(0, 6000, 5):
+            self.assertEqual(minutes_to_hours(minutes), round(minutes / 60, 1))
+
+    def test_minutes_to_whole_hours_matches_float_rounding(self):
+        """Test results match round(minutes / 60) for whole minutes."""
+        for minutes in range(0, 6000):
+            self.assertEqual(minutes_to_whole_hours(minutes), round(minutes / 60))
+
+
+@dataclass
+class _Point:
+    x: int
+
+
+class TestSerialization(unittest.TestCase):
+    """Test JSON serialization helpers."""
+
+    def _backends(self):
+        """Yield once per available backend, with it selected."""
+        backends = [serialization.orjson, None]
+        for backend in dict.fromkeys(backends):
+            with self.subTest(backend=backend), patch.object(
+                serialization, "orjson", backend
+            ):
+                yield
+
+    def test_datetimes_and_dataclasses_use_default(self):
+        """Test both backends route the same types through default."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+
+        for _ in self._backends():
+            for value in ({"at": when}, {"point": _Point(1)}):
+                with self.assertRaises(TypeError):
+                    serialization.dumps(value)
+
+            self.assertEqual(
+                serialization.loads(
+                    serialization.dumps({"at": when, "point": _Point(1)}, default=str)
+                ),
+                {"at": str(when), "point": "_Point(x=1)"},
+            )
+
+
+class TestLazyGetattr(unittest.TestCase):
+    """Test lazy package attributes."""
+
+    def test_imports_on_first_access_and_caches(self):
+        """Test names are imported once, stored, and unknown names raise."""
+        package = types.ModuleType("lazy_test_package")
+        package.__getattr__ = lazy_getattr(
+            package.__name__, {"minutes_to_hours": "src.utils.duration"}
+        )
+
+        with patch.dict(sys.modules, {package.__name__: package}):
+            self.assertIs(package.minutes_to_hours, minutes_to_hours)
+            self.assertIs(vars(package)["minutes_to_hours"], minutes_to_hours)
+
+            with self.assertRaises(AttributeError):
+                package.missing
+
+
+class TestVersion(unittest.TestCase):
+    """Test version parsing."""
+
+    def test_parse_minor_version(self):
+        """Test only ASCII "<major>.<minor>" strings are accepted."""
+        self.assertEqual(parse_minor_version("1.29"), (1, 29))
+        self.assertEqual(parse_minor_version("1.100"), (1, 100))
+
+        for version in ("", "1", "1.29.0", "v1.29", "1.29 ", "\u0661.\u0662\u0669"):
+            self.assertIsNone(parse_minor_version(version))
+
+
+if __name__ == "__main__":
+    unittest.main()